@@ -0,0 +1,51 @@
+"""Store integration ingest status as text guarded by a CHECK constraint.
+
+Revision ID: 20250410_000011
+Revises: 20250402_000010
+Create Date: 2025-04-10 00:00:11
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20250410_000011"
+down_revision: Union[str, None] = "20250402_000010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STATUS_VALUES = ("pending", "ingested", "skipped", "failed")
+
+
+def upgrade() -> None:
+    """Swap the integration_ingest_status enum type for VARCHAR(16) + CHECK."""
+    op.alter_column(
+        "integration_ingest_events",
+        "status",
+        type_=sa.String(length=16),
+        existing_nullable=False,
+        postgresql_using="status::text",
+    )
+    op.execute("DROP TYPE IF EXISTS integration_ingest_status")
+    op.create_check_constraint(
+        "ck_integration_ingest_status",
+        "integration_ingest_events",
+        "status IN ({})".format(", ".join(f"'{value}'" for value in STATUS_VALUES)),
+    )
+
+
+def downgrade() -> None:
+    """Restore the integration_ingest_status enum type."""
+    op.drop_constraint("ck_integration_ingest_status", "integration_ingest_events", type_="check")
+    status_enum = sa.Enum(*STATUS_VALUES, name="integration_ingest_status")
+    status_enum.create(op.get_bind(), checkfirst=True)
+    op.alter_column(
+        "integration_ingest_events",
+        "status",
+        type_=status_enum,
+        existing_nullable=False,
+        postgresql_using="status::integration_ingest_status",
+    )
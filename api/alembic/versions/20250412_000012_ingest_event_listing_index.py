@@ -0,0 +1,32 @@
+"""Add a composite index for listing integration ingest events.
+
+Revision ID: 20250412_000012
+Revises: 20250410_000011
+Create Date: 2025-04-12 00:00:12
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20250412_000012"
+down_revision: Union[str, None] = "20250410_000011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index (user_id, provider, created_at) so the queue listing is an ordered range scan."""
+    op.create_index(
+        "ix_integration_ingest_events_user_provider_created",
+        "integration_ingest_events",
+        ["user_id", "provider", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop the ingest event listing index."""
+    op.drop_index("ix_integration_ingest_events_user_provider_created", table_name="integration_ingest_events")
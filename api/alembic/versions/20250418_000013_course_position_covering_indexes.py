@@ -0,0 +1,45 @@
+"""Replace course position unique constraints with covering unique indexes.
+
+Revision ID: 20250418_000013
+Revises: 20250412_000012
+Create Date: 2025-04-18 00:00:13
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20250418_000013"
+down_revision: Union[str, None] = "20250412_000012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Swap the (parent, position) uniques for unique indexes that INCLUDE the columns read with them."""
+    op.drop_constraint("uq_course_position", "courses", type_="unique")
+    op.create_index(
+        "uq_course_position",
+        "courses",
+        ["menu_id", "position"],
+        unique=True,
+        postgresql_include=["id", "title"],
+    )
+    op.drop_constraint("uq_course_items_position", "course_items", type_="unique")
+    op.create_index(
+        "uq_course_items_position",
+        "course_items",
+        ["course_id", "position"],
+        unique=True,
+        postgresql_include=["id", "media_item_id"],
+    )
+
+
+def downgrade() -> None:
+    """Restore the plain unique constraints."""
+    op.drop_index("uq_course_items_position", table_name="course_items")
+    op.create_unique_constraint("uq_course_items_position", "course_items", ["course_id", "position"])
+    op.drop_index("uq_course_position", table_name="courses")
+    op.create_unique_constraint("uq_course_position", "courses", ["menu_id", "position"])
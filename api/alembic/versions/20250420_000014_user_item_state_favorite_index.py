@@ -0,0 +1,34 @@
+"""Add a partial index for counting a user's favorite items.
+
+Revision ID: 20250420_000014
+Revises: 20250418_000013
+Create Date: 2025-04-20 00:00:14
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20250420_000014"
+down_revision: Union[str, None] = "20250418_000013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index user_id over favorite rows only, so the index stays a fraction of the table."""
+    op.create_index(
+        "ix_user_item_states_user_favorite",
+        "user_item_states",
+        ["user_id"],
+        unique=False,
+        postgresql_where=sa.text("favorite"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the favorites partial index."""
+    op.drop_index("ix_user_item_states_user_favorite", table_name="user_item_states")
@@ -0,0 +1,37 @@
+"""Index user item logs by (user_id, logged_at DESC, created_at DESC) for timelines.
+
+Revision ID: 20250422_000015
+Revises: 20250420_000014
+Create Date: 2025-04-22 00:00:15
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20250422_000015"
+down_revision: Union[str, None] = "20250420_000014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the standalone user_id and logged_at indexes with one composite timeline index."""
+    op.create_index(
+        "ix_user_item_logs_user_logged",
+        "user_item_logs",
+        ["user_id", sa.text("logged_at DESC"), sa.text("created_at DESC")],
+        unique=False,
+    )
+    op.drop_index(op.f("ix_user_item_logs_logged_at"), table_name="user_item_logs")
+    op.drop_index(op.f("ix_user_item_logs_user_id"), table_name="user_item_logs")
+
+
+def downgrade() -> None:
+    """Restore the single-column indexes."""
+    op.create_index(op.f("ix_user_item_logs_user_id"), "user_item_logs", ["user_id"], unique=False)
+    op.create_index(op.f("ix_user_item_logs_logged_at"), "user_item_logs", ["logged_at"], unique=False)
+    op.drop_index("ix_user_item_logs_user_logged", table_name="user_item_logs")
@@ -35,6 +35,8 @@ SEARCH_CONNECTOR_SOURCES = {
     SearchSource.IGDB,
     SearchSource.LASTFM,
 }
+# Any of these in `sources` turns the request into an (auth-gated) external search.
+EXTERNAL_TRIGGER_SOURCES = frozenset(SEARCH_CONNECTOR_SOURCES | {SearchSource.EXTERNAL})
 
 DEFAULT_PER_PAGE = 20
 MAX_PER_PAGE = 50
@@ -76,10 +78,8 @@ async def search(
     allowed_media_types: set[MediaType] | None = set(types) if types else None
 
     external_requested = include_external
-    if sources:
-        external_requested = external_requested or any(
-            source == SearchSource.EXTERNAL or source in SEARCH_CONNECTOR_SOURCES for source in sources
-        )
+    if sources and not external_requested:
+        external_requested = not EXTERNAL_TRIGGER_SOURCES.isdisjoint(sources)
     if external_requested and not current_user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -1,15 +1,27 @@
 """Application settings parsed from environment variables and defaults."""
 
 import json
-from functools import lru_cache
+import os
 from typing import Optional
 
 from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Containers receive config via the process environment; only local development reads `.env` from disk.
+ENV_FILE = ".env" if os.environ.get("ENVIRONMENT", "development") == "development" else None
 DEFAULT_CORS_ORIGINS = ["http://localhost:3000", "http://127.0.0.1:3000"]
 
 
+def _parse_json_list(value: str) -> object | None:
+    """Parse a JSON array env value; CSV inputs skip json.loads (and its exception) entirely."""
+    if not value.startswith("["):
+        return None
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError:
+        return None
+
+
 class Settings(BaseSettings):
     """Application configuration loaded from environment variables."""
 
@@ -25,6 +37,9 @@ class Settings(BaseSettings):
     refresh_token_expires_minutes: int = 60 * 24 * 7
     jwt_secret_key: str
     jwt_algorithm: str = "HS256"
+    jwt_private_key_pem: Optional[str] = None
+    jwt_public_key_pem: Optional[str] = None
+    bcrypt_rounds: int = Field(default=12, ge=10, le=16)
 
     google_books_api_key: Optional[str] = None
     tmdb_api_key: Optional[str] = None
@@ -44,11 +59,14 @@ class Settings(BaseSettings):
     external_search_quota_max_requests: int = 10
     external_search_quota_window_seconds: int = 60
     external_search_preview_ttl_seconds: int = 300
+    external_search_source_timeout_seconds: float = 5.0
     external_search_preview_max_payload_bytes: int = 50_000
     external_search_preview_max_metadata_bytes: int = 20_000
     ingestion_payload_retention_days: int = 90
     ingestion_payload_max_bytes: int = 250_000
     ingestion_metadata_max_bytes: int = 50_000
+    connector_cache_ttl_seconds: int = 3600
+    connector_search_cache_ttl_seconds: int = 300
     availability_refresh_days: int = 7
     taste_profile_refresh_hours: int = 24
     draft_share_token_ttl_days: int = 7
@@ -59,6 +77,7 @@ class Settings(BaseSettings):
         default_factory=lambda: ["default", "ingestion", "integrations", "maintenance", "webhooks", "sync"]
     )
     health_allowlist: list[str] | str = Field(default_factory=list)
+    health_cache_ttl_seconds: float = 1.0
 
     @field_validator("cors_origins", mode="before")
     @classmethod
@@ -71,10 +90,7 @@ class Settings(BaseSettings):
             stripped = value.strip()
             if not stripped:
                 return DEFAULT_CORS_ORIGINS.copy()
-            try:
-                parsed = json.loads(stripped)
-            except json.JSONDecodeError:
-                parsed = None
+            parsed = _parse_json_list(stripped)
             if isinstance(parsed, list):
                 cleaned = [str(origin).strip() for origin in parsed if str(origin).strip()]
                 if cleaned:
@@ -92,6 +108,14 @@ class Settings(BaseSettings):
             raise ValueError(msg)
         return self
 
+    @model_validator(mode="after")
+    def _validate_jwt_keys(self) -> "Settings":
+        """Require an Ed25519 key pair (or at least a verification key) when EdDSA is selected."""
+        if self.jwt_algorithm == "EdDSA" and not (self.jwt_private_key_pem or self.jwt_public_key_pem):
+            msg = "JWT_PRIVATE_KEY_PEM and/or JWT_PUBLIC_KEY_PEM must be set when JWT_ALGORITHM=EdDSA"
+            raise ValueError(msg)
+        return self
+
     @field_validator("worker_queue_names", mode="before")
     @classmethod
     def _split_worker_queue_names(cls, value: str | list[str] | None) -> list[str]:
@@ -104,10 +128,7 @@ class Settings(BaseSettings):
             stripped = value.strip()
             if not stripped:
                 return ["default"]
-            try:
-                parsed = json.loads(stripped)
-            except json.JSONDecodeError:
-                parsed = None
+            parsed = _parse_json_list(stripped)
             if isinstance(parsed, list):
                 cleaned = [str(item).strip() for item in parsed if str(item).strip()]
                 if cleaned:
@@ -128,10 +149,7 @@ class Settings(BaseSettings):
             stripped = value.strip()
             if not stripped:
                 return ["playlist-modify-private", "playlist-modify-public", "user-read-email"]
-            try:
-                parsed = json.loads(stripped)
-            except json.JSONDecodeError:
-                parsed = None
+            parsed = _parse_json_list(stripped)
             if isinstance(parsed, list):
                 cleaned = [str(scope).strip() for scope in parsed if str(scope).strip()]
                 return cleaned
@@ -149,10 +167,7 @@ class Settings(BaseSettings):
             stripped = value.strip()
             if not stripped:
                 return []
-            try:
-                parsed = json.loads(stripped)
-            except json.JSONDecodeError:
-                parsed = None
+            parsed = _parse_json_list(stripped)
             if isinstance(parsed, list):
                 cleaned = [str(item).strip() for item in parsed if str(item).strip()]
                 return cleaned
@@ -169,22 +184,19 @@ class Settings(BaseSettings):
             stripped = value.strip()
             if not stripped:
                 return []
-            try:
-                parsed = json.loads(stripped)
-            except json.JSONDecodeError:
-                parsed = None
+            parsed = _parse_json_list(stripped)
             if isinstance(parsed, list):
                 return [str(email).strip().lower() for email in parsed if str(email).strip()]
             return [email.strip().lower() for email in stripped.split(",") if email.strip()]
         return []
 
-    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
+    model_config = SettingsConfigDict(env_file=ENV_FILE, env_file_encoding="utf-8", extra="ignore")
 
 
-@lru_cache
-def get_settings() -> Settings:
-    """Return cached settings to avoid re-parsing environment variables."""
-    return Settings()
+# Parsed once per process; import `settings` directly on hot paths.
+settings = Settings()
 
 
-settings = get_settings()
+def get_settings() -> Settings:
+    """Return the process-wide settings (kept as a dependency/override hook)."""
+    return settings
@@ -1,32 +1,132 @@
-"""JWT and password hashing helpers for auth flows."""
+"""JWT and password hashing helpers for auth flows.
 
-from datetime import datetime, timedelta
+Implementation notes:
+- HMAC-signed tokens are encoded locally from an HMAC keyed once at import; each token only
+  copies the primed state instead of re-validating the key and re-initialising the MAC.
+- Decoding (and any non-HMAC algorithm) still goes through the JWT library so claim checks stay
+  in one well-tested place.
+- With JWT_ALGORITHM=EdDSA, PEM keys are parsed once at import; instances holding only the public
+  key can verify tokens but cannot mint them.
+"""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import time
+from datetime import timedelta
+from json.encoder import encode_basestring_ascii
 from typing import Any, Dict, Optional
 
-from jose import JWTError, jwt
+import jwt
+from cryptography.hazmat.primitives import serialization
+from jwt import InvalidTokenError
 from passlib.context import CryptContext
 
 from .config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+logger = logging.getLogger("app.core.security")
+
+pwd_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=settings.bcrypt_rounds, deprecated="auto")
+# Target latency window for one hash/verify; outside it BCRYPT_ROUNDS is likely mistuned for the host.
+PASSWORD_HASH_BUDGET_SECONDS = (0.05, 0.25)
+
+_NOW = time.time
+_HMAC_DIGESTS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+
+
+def _b64url(data: bytes) -> bytes:
+    """Base64url-encode without padding, per RFC 7515."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _json_segment(value: Dict[str, Any]) -> bytes:
+    return _b64url(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+
+
+def _build_hmac_template(secret: bytes, algorithm: str) -> Optional[hmac.HMAC]:
+    """Return a keyed HMAC ready to be copied per token, or None for non-HMAC algorithms."""
+    digest = _HMAC_DIGESTS.get(algorithm)
+    if digest is None:
+        return None
+    return hmac.new(secret, digestmod=digest)
+
+
+def _load_pem(value: str) -> bytes:
+    # Env files usually carry PEMs on one line with literal "\n" separators.
+    return value.replace("\\n", "\n").encode("utf-8")
+
+
+def _load_jwt_keys(
+    algorithm: str, secret: bytes, private_pem: Optional[str], public_pem: Optional[str]
+) -> tuple[Any, Any]:
+    """Return the (signing, verification) keys for the configured JWT algorithm."""
+    if algorithm != "EdDSA":
+        return secret, secret
+    private_key = serialization.load_pem_private_key(_load_pem(private_pem), password=None) if private_pem else None
+    if public_pem:
+        public_key = serialization.load_pem_public_key(_load_pem(public_pem))
+    else:
+        public_key = private_key.public_key()
+    return private_key, public_key
+
+
+# Settings are fixed for the process lifetime, so token hot paths read plain module globals.
+_JWT_ALGORITHM = settings.jwt_algorithm
+_JWT_SECRET = settings.jwt_secret_key.encode("utf-8")
+_ACCESS_TOKEN_TTL = timedelta(minutes=settings.access_token_expires_minutes)
+_JWT_SIGNING_KEY, _JWT_VERIFY_KEY = _load_jwt_keys(
+    _JWT_ALGORITHM, _JWT_SECRET, settings.jwt_private_key_pem, settings.jwt_public_key_pem
+)
+_HMAC_TEMPLATE = _build_hmac_template(_JWT_SECRET, _JWT_ALGORITHM)
+_HEADER_SEGMENT = _json_segment({"alg": _JWT_ALGORITHM, "typ": "JWT"})
+
+
+# Fixed claim shape for create_token; string fields are JSON-escaped before interpolation.
+_CLAIMS_TEMPLATE = '{"sub":%s,"type":%s,"iat":%d,"exp":%d}'
+
+
+def _encode_hmac(claims: bytes) -> str:
+    """Sign serialized JWT claims with the cached HMAC template."""
+    signing_input = _HEADER_SEGMENT + b"." + _b64url(claims)
+    mac = _HMAC_TEMPLATE.copy()
+    mac.update(signing_input)
+    return (signing_input + b"." + _b64url(mac.digest())).decode("ascii")
+
+
+def encode_jwt(payload: Dict[str, Any]) -> str:
+    """Sign an arbitrary JWT payload with the configured algorithm and key."""
+    if _JWT_SIGNING_KEY is None:
+        raise RuntimeError("JWT signing key is not configured on this instance")
+    return jwt.encode(payload, _JWT_SIGNING_KEY, algorithm=_JWT_ALGORITHM)
+
+
+def decode_jwt(token: str) -> Dict[str, Any]:
+    """Verify and decode a JWT, raising InvalidTokenError on failure."""
+    return jwt.decode(token, _JWT_VERIFY_KEY, algorithms=[_JWT_ALGORITHM])
 
 
 def create_token(subject: str, expires_delta: timedelta, token_type: str) -> str:
     """Create a signed JWT for the given subject and token type."""
-    now = datetime.utcnow()
-    payload: Dict[str, Any] = {
-        "sub": subject,
-        "type": token_type,
-        "iat": now,
-        "exp": now + expires_delta,
-    }
-    return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    # JWT NumericDate claims are integer epoch seconds; skip datetime round-trips entirely.
+    now = int(_NOW())
+    expires_at = now + int(expires_delta.total_seconds())
+    if _HMAC_TEMPLATE is not None:
+        claims = _CLAIMS_TEMPLATE % (
+            encode_basestring_ascii(subject),
+            encode_basestring_ascii(token_type),
+            now,
+            expires_at,
+        )
+        return _encode_hmac(claims.encode("ascii"))
+    return encode_jwt({"sub": subject, "type": token_type, "iat": now, "exp": expires_at})
 
 
 def create_access_token(subject: str) -> str:
     """Create an access token with the configured TTL."""
-    delta = timedelta(minutes=settings.access_token_expires_minutes)
-    return create_token(subject, delta, "access")
+    return create_token(subject, _ACCESS_TOKEN_TTL, "access")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -39,9 +139,36 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on a worker thread so bcrypt does not block the event loop."""
+    return await asyncio.to_thread(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password on a worker thread so bcrypt does not block the event loop."""
+    return await asyncio.to_thread(get_password_hash, password)
+
+
+def check_password_hash_cost() -> float:
+    """Time a single hash with the active context and warn when it misses the latency budget."""
+    started = time.perf_counter()
+    pwd_context.hash("tastebuds-cost-probe")
+    elapsed = time.perf_counter() - started
+    low, high = PASSWORD_HASH_BUDGET_SECONDS
+    if not low <= elapsed <= high:
+        logger.warning(
+            "Password hash took %.0fms with bcrypt_rounds=%s (target %.0f-%.0fms); consider tuning BCRYPT_ROUNDS",
+            elapsed * 1000,
+            settings.bcrypt_rounds,
+            low * 1000,
+            high * 1000,
+        )
+    return elapsed
+
+
 def decode_token(token: str) -> Optional[Dict[str, Any]]:
     """Decode a JWT and return its payload if valid."""
     try:
-        return jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
-    except JWTError:
+        return decode_jwt(token)
+    except InvalidTokenError:
         return None
@@ -0,0 +1,30 @@
+"""Primary key generators for ORM models.
+
+Implementation notes:
+- `uuid7` follows the RFC 9562 version 7 layout: a 48-bit Unix millisecond timestamp followed by
+  74 random bits. Keys created later sort later, so B-tree inserts land on the right-most index
+  pages instead of random ones (fewer page splits, better cache locality than uuid4).
+- Ordering is only guaranteed across milliseconds; ids minted within the same millisecond are random.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import uuid
+
+_RAND_B_MASK = (1 << 62) - 1
+
+
+def uuid7() -> uuid.UUID:
+    """Return a time-ordered UUID (version 7)."""
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | (rand >> 68) << 64
+        | 0b10 << 62
+        | rand & _RAND_B_MASK
+    )
+    return uuid.UUID(int=value)
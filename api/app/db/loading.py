@@ -0,0 +1,20 @@
+"""Loader option helpers for read-only ORM queries.
+
+Implementation notes:
+- `safe_load` appends `raiseload("*")` to the given eager-load options, so any relationship the
+  caller did not request raises `InvalidRequestError` on access instead of issuing a query per row.
+- The wildcard only covers the lead entity; entities reached through a listed loader keep their
+  mapped defaults unless that loader chain ends in its own `raiseload("*")`.
+- Use it on list/read paths only: unit-of-work cascades (e.g. `session.delete`) need to load
+  child collections, so mutation paths keep their plain loader options.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy.orm import raiseload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+
+def safe_load(*options: LoaderOption) -> list[LoaderOption]:
+    """Return `options` plus a wildcard raiseload for every relationship not listed."""
+    return [*options, raiseload("*")]
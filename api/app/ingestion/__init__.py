@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Callable, Dict
 
 from app.ingestion.base import BaseConnector
 from app.ingestion.google_books import GoogleBooksConnector
@@ -10,21 +10,27 @@ from app.ingestion.igdb import IGDBConnector
 from app.ingestion.lastfm import LastFMConnector
 from app.ingestion.tmdb import TMDBConnector
 
+_CONNECTOR_FACTORIES: Dict[str, Callable[[], BaseConnector]] = {
+    "google_books": GoogleBooksConnector,
+    "tmdb": TMDBConnector,
+    "igdb": IGDBConnector,
+    "lastfm": LastFMConnector,
+}
 _CONNECTORS: Dict[str, BaseConnector] = {}
 
 
 def get_connector(source: str) -> BaseConnector:
     """Return a connector instance for the given source name."""
     key = source.lower()
-    if key not in _CONNECTORS:
-        if key == "google_books":
-            _CONNECTORS[key] = GoogleBooksConnector()
-        elif key == "tmdb":
-            _CONNECTORS[key] = TMDBConnector()
-        elif key == "igdb":
-            _CONNECTORS[key] = IGDBConnector()
-        elif key == "lastfm":
-            _CONNECTORS[key] = LastFMConnector()
-        else:
+    connector = _CONNECTORS.get(key)
+    if connector is None:
+        factory = _CONNECTOR_FACTORIES.get(key)
+        if factory is None:
             raise ValueError(f"Unsupported source {source}")
-    return _CONNECTORS[key]
+        connector = _CONNECTORS[key] = factory()
+    return connector
+
+
+def registered_sources() -> tuple[str, ...]:
+    """Return the names of every registered connector source."""
+    return tuple(_CONNECTOR_FACTORIES)
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from datetime import date
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Mapping
 
 from app.models.media import MediaType
 
+# Shared read-only fallback for nested payload lookups: `(payload.get(key) or EMPTY_MAPPING).get(...)`
+# avoids allocating a throwaway dict on every miss.
+EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
 
 @dataclass(slots=True)
 class ConnectorResult:
@@ -41,3 +47,29 @@ class BaseConnector:
     async def search(self, query: str, limit: int = 3) -> list[str]:
         """Return source-specific identifiers for a search query."""
         return []
+
+    async def search_full(
+        self,
+        query: str,
+        limit: int = 3,
+        *,
+        fetch: Callable[[str], Awaitable[ConnectorResult | None]] | None = None,
+    ) -> list[ConnectorResult]:
+        """Return normalized results for a search query.
+
+        The default searches, then fetches each unique hit concurrently through `fetch` (`self.fetch`
+        when omitted), keeping search order. Hits whose fetch fails or returns None are dropped unless
+        every fetch raised, in which case the first error is raised. Sources whose search response
+        already carries full records override this with a single request and ignore `fetch`.
+        """
+        fetch_hit = fetch or self.fetch
+        hits = (await self.search(query, limit=limit))[:limit]
+        identifiers = list(dict.fromkeys(identifier for identifier in hits if identifier))
+        outcomes = await asyncio.gather(*(fetch_hit(identifier) for identifier in identifiers), return_exceptions=True)
+        errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+        for error in errors:
+            if not isinstance(error, Exception):
+                raise error
+        if errors and len(errors) == len(outcomes):
+            raise errors[0]
+        return [outcome for outcome in outcomes if isinstance(outcome, ConnectorResult)]
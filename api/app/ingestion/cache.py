@@ -0,0 +1,111 @@
+"""Process-local TTL cache for connector fetch/search responses.
+
+Implementation notes:
+- Entries are keyed by (connector instance, method, args), so connectors of the same source built
+  with different credentials never share results. `cached_connector_call` entries expire after
+  CONNECTOR_CACHE_TTL_SECONDS and `cached_connector_search` entries after the shorter
+  CONNECTOR_SEARCH_CACHE_TTL_SECONDS, since search rankings drift (both read per call, so 0
+  disables caching); the cache is bounded and evicts oldest entries first.
+- Only successful calls are cached, so failures keep flowing through the circuit breaker.
+- Identical calls already in flight on the same event loop are coalesced (single-flight) into one
+  upstream request, independent of the TTL; its result or error is delivered to every caller.
+- Every caller gets a deep copy, so mutating a result (or the nested metadata/extensions/
+  raw_payload dicts of a `ConnectorResult`) never leaks into the cached entry or other callers.
+- `bypass_connector_cache()` forces a live call (and refreshes the entry), e.g. for force_refresh ingests.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import monotonic
+from typing import Any, Awaitable, Callable, Iterator, TypeVar
+
+from app.core.config import settings
+
+MAX_ENTRIES = 1024
+
+T = TypeVar("T")
+
+# key -> (expires_at monotonic seconds, value); dicts keep insertion order, so the first key is the oldest.
+_ENTRIES: dict[tuple[Any, ...], tuple[float, Any]] = {}
+# key -> task for the upstream call currently running; concurrent identical calls share it.
+_INFLIGHT: dict[tuple[Any, ...], asyncio.Task[Any]] = {}
+_bypass: ContextVar[bool] = ContextVar("connector_cache_bypass", default=False)
+
+
+@contextmanager
+def bypass_connector_cache(enabled: bool = True) -> Iterator[None]:
+    """Skip cached responses for connector calls made inside this block (no-op when not enabled)."""
+    token = _bypass.set(enabled)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+def connector_cache_bypassed() -> bool:
+    """Return True inside `bypass_connector_cache()`; lets connector-level caches honor it too."""
+    return _bypass.get()
+
+
+def _forget_inflight(key: tuple[Any, ...], task: asyncio.Task[Any]) -> None:
+    if _INFLIGHT.get(key) is task:
+        del _INFLIGHT[key]
+    if not task.cancelled():
+        task.exception()  # mark retrieved; every awaiter already saw it
+
+
+async def _single_flight(key: tuple[Any, ...], call: Callable[[], Awaitable[T]], *, join: bool) -> T:
+    """Run `call` once per key and event loop; concurrent callers await the same task."""
+    loop = asyncio.get_running_loop()
+    task = _INFLIGHT.get(key) if join else None
+    if task is None or task.get_loop() is not loop:
+        task = loop.create_task(call())
+        _INFLIGHT[key] = task
+        task.add_done_callback(functools.partial(_forget_inflight, key))
+    # shield: one caller being cancelled must not cancel the shared upstream request.
+    return await asyncio.shield(task)
+
+
+def clear_connector_cache() -> None:
+    """Drop every cached connector response."""
+    _ENTRIES.clear()
+
+
+def _cached(method: Callable[..., Awaitable[T]], ttl_setting: str) -> Callable[..., Awaitable[T]]:
+    @functools.wraps(method)
+    async def wrapper(self: Any, *args: Any, **kwargs: Any) -> T:
+        ttl = getattr(settings, ttl_setting)
+        # The instance itself (hashed by identity) rather than source_name: results depend on its credentials.
+        key = (self, method.__name__, args, tuple(sorted(kwargs.items())))
+        bypass = _bypass.get()
+        now = monotonic()
+        if ttl > 0 and not bypass:
+            entry = _ENTRIES.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    return copy.deepcopy(entry[1])
+                del _ENTRIES[key]
+        value = await _single_flight(key, lambda: method(self, *args, **kwargs), join=not bypass)
+        if ttl > 0:
+            _ENTRIES.pop(key, None)
+            while len(_ENTRIES) >= MAX_ENTRIES:
+                del _ENTRIES[next(iter(_ENTRIES))]
+            _ENTRIES[key] = (now + ttl, value)
+        return copy.deepcopy(value)
+
+    return wrapper
+
+
+def cached_connector_call(method: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """Coalesce concurrent identical calls and cache successful results for CONNECTOR_CACHE_TTL_SECONDS."""
+    return _cached(method, "connector_cache_ttl_seconds")
+
+
+def cached_connector_search(method: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """Like `cached_connector_call`, but entries expire after CONNECTOR_SEARCH_CACHE_TTL_SECONDS."""
+    return _cached(method, "connector_search_cache_ttl_seconds")
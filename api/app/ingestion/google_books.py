@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from typing import Awaitable, Callable
 from urllib.parse import parse_qs, urlparse
 
 from app.core.config import settings
-from app.ingestion.base import BaseConnector, ConnectorResult
+from app.ingestion.base import EMPTY_MAPPING, BaseConnector, ConnectorResult
 from app.ingestion.http import fetch_json
 from app.models.media import MediaType
 from app.utils.datetime import parse_date
@@ -41,8 +42,12 @@ class GoogleBooksConnector(BaseConnector):
             f"https://www.googleapis.com/books/v1/volumes/{volume_id}",
             params=params,
         )
-        info = payload.get("volumeInfo", {})
-        identifiers = info.get("industryIdentifiers", [])
+        return self._normalize(payload, volume_id)
+
+    def _normalize(self, payload: dict, volume_id: str) -> ConnectorResult:
+        """Map a volume resource (from fetch or a search hit) to a connector result."""
+        info = payload.get("volumeInfo") or EMPTY_MAPPING
+        identifiers = info.get("industryIdentifiers") or ()
         isbn_10 = next((i["identifier"] for i in identifiers if i.get("type") == "ISBN_10"), None)
         isbn_13 = next((i["identifier"] for i in identifiers if i.get("type") == "ISBN_13"), None)
         metadata = {
@@ -65,7 +70,7 @@ class GoogleBooksConnector(BaseConnector):
             title=info.get("title") or "Unknown",
             description=info.get("description"),
             release_date=parse_date(info.get("publishedDate")),
-            cover_image_url=info.get("imageLinks", {}).get("thumbnail"),
+            cover_image_url=(info.get("imageLinks") or EMPTY_MAPPING).get("thumbnail"),
             canonical_url=info.get("infoLink"),
             metadata=metadata,
             source_name=self.source_name,
@@ -81,5 +86,24 @@ class GoogleBooksConnector(BaseConnector):
         if self.api_key:
             params["key"] = self.api_key
         data = await fetch_json("https://www.googleapis.com/books/v1/volumes", params=params)
-        items = data.get("items", []) or []
+        items = data.get("items") or ()
         return [item["id"] for item in items if item.get("id")]
+
+    async def search_full(
+        self,
+        query: str,
+        limit: int = 3,
+        *,
+        fetch: Callable[[str], Awaitable[ConnectorResult | None]] | None = None,
+    ) -> list[ConnectorResult]:
+        """Search Google Books and normalize the embedded volumeInfo of each hit.
+
+        The /volumes search response already carries each hit's volumeInfo, so previews need one
+        request instead of a search plus one fetch per hit (`fetch` is never called).
+        """
+        params = {"q": query, "maxResults": limit}
+        if self.api_key:
+            params["key"] = self.api_key
+        data = await fetch_json("https://www.googleapis.com/books/v1/volumes", params=params)
+        items = data.get("items") or ()
+        return [self._normalize(item, item["id"]) for item in items if item.get("id")]
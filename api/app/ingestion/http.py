@@ -1,9 +1,37 @@
-"""HTTP helpers with retry/backoff for external ingestion calls."""
+"""HTTP helpers with retry/backoff for external ingestion calls.
+
+Implementation notes:
+- Connectors share one pooled `httpx.AsyncClient` per event loop so repeat calls reuse TCP/TLS
+  connections; pooled connections cannot cross loops, so each loop (e.g. per RQ job) gets its own.
+- HTTP/2 is negotiated when the `h2` extra (httpx[http2]) is installed, so parallel calls to one
+  provider (e.g. TMDB movie+tv) share a connection instead of opening a second one.
+- Connection failures are retried immediately by the transport; `fetch_json` adds a small
+  backoff loop for upstream 5xx/HTTP errors.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import random
+import weakref
+
 import httpx
-from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+import orjson
+
+try:  # HTTP/2 multiplexes concurrent calls to one host over a single connection when h2 is installed.
+    import h2  # noqa: F401
+
+    _HTTP2 = True
+except ImportError:  # pragma: no cover - depends on installed extras
+    _HTTP2 = False
+
+DEFAULT_TIMEOUT_SECONDS = 15
+FETCH_ATTEMPTS = 3
+BACKOFF_INITIAL_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 8.0
+_TRANSPORT_CONNECT_RETRIES = 2
+_POOL_LIMITS = httpx.Limits(max_keepalive_connections=50, max_connections=100)
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = weakref.WeakKeyDictionary()
 
 
 class ExternalAPIError(Exception):
@@ -11,6 +39,26 @@ class ExternalAPIError(Exception):
     pass
 
 
+def get_http_client() -> httpx.AsyncClient:
+    """Return the pooled client for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        transport = httpx.AsyncHTTPTransport(
+            http2=_HTTP2, retries=_TRANSPORT_CONNECT_RETRIES, limits=_POOL_LIMITS
+        )
+        client = httpx.AsyncClient(timeout=DEFAULT_TIMEOUT_SECONDS, transport=transport)
+        _clients[loop] = client
+    return client
+
+
+async def close_http_client() -> None:
+    """Close the running loop's pooled client (call on app/worker shutdown)."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
 async def fetch_json(
     url: str,
     *,
@@ -20,17 +68,19 @@ async def fetch_json(
     data: dict | None = None,
 ) -> dict:
     """Fetch JSON with retries for transient HTTP or upstream errors."""
-    async for attempt in AsyncRetrying(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential_jitter(initial=1, max=8),
-        retry=retry_if_exception_type((httpx.HTTPError, ExternalAPIError)),
-        reraise=True,
-    ):
-        with attempt:
-            async with httpx.AsyncClient(timeout=15) as client:
-                response = await client.request(method, url, headers=headers, params=params, data=data)
-                if response.status_code >= 500:
-                    raise ExternalAPIError(f"Server error {response.status_code}")
-                response.raise_for_status()
-                return response.json()
+    client = get_http_client()
+    for attempt in range(FETCH_ATTEMPTS):
+        try:
+            response = await client.request(method, url, headers=headers, params=params, data=data)
+            if response.status_code >= 500:
+                raise ExternalAPIError(f"Server error {response.status_code}")
+            response.raise_for_status()
+            # orjson parses the raw bytes directly, skipping httpx's text decode + stdlib json.
+            return orjson.loads(response.content)
+        except (httpx.HTTPError, ExternalAPIError):
+            if attempt + 1 >= FETCH_ATTEMPTS:
+                raise
+        # Exponential backoff with up to 1s of jitter, capped.
+        delay = min(BACKOFF_INITIAL_SECONDS * 2**attempt + random.random(), BACKOFF_MAX_SECONDS)
+        await asyncio.sleep(delay)
     raise ExternalAPIError("Unreachable")
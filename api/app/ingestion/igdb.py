@@ -1,4 +1,9 @@
-"""IGDB connector for game metadata ingestion."""
+"""IGDB connector for game metadata ingestion.
+
+Implementation notes:
+- Twitch app tokens are shared by every connector instance in the process and, via Redis, across
+  workers/replicas so restarts do not each pay a token round-trip.
+"""
 
 from __future__ import annotations
 
@@ -6,12 +11,17 @@ from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import httpx
+import orjson
 
 from app.core.config import settings
-from app.ingestion.base import BaseConnector, ConnectorResult
-from app.ingestion.http import ExternalAPIError
+from app.ingestion import shared_state
+from app.ingestion.base import EMPTY_MAPPING, BaseConnector, ConnectorResult
+from app.ingestion.http import ExternalAPIError, get_http_client
 from app.models.media import MediaType
 
+# Process-wide token cache keyed by client id: (access_token, expires_at).
+_TOKEN_CACHE: dict[str, tuple[str, datetime]] = {}
+
 
 class IGDBConnector(BaseConnector):
     """IGDB API connector with token caching."""
@@ -35,6 +45,29 @@ class IGDBConnector(BaseConnector):
         """Clear cached access token state."""
         self._access_token = None
         self._token_expires_at = None
+        if self.client_id:
+            _TOKEN_CACHE.pop(self.client_id, None)
+
+    def _shared_token_key(self) -> str:
+        return f"igdb:token:{self.client_id}"
+
+    async def _adopt_shared_token(self) -> bool:
+        """Reuse a still-valid token cached by another instance or worker."""
+        cached = _TOKEN_CACHE.get(self.client_id or "")
+        if cached is None:
+            stored = await shared_state.get_json(self._shared_token_key())
+            if not isinstance(stored, dict) or not stored.get("access_token") or not stored.get("expires_at"):
+                return False
+            try:
+                cached = (str(stored["access_token"]), datetime.fromisoformat(str(stored["expires_at"])))
+            except ValueError:
+                return False
+        self._access_token, self._token_expires_at = cached
+        if self._needs_token_refresh():
+            self._reset_token_cache()
+            return False
+        _TOKEN_CACHE[self.client_id or ""] = cached
+        return True
 
     def _needs_token_refresh(self) -> bool:
         """Return True when the cached token is missing or expiring."""
@@ -50,20 +83,19 @@ class IGDBConnector(BaseConnector):
         """Ensure a valid bearer token is available for requests."""
         if not self.client_id or not self.client_secret:
             raise ExternalAPIError("IGDB credentials missing")
-        if not force_refresh and not self._needs_token_refresh():
+        if not force_refresh and (not self._needs_token_refresh() or await self._adopt_shared_token()):
             return self._access_token  # type: ignore[return-value]
 
-        async with httpx.AsyncClient(timeout=15) as client:
-            response = await client.post(
-                self._token_url,
-                params={
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "grant_type": "client_credentials",
-                },
-            )
+        response = await get_http_client().post(
+            self._token_url,
+            params={
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "grant_type": "client_credentials",
+            },
+        )
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         token = data.get("access_token")
         if not token:
             raise ExternalAPIError("Failed to fetch IGDB token")
@@ -78,6 +110,12 @@ class IGDBConnector(BaseConnector):
             expires_seconds = 60
         self._access_token = token
         self._token_expires_at = self._utcnow() + timedelta(seconds=expires_seconds)
+        _TOKEN_CACHE[self.client_id] = (token, self._token_expires_at)
+        await shared_state.set_json(
+            self._shared_token_key(),
+            {"access_token": token, "expires_at": self._token_expires_at.isoformat()},
+            ttl_seconds=expires_seconds - self._token_refresh_buffer_seconds,
+        )
         return token
 
     async def _authenticated_post(self, content: str) -> list[dict[str, Any]]:
@@ -88,8 +126,7 @@ class IGDBConnector(BaseConnector):
                 "Client-ID": self.client_id or "",
                 "Authorization": f"Bearer {token}",
             }
-            async with httpx.AsyncClient(timeout=20) as client:
-                response = await client.post(self._game_url, content=content, headers=headers)
+            response = await get_http_client().post(self._game_url, content=content, headers=headers, timeout=20)
             try:
                 response.raise_for_status()
             except httpx.HTTPStatusError as exc:  # pragma: no cover - rare race conditions handled upstream
@@ -98,7 +135,7 @@ class IGDBConnector(BaseConnector):
                     if attempt == 0:
                         continue
                 raise
-            payload = response.json()
+            payload = orjson.loads(response.content)
             if isinstance(payload, list):
                 return payload
             return []
@@ -115,19 +152,29 @@ class IGDBConnector(BaseConnector):
         if not body:
             raise ExternalAPIError("IGDB resource not found")
         payload = body[0]
-        cover = payload.get("cover", {})
+        cover = payload.get("cover") or EMPTY_MAPPING
         image_url = cover.get("url")
         release_stamp = payload.get("first_release_date")
         release_date = None
         if release_stamp:
             release_date = datetime.utcfromtimestamp(release_stamp).date()
         metadata = {
-            "genres": [g.get("name") for g in payload.get("genres", []) if g.get("name")],
-            "platforms": [p.get("name") for p in payload.get("platforms", []) if p.get("name")],
+            "genres": [name for g in (payload.get("genres") or ()) if (name := g.get("name"))],
+            "platforms": [name for p in (payload.get("platforms") or ()) if (name := p.get("name"))],
         }
-        companies = payload.get("involved_companies", [])
-        developers = [c.get("company", {}).get("name") for c in companies if c.get("developer")]
-        publishers = [c.get("company", {}).get("name") for c in companies if c.get("publisher")]
+        # One pass over involved companies; a company can be both developer and publisher.
+        developers: list[str | None] = []
+        publishers: list[str | None] = []
+        for company in payload.get("involved_companies") or ():
+            is_developer = company.get("developer")
+            is_publisher = company.get("publisher")
+            if not (is_developer or is_publisher):
+                continue
+            name = (company.get("company") or EMPTY_MAPPING).get("name")
+            if is_developer:
+                developers.append(name)
+            if is_publisher:
+                publishers.append(name)
         extensions = {
             "game": {
                 "platforms": metadata["platforms"],
@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
-from urllib.parse import unquote, urlparse
+import re
+from urllib.parse import unquote
 
 from app.core.config import settings
 from app.ingestion.base import BaseConnector, ConnectorResult
+from app.ingestion.cache import cached_connector_call, cached_connector_search
 from app.ingestion.http import ExternalAPIError, fetch_json
 from app.models.media import MediaType
 from app.utils.datetime import parse_date
 
+API_URL = "https://ws.audioscrobbler.com/2.0/"
+# Fixed query params per method; calls merge in the key and per-request values.
+_BASE_PARAMS = {"format": "json"}
+_TRACK_INFO_PARAMS = {**_BASE_PARAMS, "method": "track.getInfo"}
+_TRACK_SEARCH_PARAMS = {**_BASE_PARAMS, "method": "track.search"}
+
+# https://www.last.fm/music/{artist}/_/{track} (query/fragment ignored; track is the last path segment).
+_TRACK_URL_RE = re.compile(r"https?://[^/?#]*/+music/+([^/?#]+)/(?:[^?#]*/)?([^/?#]+)/*(?:[?#]|$)", re.IGNORECASE)
+
 
 class LastFMConnector(BaseConnector):
     """Last.fm API connector for track information."""
@@ -20,29 +31,23 @@ class LastFMConnector(BaseConnector):
 
     def parse_identifier(self, identifier: str) -> tuple[str | None, str | None, str | None]:
         """Parse identifiers into artist/track/mbid components."""
-        artist = track = mbid = None
         if "::" in identifier:
-            artist, track = identifier.split("::", 1)
-        elif identifier.startswith("http"):
-            parsed = urlparse(identifier)
-            parts = [unquote(p) for p in parsed.path.split("/") if p]
-            if len(parts) >= 3 and parts[0].lower() == "music":
-                artist = parts[1]
-                track = parts[-1]
-        else:
-            mbid = identifier
-        return artist, track, mbid
+            artist, _, track = identifier.partition("::")
+            return artist, track, None
+        if identifier.startswith(("http://", "https://")):
+            match = _TRACK_URL_RE.match(identifier)
+            if match:
+                return unquote(match.group(1)), unquote(match.group(2)), None
+            return None, None, None
+        return None, None, identifier
 
+    @cached_connector_call
     async def fetch(self, identifier: str) -> ConnectorResult:
         """Fetch a track record by MBID or artist/track pair."""
         artist, track, mbid = self.parse_identifier(identifier)
         if not self.api_key:
             raise ExternalAPIError("Last.fm API key missing")
-        params = {
-            "api_key": self.api_key,
-            "format": "json",
-            "method": "track.getInfo",
-        }
+        params = {**_TRACK_INFO_PARAMS, "api_key": self.api_key}
         if mbid:
             params["mbid"] = mbid
         elif artist and track:
@@ -50,7 +55,7 @@ class LastFMConnector(BaseConnector):
             params["track"] = track
         else:
             raise ExternalAPIError("Track identifier required")
-        payload = await fetch_json("https://ws.audioscrobbler.com/2.0/", params=params)
+        payload = await fetch_json(API_URL, params=params)
         track_info = payload.get("track")
         if not track_info:
             raise ExternalAPIError("Track not found")
@@ -90,18 +95,13 @@ class LastFMConnector(BaseConnector):
             extensions=extensions,
         )
 
+    @cached_connector_search
     async def search(self, query: str, limit: int = 3) -> list[str]:
         """Search Last.fm for track identifiers."""
         if not self.api_key:
             return []
-        params = {
-            "method": "track.search",
-            "track": query,
-            "limit": limit,
-            "api_key": self.api_key,
-            "format": "json",
-        }
-        payload = await fetch_json("https://ws.audioscrobbler.com/2.0/", params=params)
+        params = {**_TRACK_SEARCH_PARAMS, "track": query, "limit": limit, "api_key": self.api_key}
+        payload = await fetch_json(API_URL, params=params)
         matches = payload.get("results", {}).get("trackmatches", {}).get("track", []) or []
         identifiers: list[str] = []
         for track in matches:
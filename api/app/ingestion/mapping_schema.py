@@ -1,21 +1,44 @@
-"""Schema validation for ingestion mapping manifests."""
+"""Schema validation for ingestion mapping manifests.
+
+Implementation notes:
+- Validated manifests are cached per resolved path and reused until the file's mtime changes;
+  cached instances are frozen so callers can share them safely.
+- An optional `<name>.cache.json` sidecar (written by `dump_mapping_manifest_cache`) carries an
+  already-validated manifest across processes for `load_mapping_manifest`. It is trusted only while
+  both its recorded YAML mtime and its schema fingerprint (a hash of this module's source, so any
+  model or validator change invalidates it) match, and is rebuilt with `model_construct`.
+- `validate_mapping_file`/`validate_mapping_paths` never read sidecars: validation always parses
+  and validates the YAML itself.
+"""
 
 from __future__ import annotations
 
+import hashlib
+import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Iterable
 
 import yaml
 from pydantic import BaseModel, Field, ValidationError, field_validator
 
-_ALLOWED_CANONICAL_TABLES = {
-    "media_items",
-    "book_items",
-    "movie_items",
-    "game_items",
-    "music_items",
-}
+try:  # Prefer the libyaml-backed loader; PyYAML wheels without libyaml fall back to pure Python.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+_ALLOWED_CANONICAL_TABLES = frozenset(
+    {
+        "media_items",
+        "book_items",
+        "movie_items",
+        "game_items",
+        "music_items",
+    }
+)
 _METADATA_PREFIX = "media_items.metadata."
+# resolved path -> (st_mtime_ns, validated manifest)
+_MANIFEST_CACHE: dict[Path, tuple[int, "MappingManifest"]] = {}
 
 
 class MetadataMapping(BaseModel):
@@ -49,7 +72,7 @@ class MappingManifest(BaseModel):
     raw_only: list[RawOnlyMapping] = Field(default_factory=list)
     data_notes: list[str] = Field(default_factory=list)
 
-    model_config = {"extra": "forbid"}
+    model_config = {"extra": "forbid", "frozen": True}
 
     @field_validator("source")
     @classmethod
@@ -61,47 +84,124 @@ class MappingManifest(BaseModel):
     @field_validator("canonical")
     @classmethod
     def _validate_canonical(cls, value: dict[str, dict[str, str]]) -> dict[str, dict[str, str]]:
+        # Field-level typing (dict[str, dict[str, str]]) is already enforced by pydantic; only the
+        # table allowlist and non-blank checks remain, each done in a single pass.
         if "media_items" not in value:
             raise ValueError("canonical.media_items is required")
-        for table_name, fields in value.items():
-            if table_name not in _ALLOWED_CANONICAL_TABLES:
-                raise ValueError(f"canonical table '{table_name}' is not allowed")
-            if not isinstance(fields, dict) or not fields:
-                raise ValueError(f"canonical.{table_name} must map fields to source paths")
-            for field_name, source_path in fields.items():
-                if not isinstance(field_name, str) or not field_name.strip():
-                    raise ValueError(f"canonical.{table_name} has an invalid field name")
-                if not isinstance(source_path, str) or not source_path.strip():
-                    raise ValueError(f"canonical.{table_name}.{field_name} must be a string path")
+        disallowed = value.keys() - _ALLOWED_CANONICAL_TABLES
+        if disallowed:
+            raise ValueError(f"canonical tables not allowed: {', '.join(sorted(disallowed))}")
+        empty = [table_name for table_name, fields in value.items() if not fields]
+        if empty:
+            raise ValueError(f"canonical tables must map fields to source paths: {', '.join(empty)}")
+        bad = [
+            f"{table_name}.{field_name}"
+            for table_name, fields in value.items()
+            for field_name, source_path in fields.items()
+            if not (field_name.strip() and source_path.strip())
+        ]
+        if bad:
+            raise ValueError(f"canonical fields need a name and a string path: {', '.join(bad)}")
         return value
 
 
-def load_mapping_manifest(path: Path) -> MappingManifest:
-    """Load and validate a mapping manifest from YAML."""
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+def _parse_mapping_manifest(path: Path) -> MappingManifest:
+    data = yaml.load(path.read_bytes(), Loader=_YamlLoader)
     if not isinstance(data, dict):
         raise ValueError("mapping manifest must be a YAML mapping")
     return MappingManifest.model_validate(data)
 
 
-def validate_mapping_file(path: Path) -> list[str]:
-    """Validate a single mapping file and return any errors."""
-    errors: list[str] = []
+def _sidecar_path(path: Path) -> Path:
+    return path.with_name(f"{path.stem}.cache.json")
+
+
+@lru_cache(maxsize=1)
+def _schema_fingerprint() -> str:
+    """Hash of this module's source; sidecars written under other models/validators are ignored."""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+def _construct_trusted_manifest(data: dict[str, Any]) -> MappingManifest:
+    """Rebuild a manifest that was validated before it was cached, skipping validation."""
+    return MappingManifest.model_construct(
+        source=data["source"],
+        canonical=data["canonical"],
+        metadata=[MetadataMapping.model_construct(**entry) for entry in data.get("metadata", [])],
+        raw_only=[RawOnlyMapping.model_construct(**entry) for entry in data.get("raw_only", [])],
+        data_notes=data.get("data_notes", []),
+    )
+
+
+def _load_sidecar(path: Path, mtime_ns: int) -> MappingManifest | None:
+    sidecar = _sidecar_path(path)
+    try:
+        blob = json.loads(sidecar.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(blob, dict)
+        or blob.get("mtime_ns") != mtime_ns
+        or blob.get("schema") != _schema_fingerprint()
+        or not isinstance(blob.get("manifest"), dict)
+    ):
+        return None
     try:
-        manifest = load_mapping_manifest(path)
+        return _construct_trusted_manifest(blob["manifest"])
+    except (KeyError, TypeError):
+        return None
+
+
+def dump_mapping_manifest_cache(path: Path, manifest: MappingManifest) -> Path:
+    """Write a validated manifest to its JSON sidecar, stamped with the YAML mtime and schema fingerprint."""
+    resolved = path.resolve()
+    sidecar = _sidecar_path(resolved)
+    blob = {
+        "mtime_ns": resolved.stat().st_mtime_ns,
+        "schema": _schema_fingerprint(),
+        "manifest": manifest.model_dump(mode="json"),
+    }
+    sidecar.write_text(json.dumps(blob, separators=(",", ":")), encoding="utf-8")
+    return sidecar
+
+
+def load_mapping_manifest(path: Path) -> MappingManifest:
+    """Load and validate a mapping manifest from YAML, reusing the cached result if unchanged."""
+    resolved = path.resolve()
+    mtime_ns = resolved.stat().st_mtime_ns
+    cached = _MANIFEST_CACHE.get(resolved)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    manifest = _load_sidecar(resolved, mtime_ns) or _parse_mapping_manifest(resolved)
+    _MANIFEST_CACHE[resolved] = (mtime_ns, manifest)
+    return manifest
+
+
+def _validate_file(path: Path) -> tuple[MappingManifest | None, list[str]]:
+    """Parse and validate the YAML itself (no sidecar) and return the manifest with any errors."""
+    try:
+        manifest = _parse_mapping_manifest(path.resolve())
     except (ValidationError, ValueError) as exc:
-        errors.append(f"{path}: {exc}")
-        return errors
+        return None, [f"{path}: {exc}"]
     if manifest.source != path.stem:
-        errors.append(
-            f"{path}: source '{manifest.source}' does not match file name '{path.stem}'"
-        )
-    return errors
+        return manifest, [f"{path}: source '{manifest.source}' does not match file name '{path.stem}'"]
+    return manifest, []
+
+
+def validate_mapping_file(path: Path) -> list[str]:
+    """Validate a single mapping file and return any errors."""
+    return _validate_file(path)[1]
+
 
+def validate_mapping_paths(paths: Iterable[Path], *, write_cache: bool = False) -> list[str]:
+    """Validate mapping manifests and collect error messages in input order.
 
-def validate_mapping_paths(paths: Iterable[Path]) -> list[str]:
-    """Validate mapping manifests and collect error messages."""
+    With `write_cache`, each manifest that validates cleanly gets a fresh JSON sidecar.
+    """
     errors: list[str] = []
     for path in paths:
-        errors.extend(validate_mapping_file(path))
+        manifest, file_errors = _validate_file(path)
+        errors.extend(file_errors)
+        if write_cache and manifest is not None and not file_errors:
+            dump_mapping_manifest_cache(path, manifest)
     return errors
@@ -1,23 +1,63 @@
-"""Circuit breaker and metrics tracking for ingestion connectors."""
+"""Circuit breaker and metrics tracking for ingestion connectors.
+
+Implementation notes:
+- Events are logged as orjson-rendered JSON messages (serialized only when a handler emits them)
+  with the payload also under `extra={"ingestion": ...}`; payloads are only built when the logger
+  is enabled for the event's level.
+- With `persist_circuits`, opening/clearing a circuit is published to the shared store and each
+  process seeds its circuits from it, so restarts keep known-bad upstreams in cooldown. Reopen
+  times are stored as wall-clock epochs since monotonic clocks are per-host.
+- Shared-store traffic never sits on a request path: the API seeds known sources in a background
+  task at startup, `track` only schedules a background seed for sources it has not seen, and
+  publishes are fire-and-forget. Local circuit state always wins over a late-arriving seed.
+"""
 
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import math
 import time
 from collections import defaultdict
-from dataclasses import dataclass, field
-from typing import Any, Awaitable, Callable, DefaultDict
+from dataclasses import asdict, dataclass, field
+from typing import Any, Awaitable, Callable, Coroutine, DefaultDict, Iterable
+
+import orjson
+
+from app.ingestion import shared_state
 
 logger = logging.getLogger("app.ingestion")
 
+CIRCUIT_KEY_PREFIX = "ingestion:circuit:"
+MAX_LAST_ERROR_CHARS = 256
+
+
+class _JsonPayload:
+    """Log argument that serializes its payload with orjson only when a handler formats the record."""
+
+    __slots__ = ("payload",)
+
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self.payload = payload
+
+    def __str__(self) -> str:
+        return orjson.dumps(self.payload, default=str).decode()
+
+
+def _log_event(level: int, payload: dict[str, Any]) -> None:
+    """Emit an ingestion event as a JSON message, with the payload also attached as `extra` data.
+
+    The message is the same JSON document plain-text handlers always printed; it is rendered lazily
+    via orjson, and structured handlers can read `record.ingestion` without re-parsing it.
+    """
+    logger.log(level, "%s", _JsonPayload(payload), extra={"ingestion": payload})
+
 
 class CircuitOpenError(Exception):
     """Raised when a source circuit is open and calls are temporarily blocked."""
 
 
-@dataclass
+@dataclass(slots=True)
 class CircuitBreakerState:
     """Track per-source failure streaks and cooldown windows."""
     threshold: int = 3
@@ -27,50 +67,75 @@ class CircuitBreakerState:
     open_until: float = 0.0
     current_backoff: float = field(init=False)
     opened_count: int = 0
+    # Time-independent part of snapshot(); rebuilt lazily after any state change.
+    _base_snapshot: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Initialize the current backoff based on base settings."""
         self.current_backoff = self.base_backoff_seconds
 
-    def can_call(self) -> bool:
+    def can_call(self, now: float | None = None) -> bool:
         """Return True if the circuit is closed and calls are allowed."""
-        return time.monotonic() >= self.open_until
+        if not self.open_until:
+            return True
+        return (time.monotonic() if now is None else now) >= self.open_until
 
-    def remaining_cooldown(self) -> float:
+    def remaining_cooldown(self, now: float | None = None) -> float:
         """Return remaining cooldown seconds before calls are allowed."""
-        if self.can_call():
+        if not self.open_until:
             return 0.0
-        return self.open_until - time.monotonic()
+        return max(self.open_until - (time.monotonic() if now is None else now), 0.0)
 
     def record_success(self) -> None:
         """Reset circuit state after a successful call."""
+        if not self.failure_streak and not self.open_until and self.current_backoff == self.base_backoff_seconds:
+            return
         self.failure_streak = 0
         self.open_until = 0.0
         self.current_backoff = self.base_backoff_seconds
+        self._base_snapshot = None
 
-    def record_failure(self) -> None:
+    def record_failure(self, now: float | None = None) -> None:
         """Advance circuit state and open on threshold breaches."""
+        self._base_snapshot = None
         self.failure_streak += 1
         if self.failure_streak < self.threshold:
             return
-        now = time.monotonic()
-        self.open_until = now + self.current_backoff
+        self.open_until = (time.monotonic() if now is None else now) + self.current_backoff
         self.failure_streak = 0
         self.opened_count += 1
         self.current_backoff = min(self.current_backoff * 2, self.max_backoff_seconds)
 
-    def snapshot(self) -> dict[str, Any]:
-        """Return a serializable snapshot of the circuit state."""
+    def to_shared(self) -> dict[str, Any]:
+        """Return a process-independent view of the open state (wall-clock reopen time)."""
         return {
-            "failure_streak": self.failure_streak,
-            "open_until": self.open_until,
-            "remaining_cooldown": self.remaining_cooldown(),
+            "reopen_at": time.time() + self.remaining_cooldown(),
             "current_backoff": self.current_backoff,
             "opened_count": self.opened_count,
         }
 
+    def adopt_shared(self, data: dict[str, Any]) -> None:
+        """Seed local state from `to_shared` output published by another process."""
+        remaining = float(data["reopen_at"]) - time.time()
+        self.open_until = time.monotonic() + remaining if remaining > 0 else 0.0
+        self.current_backoff = min(float(data["current_backoff"]), self.max_backoff_seconds)
+        self.opened_count = max(self.opened_count, int(data["opened_count"]))
+        self._base_snapshot = None
+
+    def snapshot(self, now: float | None = None) -> dict[str, Any]:
+        """Return a serializable snapshot of the circuit state."""
+        base = self._base_snapshot
+        if base is None:
+            base = self._base_snapshot = {
+                "failure_streak": self.failure_streak,
+                "open_until": self.open_until,
+                "current_backoff": self.current_backoff,
+                "opened_count": self.opened_count,
+            }
+        return {**base, "remaining_cooldown": self.remaining_cooldown(now)}
+
 
-@dataclass
+@dataclass(slots=True)
 class OperationMetrics:
     """Aggregated counters for a source operation."""
     started: int = 0
@@ -79,6 +144,7 @@ class OperationMetrics:
     skipped: int = 0
     last_latency_ms: float | None = None
     last_error: str | None = None
+    last_error_type: str | None = None
 
 
 class IngestionMonitor:
@@ -89,6 +155,7 @@ class IngestionMonitor:
         circuit_threshold: int = 3,
         base_backoff_seconds: float = 15.0,
         max_backoff_seconds: float = 300.0,
+        persist_circuits: bool = False,
     ) -> None:
         self._metrics: DefaultDict[str, DefaultDict[str, OperationMetrics]] = defaultdict(
             lambda: defaultdict(OperationMetrics)
@@ -100,7 +167,41 @@ class IngestionMonitor:
                 max_backoff_seconds=max_backoff_seconds,
             )
         )
-        self._lock = asyncio.Lock()
+        self._persist_circuits = persist_circuits
+        self._seeded_sources: set[str] = set()
+        # Strong references to fire-and-forget shared-store tasks until they finish.
+        self._background: set[asyncio.Task[None]] = set()
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.get_running_loop().create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def seed_circuits(self, sources: Iterable[str]) -> None:
+        """Adopt shared circuit state for every source not seeded yet (run in the background)."""
+        if not self._persist_circuits:
+            return
+        pending = [source for source in sources if source not in self._seeded_sources]
+        self._seeded_sources.update(pending)
+        await asyncio.gather(*(self._seed_circuit(source) for source in pending))
+
+    async def _seed_circuit(self, source: str) -> None:
+        """Adopt circuit state published by other processes unless this process already has its own."""
+        stored = await shared_state.get_json(f"{CIRCUIT_KEY_PREFIX}{source}")
+        if not isinstance(stored, dict):
+            return
+        circuit = self._circuits[source]
+        if circuit.failure_streak or circuit.opened_count:
+            return
+        try:
+            circuit.adopt_shared(stored)
+        except (KeyError, TypeError, ValueError):
+            logger.warning("Ignoring malformed shared circuit state for %s", source)
+
+    def _publish_circuit(self, source: str, circuit: CircuitBreakerState) -> None:
+        """Share an opened/cleared circuit so restarted or sibling processes inherit it (fire-and-forget)."""
+        ttl_seconds = max(1, math.ceil(circuit.current_backoff * 2))
+        self._spawn(shared_state.set_json(f"{CIRCUIT_KEY_PREFIX}{source}", circuit.to_shared(), ttl_seconds))
 
     def allow_call(self, source: str) -> bool:
         """Return True if a source circuit allows new work."""
@@ -116,9 +217,8 @@ class IngestionMonitor:
         context: dict[str, Any] | None = None,
     ) -> None:
         """Log a skipped call with circuit state for observability."""
-        async with self._lock:
-            metrics = self._metrics[source][operation]
-            metrics.skipped += 1
+        self._metrics[source][operation].skipped += 1
+        if logger.isEnabledFor(logging.WARNING):
             payload = {
                 "event": "ingestion_skip",
                 "source": source,
@@ -127,7 +227,7 @@ class IngestionMonitor:
                 "context": context or {},
                 "circuit": self._circuits[source].snapshot(),
             }
-        logger.warning(json.dumps(payload))
+            _log_event(logging.WARNING, payload)
 
     async def track(
         self,
@@ -142,14 +242,22 @@ class IngestionMonitor:
         Implementation notes:
         - Failures update the circuit breaker and emit structured logs.
         - Successes reset the failure streak and record latency.
+        - The closed-circuit path takes no lock (see comment below).
         """
         context = context or {}
-        async with self._lock:
-            circuit = self._circuits[source]
-            if not circuit.can_call():
-                remaining = circuit.remaining_cooldown()
-                metrics = self._metrics[source][operation]
-                metrics.skipped += 1
+        if self._persist_circuits and source not in self._seeded_sources:
+            self._seeded_sources.add(source)
+            self._spawn(self._seed_circuit(source))
+        # No lock: nothing between the circuit check and the counter updates awaits, so the
+        # single-threaded event loop cannot interleave another call for this source in between.
+        circuit = self._circuits[source]
+        metrics = self._metrics[source][operation]
+        # One clock read serves the circuit check and the latency start; one more at completion.
+        start = time.monotonic()
+        if not circuit.can_call(start):
+            remaining = circuit.remaining_cooldown(start)
+            metrics.skipped += 1
+            if logger.isEnabledFor(logging.WARNING):
                 payload = {
                     "event": "ingestion_circuit_open",
                     "source": source,
@@ -157,72 +265,73 @@ class IngestionMonitor:
                     "context": context,
                     "remaining_cooldown": remaining,
                 }
-                logger.warning(json.dumps(payload))
-                raise CircuitOpenError(f"{source} circuit open for {remaining:.2f}s")
-            metrics = self._metrics[source][operation]
-            metrics.started += 1
+                _log_event(logging.WARNING, payload)
+            raise CircuitOpenError(f"{source} circuit open for {remaining:.2f}s")
+        metrics.started += 1
 
-        start = time.monotonic()
         try:
             result = await func()
         except Exception as exc:  # noqa: BLE001
-            latency_ms = (time.monotonic() - start) * 1000
-            async with self._lock:
-                metrics = self._metrics[source][operation]
-                metrics.failed += 1
-                metrics.last_latency_ms = latency_ms
-                metrics.last_error = str(exc)
-                self._circuits[source].record_failure()
+            end = time.monotonic()
+            latency_ms = (end - start) * 1000
+            metrics.failed += 1
+            metrics.last_latency_ms = latency_ms
+            # Bounded: these live for the process lifetime and some upstream errors embed whole bodies.
+            metrics.last_error = str(exc)[:MAX_LAST_ERROR_CHARS]
+            metrics.last_error_type = type(exc).__name__
+            opened_count = circuit.opened_count
+            circuit.record_failure(end)
+            if self._persist_circuits and circuit.opened_count != opened_count:
+                self._publish_circuit(source, circuit)
+            if logger.isEnabledFor(logging.WARNING):
                 payload = {
                     "event": "ingestion_failure",
                     "source": source,
                     "operation": operation,
-                    "error": str(exc),
+                    "error": metrics.last_error,
                     "latency_ms": round(latency_ms, 2),
                     "context": context,
-                    "circuit": self._circuits[source].snapshot(),
+                    "circuit": circuit.snapshot(end),
                 }
-            logger.warning(json.dumps(payload))
+                _log_event(logging.WARNING, payload)
             raise
 
-        latency_ms = (time.monotonic() - start) * 1000
-        async with self._lock:
-            metrics = self._metrics[source][operation]
-            metrics.succeeded += 1
-            metrics.last_latency_ms = latency_ms
-            metrics.last_error = None
-            self._circuits[source].record_success()
+        end = time.monotonic()
+        latency_ms = (end - start) * 1000
+        metrics.succeeded += 1
+        metrics.last_latency_ms = latency_ms
+        metrics.last_error = None
+        metrics.last_error_type = None
+        was_opened = bool(circuit.open_until)
+        circuit.record_success()
+        if self._persist_circuits and was_opened:
+            self._publish_circuit(source, circuit)
+        # Success is the hot path and INFO is usually filtered out; skip the payload and circuit snapshot then.
+        if logger.isEnabledFor(logging.INFO):
             payload = {
                 "event": "ingestion_success",
                 "source": source,
                 "operation": operation,
                 "latency_ms": round(latency_ms, 2),
                 "context": context,
-                "circuit": self._circuits[source].snapshot(),
+                "circuit": circuit.snapshot(end),
             }
-        logger.info(json.dumps(payload))
+            _log_event(logging.INFO, payload)
         return result
 
     async def snapshot(self) -> dict[str, Any]:
-        """Return a snapshot of all tracked source metrics."""
-        async with self._lock:
-            snap: dict[str, Any] = {}
-            for source, operations in self._metrics.items():
-                snap[source] = {
-                    "circuit": self._circuits[source].snapshot(),
-                    "operations": {
-                        name: {
-                            "started": metrics.started,
-                            "succeeded": metrics.succeeded,
-                            "failed": metrics.failed,
-                            "skipped": metrics.skipped,
-                            "last_latency_ms": metrics.last_latency_ms,
-                            "last_error": metrics.last_error,
-                        }
-                        for name, metrics in operations.items()
-                    },
-                }
-            return snap
+        """Return an eventually-consistent snapshot of all tracked source metrics.
+
+        No lock is taken: every field is a plain int/float/str, so a snapshot racing an in-flight
+        `track` can only be one update stale, which is acceptable for dashboards and health checks.
+        """
+        return {
+            source: {
+                "circuit": self._circuits[source].snapshot(),
+                "operations": {name: asdict(metrics) for name, metrics in list(operations.items())},
+            }
+            for source, operations in list(self._metrics.items())
+        }
 
 
-ingestion_monitor = IngestionMonitor()
+ingestion_monitor = IngestionMonitor(persist_circuits=True)
@@ -0,0 +1,112 @@
+"""Best-effort Redis-backed state shared across API replicas and workers.
+
+Invariants:
+- Redis is an optimization only: reads miss and writes no-op when it is unavailable.
+- Values are small JSON documents with a TTL; nothing here is the system of record.
+- Every Redis call, including the lazy connect and its ping, runs in a worker thread, so an
+  unreachable Redis never stalls the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from time import monotonic
+from typing import Any
+
+import orjson
+from redis import Redis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.utils.redaction import redact_secrets
+
+logger = logging.getLogger("app.ingestion.shared_state")
+
+# After a failed connect, wait this long before trying Redis again.
+RECONNECT_INTERVAL_SECONDS = 30.0
+_SOCKET_TIMEOUT_SECONDS = 0.5
+
+_connection: Redis | None = None
+_retry_at = 0.0
+_connect_lock = threading.Lock()
+
+
+def _skip_redis() -> bool:
+    """Return True when Redis is disabled or still in its reconnect backoff (no IO)."""
+    if settings.environment.lower() == "test":
+        return True
+    return _connection is None and monotonic() < _retry_at
+
+
+def _get_connection() -> Redis | None:
+    """Return a lazily connected Redis client, or None when disabled/unreachable.
+
+    Blocking: connects and pings on first use, so call it from a worker thread.
+    """
+    if settings.environment.lower() == "test":
+        return None
+    if _connection is not None:
+        return _connection
+    with _connect_lock:
+        if _connection is not None:
+            return _connection
+        if monotonic() < _retry_at:
+            return None
+        return _connect()
+
+
+def _connect() -> Redis | None:
+    global _connection, _retry_at
+    try:
+        connection = Redis.from_url(
+            settings.redis_url,
+            socket_timeout=_SOCKET_TIMEOUT_SECONDS,
+            socket_connect_timeout=_SOCKET_TIMEOUT_SECONDS,
+        )
+        connection.ping()
+    except Exception as exc:  # pragma: no cover - network/redis specific
+        logger.warning("Shared state unavailable; using process-local state: %s", redact_secrets(str(exc)))
+        _retry_at = monotonic() + RECONNECT_INTERVAL_SECONDS
+        return None
+    _connection = connection
+    return connection
+
+
+def _get_raw(key: str) -> bytes | None:
+    connection = _get_connection()
+    return None if connection is None else connection.get(key)
+
+
+def _setex(key: str, ttl_seconds: int, payload: bytes) -> None:
+    connection = _get_connection()
+    if connection is not None:
+        connection.setex(key, ttl_seconds, payload)
+
+
+async def get_json(key: str) -> Any | None:
+    """Return the decoded value for key, or None on a miss or Redis failure."""
+    if _skip_redis():
+        return None
+    try:
+        raw = await asyncio.to_thread(_get_raw, key)
+    except RedisError as exc:  # pragma: no cover - network/redis specific
+        logger.warning("Shared state read failed for %s: %s", key, redact_secrets(str(exc)))
+        return None
+    if raw is None:
+        return None
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return None
+
+
+async def set_json(key: str, value: Any, ttl_seconds: int) -> None:
+    """Store value under key with a TTL; silently skipped when Redis is unavailable."""
+    if ttl_seconds <= 0 or _skip_redis():
+        return
+    try:
+        await asyncio.to_thread(_setex, key, ttl_seconds, orjson.dumps(value))
+    except RedisError as exc:  # pragma: no cover - network/redis specific
+        logger.warning("Shared state write failed for %s: %s", key, redact_secrets(str(exc)))
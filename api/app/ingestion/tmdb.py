@@ -1,18 +1,47 @@
-"""TMDB connector for movie and TV metadata ingestion."""
+"""TMDB connector for movie and TV metadata ingestion.
+
+Implementation notes:
+- Raw detail payloads (including 404s) and search identifier lists are cached in the shared Redis
+  store with per-kind TTLs, so replicas and workers reuse each other's lookups; only response
+  data is cached, never auth headers. Force-refresh ingests skip the shared cache reads.
+- Search identifier lists use only the shared store (no process-local layer on top), so a single
+  TTL governs them; normalized `fetch` results are still kept briefly in-process by
+  `cached_connector_call`, above the raw-payload cache.
+"""
 
 from __future__ import annotations
 
-from urllib.parse import urlparse
+import asyncio
+import hashlib
+import re
+from typing import Any
 
 import httpx
 
 from app.core.config import settings
-from app.ingestion.base import BaseConnector, ConnectorResult
+from app.ingestion import shared_state
+from app.ingestion.base import EMPTY_MAPPING, BaseConnector, ConnectorResult
+from app.ingestion.cache import cached_connector_call, connector_cache_bypassed
 from app.ingestion.http import ExternalAPIError, fetch_json
 from app.models.media import MediaType
 from app.utils.datetime import parse_date
 
 IMAGE_BASE = "https://image.tmdb.org/t/p/original"
+# Search order doubles as result priority (movie hits rank first).
+_SEARCH_KINDS = ("movie", "tv")
+_VALID_KINDS = frozenset(_SEARCH_KINDS)
+# At or below this limit one movie page usually suffices, so TV is only queried if still short.
+SEQUENTIAL_SEARCH_MAX_LIMIT = 3
+# https://www.themoviedb.org/{movie|tv}/{id}[/...]; captures kind and the id segment.
+_RESOURCE_URL_RE = re.compile(r"https?://[^/?#]*/(movie|tv)/([^/?#]+)")
+# Fixed query params; calls merge in auth and per-request values.
+_DETAIL_PARAMS = {"append_to_response": "credits"}
+_SEARCH_PARAMS = {"page": 1, "include_adult": "false", "language": "en-US"}
+# Shared (Redis) cache tiers: details change rarely, search rankings drift, misses may get created.
+DETAIL_TTL_SECONDS = 24 * 60 * 60
+SEARCH_TTL_SECONDS = 6 * 60 * 60
+NOT_FOUND_TTL_SECONDS = 10 * 60
+_NOT_FOUND_MARKER = "__not_found__"
 
 
 class TMDBConnector(BaseConnector):
@@ -22,18 +51,23 @@ class TMDBConnector(BaseConnector):
     def __init__(self, api_key: str | None = None, auth_token: str | None = None) -> None:
         self.api_key = api_key or settings.tmdb_api_key
         self.auth_token = auth_token or settings.tmdb_api_auth_header
+        self._auth_cache: tuple[dict[str, str], dict[str, str]] | None = None
 
     def parse_identifier(self, identifier: str) -> str:
         """Normalize TMDB identifiers, accepting URLs or type:id tokens."""
         if identifier.startswith("http"):
-            parsed = urlparse(identifier)
-            parts = parsed.path.strip("/").split("/")
-            if len(parts) >= 2 and parts[0] in {"movie", "tv"}:
-                return f"{parts[0]}:{parts[1]}"
+            match = _RESOURCE_URL_RE.match(identifier)
+            if match:
+                return f"{match.group(1)}:{match.group(2)}"
         return super().parse_identifier(identifier)
 
     def _auth(self) -> tuple[dict[str, str], dict[str, str]]:
-        """Return headers/params for TMDB auth, preferring bearer tokens."""
+        """Return headers/params for TMDB auth, preferring bearer tokens.
+
+        Built once per instance (credentials are fixed at construction); callers must not mutate them.
+        """
+        if self._auth_cache is not None:
+            return self._auth_cache
         headers: dict[str, str] = {"accept": "application/json"}
         params: dict[str, str] = {}
         if self.auth_token:
@@ -42,35 +76,73 @@ class TMDBConnector(BaseConnector):
             params["api_key"] = self.api_key
         else:
             raise ExternalAPIError("TMDB API credentials missing; set TMDB_API_AUTH_HEADER or TMDB_API_KEY")
-        return headers, params
+        self._auth_cache = (headers, params)
+        return self._auth_cache
 
+    @cached_connector_call
     async def fetch(self, identifier: str) -> ConnectorResult:
-        """Fetch a TMDB record, trying movie then TV endpoints if needed."""
+        """Fetch a TMDB record, preferring the movie endpoint over TV when no type is given.
+
+        Implementation notes:
+        - Untyped ids are requested from both endpoints concurrently, so a movie miss costs one
+          round trip instead of two; movie still wins when both exist (the id spaces overlap).
+        """
         token = self.parse_identifier(identifier)
-        media_type_hint = None
         if ":" in token:
             media_type_hint, token = token.split(":", 1)
-        for endpoint in [media_type_hint] if media_type_hint else ["movie", "tv"]:
+            if media_type_hint not in _VALID_KINDS:
+                raise ExternalAPIError(f"Unsupported TMDB type '{media_type_hint}'")
+            data = await self._fetch(media_type_hint, token)
+        else:
+            movie = asyncio.create_task(self._fetch("movie", token))
+            tv = asyncio.create_task(self._fetch("tv", token))
             try:
-                data = await self._fetch(endpoint, token)
-                if data:
-                    return data
-            except httpx.HTTPStatusError as exc:  # type: ignore[union-attr]
-                if exc.response.status_code == 404:
-                    continue
+                data = await movie or await tv
+            finally:
+                if not tv.done():
+                    tv.cancel()
+                elif not tv.cancelled():
+                    tv.exception()  # already surfaced or superseded by the movie result
+        if data is None:
+            raise ExternalAPIError("TMDB resource not found")
+        return data
+
+    async def _detail_payload(self, kind: str, tmdb_id: str) -> dict[str, Any] | None:
+        """Return the raw detail payload via the shared cache; None when TMDB has no such record."""
+        headers, params = self._auth()
+        key = f"tmdb:detail:{kind}:{tmdb_id}"
+        if not connector_cache_bypassed():
+            cached = await shared_state.get_json(key)
+            if isinstance(cached, dict):
+                return None if cached.get(_NOT_FOUND_MARKER) else cached
+        try:
+            payload = await fetch_json(
+                f"https://api.themoviedb.org/3/{kind}/{tmdb_id}",
+                headers=headers,
+                params=params | _DETAIL_PARAMS,
+            )
+        except httpx.HTTPStatusError as exc:  # type: ignore[union-attr]
+            if exc.response.status_code != 404:
                 raise
-        raise ExternalAPIError("TMDB resource not found")
+            await shared_state.set_json(key, {_NOT_FOUND_MARKER: True}, NOT_FOUND_TTL_SECONDS)
+            return None
+        await shared_state.set_json(key, payload, DETAIL_TTL_SECONDS)
+        return payload
 
     async def _fetch(self, kind: str, tmdb_id: str) -> ConnectorResult | None:
         """Fetch and normalize a single TMDB record."""
-        headers, params = self._auth()
-        payload = await fetch_json(
-            f"https://api.themoviedb.org/3/{kind}/{tmdb_id}",
-            headers=headers,
-            params={**params, "append_to_response": "credits"},
-        )
+        payload = await self._detail_payload(kind, tmdb_id)
         if not payload:
             return None
+        # One pass over the (often 100+ entry) crew list buckets both roles.
+        crew_directors: list[str | None] = []
+        producers: list[str | None] = []
+        for member in (payload.get("credits") or EMPTY_MAPPING).get("crew") or ():
+            job = member.get("job")
+            if job == "Director":
+                crew_directors.append(member.get("name"))
+            elif job == "Producer":
+                producers.append(member.get("name"))
         if kind == "tv":
             title = payload.get("name")
             media_type = MediaType.TV
@@ -80,7 +152,7 @@ class TMDBConnector(BaseConnector):
             title = payload.get("title")
             media_type = MediaType.MOVIE
             runtime = payload.get("runtime")
-            directors = [c["name"] for c in payload.get("credits", {}).get("crew", []) if c.get("job") == "Director"]
+            directors = crew_directors
         metadata = {
             "genres": [g.get("name") for g in payload.get("genres", [])],
             "languages": payload.get("spoken_languages"),
@@ -90,9 +162,7 @@ class TMDBConnector(BaseConnector):
             "movie": {
                 "runtime_minutes": runtime,
                 "directors": directors,
-                "producers": [
-                    c.get("name") for c in payload.get("credits", {}).get("crew", []) if c.get("job") == "Producer"
-                ],
+                "producers": producers,
                 "tmdb_type": kind,
             }
         }
@@ -113,26 +183,43 @@ class TMDBConnector(BaseConnector):
         )
 
     async def search(self, query: str, limit: int = 3) -> list[str]:
-        """Search TMDB across movie and TV indices."""
+        """Search TMDB across movie and TV indices (cached only in the shared store)."""
         try:
             headers, params = self._auth()
         except ExternalAPIError:
             return []
+        key = f"tmdb:search:{hashlib.sha1(query.encode('utf-8')).hexdigest()}:{limit}"
+        if not connector_cache_bypassed():
+            cached = await shared_state.get_json(key)
+            if isinstance(cached, list):
+                return cached
+        identifiers = await self._search_identifiers(headers, params, query, limit)
+        await shared_state.set_json(key, identifiers, SEARCH_TTL_SECONDS)
+        return identifiers
+
+    async def _search_identifiers(
+        self, headers: dict[str, str], params: dict[str, str], query: str, limit: int
+    ) -> list[str]:
+        """Query the movie and TV search indices; movie hits rank first.
+
+        Implementation notes:
+        - Small limits (the common fan-out case) query movie first and skip TV once the limit is
+          filled, usually saving a TMDB call; larger limits query both indices concurrently.
+        """
         identifiers: list[str] = []
         seen: set[str] = set()
-        for search_kind in ("movie", "tv"):
+
+        async def _search_one(search_kind: str) -> list[dict[str, Any]]:
             payload = await fetch_json(
                 f"https://api.themoviedb.org/3/search/{search_kind}",
                 headers=headers,
-                params={
-                    **params,
-                    "query": query,
-                    "page": 1,
-                    "include_adult": "false",
-                    "language": "en-US",
-                },
+                params={**params, **_SEARCH_PARAMS, "query": query},
             )
-            for result in payload.get("results", []):
+            return payload.get("results", [])
+
+        def _collect(search_kind: str, results: list[dict[str, Any]]) -> bool:
+            """Append new tokens from one index; return True once the limit is reached."""
+            for result in results:
                 tmdb_id = result.get("id")
                 title = (result.get("title") or result.get("name") or "").strip()
                 if tmdb_id is None or not title:
@@ -143,7 +230,16 @@ class TMDBConnector(BaseConnector):
                 seen.add(token)
                 identifiers.append(token)
                 if len(identifiers) >= limit:
+                    return True
+            return False
+
+        if limit <= SEQUENTIAL_SEARCH_MAX_LIMIT:
+            for search_kind in _SEARCH_KINDS:
+                if _collect(search_kind, await _search_one(search_kind)):
                     break
-            if len(identifiers) >= limit:
+            return identifiers
+        results_by_kind = await asyncio.gather(*(_search_one(kind) for kind in _SEARCH_KINDS))
+        for search_kind, results in zip(_SEARCH_KINDS, results_by_kind):
+            if _collect(search_kind, results):
                 break
         return identifiers
@@ -9,6 +9,7 @@ from typing import Any
 
 from app.db.session import async_session
 from app.services import automation_engine
+from app.utils.uuid import parse_uuid
 
 logger = logging.getLogger("app.jobs.automations")
 
@@ -23,7 +24,7 @@ def run_automation_rule_job(
 
     async def _run() -> dict[str, Any]:
         async with async_session() as session:
-            requester = uuid.UUID(requested_by) if requested_by else None
+            requester = parse_uuid(requested_by)
             return await automation_engine.execute_rule_by_id(
                 session,
                 rule_id=uuid.UUID(rule_id),
@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 
 from app.db.session import async_session
 from app.services import spotify_service
@@ -28,7 +28,7 @@ def rotate_credential_job(*, provider: str, user_id: str, requested_by: str | No
                 "provider": provider,
                 "user_id": user_id,
                 "requested_by": requested_by,
-                "rotated_at": datetime.utcnow().isoformat() + "Z",
+                "rotated_at": datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z"),
             }
 
     logger.info(
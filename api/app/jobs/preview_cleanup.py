@@ -1,25 +1,18 @@
-"""Sync wrappers around maintenance jobs for scheduler use."""
+"""Sync wrappers around maintenance jobs for scheduler use.
 
-from __future__ import annotations
+The maintenance jobs own the work and the log line; these only unwrap the counts.
+"""
 
-import logging
+from __future__ import annotations
 
 from app.jobs.maintenance import prune_external_search_previews_job, prune_ingestion_payloads_job
 
-logger = logging.getLogger("app.jobs.preview_cleanup")
-
 
 def prune_external_search_previews() -> int:
     """Run preview cleanup and return the number of rows deleted."""
-    result = prune_external_search_previews_job()
-    deleted_count = int(result.get("deleted", 0))
-    logger.info("Pruned %d expired external search previews", deleted_count)
-    return deleted_count
+    return int(prune_external_search_previews_job().get("deleted", 0))
 
 
 def prune_ingestion_payloads(retention_days: int | None = None) -> int:
     """Run payload scrubbing and return the number of rows updated."""
-    result = prune_ingestion_payloads_job(retention_days=retention_days)
-    stripped_count = int(result.get("stripped", 0))
-    logger.info("Scrubbed %d ingestion payloads past retention", stripped_count)
-    return stripped_count
+    return int(prune_ingestion_payloads_job(retention_days=retention_days).get("stripped", 0))
@@ -1,34 +1,36 @@
-"""Schedule registry for recurring maintenance jobs."""
+"""Schedule registry for recurring maintenance jobs.
+
+Implementation notes:
+- `ensure_schedules` raises on Redis/connection errors so its caller can retry; it only skips
+  registration in the test environment.
+- The task queue resolves its Redis connection once at import, so when that failed a fresh
+  connection is opened (and pinged) per attempt instead of giving up for the process lifetime.
+"""
 
 from __future__ import annotations
 
 import logging
 from datetime import datetime, timedelta
 
+from redis import Redis
 from rq_scheduler import Scheduler
 
 from app.core.config import settings
 from app.jobs.availability import refresh_availability_job
 from app.jobs.maintenance import prune_external_search_previews_job, prune_ingestion_payloads_job
+from app.services.job_serialization import JsonJob
 from app.services.task_queue import task_queue
 
 logger = logging.getLogger("app.jobs.schedule_registry")
 
 
-def _job_exists(scheduler: Scheduler, job_id: str) -> bool:
-    """Return True if a scheduled job ID is already registered."""
-    if hasattr(scheduler, "get_job"):
-        return scheduler.get_job(job_id) is not None
-    try:
-        for job in scheduler.get_jobs():  # type: ignore[attr-defined]
-            if getattr(job, "id", None) == job_id:
-                return True
-            get_id = getattr(job, "get_id", None)
-            if callable(get_id) and get_id() == job_id:
-                return True
-    except Exception as exc:  # pragma: no cover - scheduler/redis specific
-        logger.warning("Unable to list scheduled jobs: %s", exc)
-    return False
+def _scheduled_job_ids(scheduler: Scheduler, job_ids: list[str]) -> set[str]:
+    """Return which of job_ids are already scheduled, using one pipelined Redis round-trip."""
+    pipe = scheduler.connection.pipeline(transaction=False)
+    for job_id in job_ids:
+        pipe.zscore(scheduler.scheduled_jobs_key, job_id)
+    scores = pipe.execute()
+    return {job_id for job_id, score in zip(job_ids, scores) if score is not None}
 
 
 def _schedule_entries() -> list[dict]:
@@ -69,16 +71,24 @@ def _schedule_entries() -> list[dict]:
     return entries
 
 
+def _scheduler_connection() -> Redis:
+    """Return the task queue's Redis connection, or open and ping a fresh one if it has none."""
+    if task_queue.connection is not None:
+        return task_queue.connection
+    connection = Redis.from_url(settings.redis_url)
+    connection.ping()
+    return connection
+
+
 def ensure_schedules() -> None:
-    """Idempotently register periodic jobs with rq-scheduler."""
+    """Idempotently register periodic jobs with rq-scheduler; raises when Redis is unreachable."""
     if settings.environment.lower() == "test":
         return
-    if not task_queue.connection:
-        logger.info("Skipping scheduler bootstrap; queue connection is unavailable")
-        return
-    scheduler = Scheduler(connection=task_queue.connection, queue_name=task_queue.queue_names[0])
-    for entry in _schedule_entries():
-        if _job_exists(scheduler, entry["id"]):
+    scheduler = Scheduler(connection=_scheduler_connection(), queue_name=task_queue.queue_names[0], job_class=JsonJob)
+    entries = _schedule_entries()
+    existing = _scheduled_job_ids(scheduler, [entry["id"] for entry in entries])
+    for entry in entries:
+        if entry["id"] in existing:
             continue
         try:
             scheduler.schedule(
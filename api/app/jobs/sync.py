@@ -4,11 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import uuid
 from typing import Any
 
 from app.db.session import async_session
 from app.services.sync_service import SyncTask, process_sync_task
+from app.utils.uuid import parse_uuid
 
 logger = logging.getLogger("app.jobs.sync")
 
@@ -25,7 +25,7 @@ def run_sync_job(
 
     async def _run() -> dict[str, Any]:
         async with async_session() as session:
-            requester = uuid.UUID(requested_by) if requested_by else None
+            requester = parse_uuid(requested_by)
             task = SyncTask(
                 provider=provider,
                 external_id=external_id,
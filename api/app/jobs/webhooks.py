@@ -4,11 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import uuid
 from typing import Any
 
 from app.db.session import async_session
 from app.services.webhook_service import WebhookEvent, handle_webhook
+from app.utils.uuid import parse_uuid
 
 logger = logging.getLogger("app.jobs.webhooks")
 
@@ -30,7 +30,7 @@ def handle_webhook_event_job(
                 payload=payload,
                 event_type=event_type,
                 source_ip=source_ip,
-                user_id=uuid.UUID(user_id) if user_id else None,
+                user_id=parse_uuid(user_id),
             )
             return await handle_webhook(session, event)
 
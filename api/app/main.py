@@ -1,27 +1,41 @@
 """FastAPI application entrypoint and health reporting utilities.
 
 Invariants:
+- `/health` is a static liveness check; `/health/ready` gates on startup work and carries telemetry.
 - Health detail is only exposed to authenticated users or allowlisted hosts.
 """
 
+import asyncio
 import ipaddress
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from time import monotonic
 from typing import Any
 
-from fastapi import Depends, FastAPI, Request
+from fastapi import Depends, FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.deps import get_optional_current_user
 from app.api.router import api_router
 from app.core.config import settings
+from app.core.security import check_password_hash_cost
+from app.ingestion import registered_sources
+from app.ingestion.http import close_http_client
 from app.ingestion.observability import ingestion_monitor
 from app.jobs.schedule_registry import ensure_schedules
 from app.models.user import User
+from app.utils import json as json_utils
 
-app = FastAPI(title=settings.app_name)
+logger = logging.getLogger("app.main")
+
+app = FastAPI(title=settings.app_name, default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins,
+    # Starlette only tests `origin in allow_origins`, so a frozenset makes the check O(1).
+    allow_origins=frozenset(settings.cors_origins),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -29,10 +43,111 @@ app.add_middleware(
 app.include_router(api_router, prefix=settings.api_prefix)
 
 
+# Scheduler bootstrap retries back off exponentially up to the cap and never give up; after
+# SCHEDULE_READY_AFTER_FAILURES failed attempts readiness stops gating on it and reports degraded.
+SCHEDULE_RETRY_BASE_SECONDS = 1.0
+SCHEDULE_RETRY_MAX_SECONDS = 60.0
+SCHEDULE_READY_AFTER_FAILURES = 3
+
+
+def _log_schedule_failure(task: asyncio.Task[None]) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Scheduler bootstrap failed", exc_info=task.exception())
+
+
+async def _bootstrap_schedules() -> None:
+    """Register scheduled jobs, retrying transient failures (e.g. Redis down) with backoff."""
+    failures = 0
+    while True:
+        try:
+            await asyncio.to_thread(ensure_schedules)
+        except Exception:  # noqa: BLE001 - any failure is retried; readiness reports it meanwhile
+            failures += 1
+            app.state.schedule_failures = failures
+            delay = min(SCHEDULE_RETRY_BASE_SECONDS * 2 ** (failures - 1), SCHEDULE_RETRY_MAX_SECONDS)
+            logger.warning("Scheduler bootstrap attempt %d failed; retrying in %.0fs", failures, delay, exc_info=True)
+            await asyncio.sleep(delay)
+        else:
+            app.state.schedule_failures = 0
+            return
+
+
 @app.on_event("startup")
 async def _register_schedules() -> None:
-    """Register scheduled jobs on startup."""
-    ensure_schedules()
+    """Register scheduled jobs in the background so startup does not wait on Redis round-trips."""
+    # Kept on app.state so the task is not garbage collected and readiness can inspect it.
+    app.state.schedule_failures = 0
+    task = asyncio.create_task(_bootstrap_schedules())
+    task.add_done_callback(_log_schedule_failure)
+    app.state.schedule_task = task
+
+
+@app.on_event("startup")
+async def _seed_ingestion_circuits() -> None:
+    """Adopt shared circuit state in the background so requests never wait on Redis for it."""
+    app.state.circuit_seed_task = asyncio.create_task(ingestion_monitor.seed_circuits(registered_sources()))
+
+
+@app.on_event("startup")
+async def _probe_password_hash_cost() -> None:
+    """Log a warning when the configured bcrypt cost misses the verify-time budget (off the event loop)."""
+    await asyncio.to_thread(check_password_hash_cost)
+
+
+@app.on_event("shutdown")
+async def _close_http_client() -> None:
+    """Release pooled connections to external APIs."""
+    await close_http_client()
+
+
+# Pre-encoded body for liveness and anonymous readiness probes. Responses are built per request because
+# Starlette hands `raw_headers` to middleware by reference, so a shared Response would accumulate headers.
+_HEALTH_OK_BODY = json_utils.dumps({"status": "ok"})
+
+_EMPTY: dict[str, Any] = {}  # shared stand-in for missing snapshot sections; never mutated
+
+# (expires_at monotonic seconds, summarized telemetry) shared by every detailed /health/ready caller.
+_telemetry_cache: tuple[float, dict[str, Any]] | None = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _CircuitOpenIssue:
+    source: str
+    reason: str = "circuit_open"
+    remaining_cooldown: float
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _LastErrorIssue:
+    source: str
+    operation: str
+    reason: str = "last_error"
+    error: str
+
+
+@dataclass(frozen=True, slots=True)
+class _RepeatedFailure:
+    operation: str
+    failed: int
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _RepeatedFailureIssue:
+    source: str
+    reason: str = "repeated_failures"
+    operation: str
+    failed: int
+
+
+@dataclass(frozen=True, slots=True)
+class _SourceHealth:
+    state: str
+    circuit_open: bool
+    circuit: dict[str, Any]
+    operations: dict[str, Any]
+    failure_total: int
+    last_error: str | None
+    repeated_failure: _RepeatedFailure | None
 
 
 def _summarize_ingestion(snapshot: dict[str, Any]) -> dict[str, Any]:
@@ -41,91 +156,137 @@ def _summarize_ingestion(snapshot: dict[str, Any]) -> dict[str, Any]:
     Implementation notes:
     - Treat open circuits and repeated failures as degraded signals.
     - Preserve per-operation errors to aid ops troubleshooting.
+    - Entries are slotted dataclasses; orjson encodes them as objects with the same keys as before.
     """
-    issues: list[dict[str, Any]] = []
-    sources: dict[str, Any] = {}
+    issues: list[Any] = []
+    add_issue = issues.append
+    sources: dict[str, _SourceHealth] = {}
     for source, payload in snapshot.items():
-        circuit = payload.get("circuit", {})
-        remaining = float(circuit.get("remaining_cooldown") or 0.0)
-        state = "ok"
-        circuit_open = False
-        if remaining > 0:
-            issues.append(
-                {
-                    "source": source,
-                    "reason": "circuit_open",
-                    "remaining_cooldown": round(remaining, 2),
-                }
-            )
-            state = "degraded"
-            circuit_open = True
-        operations = payload.get("operations", {})
+        circuit = payload.get("circuit") or _EMPTY
+        operations = payload.get("operations") or _EMPTY
+        remaining = circuit.get("remaining_cooldown") or 0.0
+        circuit_open = remaining > 0
+        if circuit_open:
+            add_issue(_CircuitOpenIssue(source=source, remaining_cooldown=round(remaining, 2)))
         failure_total = 0
-        repeated_failure: dict[str, Any] | None = None
+        repeated_failure: _RepeatedFailure | None = None
         last_error: str | None = None
+        # Snapshot counters are already ints; last_error reflects the last operation reported.
         for operation, metrics in operations.items():
             last_error = metrics.get("last_error")
             if last_error:
-                issues.append(
-                    {
-                        "source": source,
-                        "operation": operation,
-                        "reason": "last_error",
-                        "error": last_error,
-                    }
-                )
-            failed_count = int(metrics.get("failed") or 0)
+                add_issue(_LastErrorIssue(source=source, operation=operation, error=last_error))
+            failed_count = metrics.get("failed") or 0
             failure_total += failed_count
             if failed_count >= 3:
-                repeated_failure = {"operation": operation, "failed": failed_count}
+                repeated_failure = _RepeatedFailure(operation, failed_count)
         if repeated_failure:
-            issues.append(
-                {
-                    "source": source,
-                    "reason": "repeated_failures",
-                    "operation": repeated_failure["operation"],
-                    "failed": repeated_failure["failed"],
-                }
+            add_issue(
+                _RepeatedFailureIssue(
+                    source=source, operation=repeated_failure.operation, failed=repeated_failure.failed
+                )
             )
-            state = "degraded"
-        elif last_error and state != "circuit_open":
-            state = "degraded"
-        sources[source] = {
-            "state": state,
-            "circuit_open": circuit_open,
-            "circuit": circuit,
-            "operations": operations,
-            "failure_total": failure_total,
-            "last_error": last_error,
-            "repeated_failure": repeated_failure,
-        }
+        sources[source] = _SourceHealth(
+            state="degraded" if circuit_open or repeated_failure or last_error else "ok",
+            circuit_open=circuit_open,
+            circuit=circuit,
+            operations=operations,
+            failure_total=failure_total,
+            last_error=last_error,
+            repeated_failure=repeated_failure,
+        )
     return {"sources": sources, "issues": issues}
 
 
-def _entry_matches(entry: str, candidate: str) -> bool:
-    """Return True if an allowlist entry matches a candidate host/IP."""
+async def _ingestion_telemetry() -> dict[str, Any]:
+    """Return summarized ingestion telemetry, reusing it for HEALTH_CACHE_TTL_SECONDS (0 disables).
+
+    The rebuild never yields to the event loop, so concurrent probes cannot stampede it and no lock is needed.
+    """
+    global _telemetry_cache
+    now = monotonic()
+    cached = _telemetry_cache
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    telemetry = _summarize_ingestion(await ingestion_monitor.snapshot())
+    ttl = settings.health_cache_ttl_seconds
+    _telemetry_cache = (now + ttl, telemetry) if ttl > 0 else None
+    return telemetry
+
+
+IPAddress = ipaddress.IPv4Address | ipaddress.IPv6Address
+IPNetwork = ipaddress.IPv4Network | ipaddress.IPv6Network
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledAllowlist:
+    """Health allowlist split by entry kind so lookups avoid per-request parsing."""
+
+    hosts: frozenset[str]
+    addresses: frozenset[IPAddress]
+    networks: dict[int, tuple[IPNetwork, ...]]
+
+
+@lru_cache(maxsize=1)
+def _compile_allowlist(entries: tuple[str, ...]) -> _CompiledAllowlist:
+    """Classify allowlist entries once: hostnames, single addresses, and CIDR networks per IP version."""
+    hosts: set[str] = set()
+    addresses: set[IPAddress] = set()
+    networks: dict[int, list[IPNetwork]] = {4: [], 6: []}
+    for entry in entries:
+        if not entry:
+            continue
+        try:
+            network = ipaddress.ip_network(entry, strict=False)
+        except ValueError:
+            hosts.add(entry.casefold())
+            continue
+        if network.num_addresses == 1:
+            addresses.add(network.network_address)
+        else:
+            networks[network.version].append(network)
+    return _CompiledAllowlist(
+        hosts=frozenset(hosts),
+        addresses=frozenset(addresses),
+        networks={version: tuple(ipaddress.collapse_addresses(nets)) for version, nets in networks.items()},
+    )
+
+
+def _candidate_allowlisted(allowlist: _CompiledAllowlist, candidate: str) -> bool:
+    """Return True if a client host/IP matches the compiled allowlist."""
     try:
-        network = ipaddress.ip_network(entry, strict=False)
-        return ipaddress.ip_address(candidate) in network
+        address = ipaddress.ip_address(candidate)
     except ValueError:
-        return entry.casefold() == candidate.casefold()
+        return candidate.casefold() in allowlist.hosts
+    if address in allowlist.addresses:
+        return True
+    return any(address in network for network in allowlist.networks[address.version])
+
+
+def _host_without_port(host_header: str) -> str:
+    """Strip the port from a Host header value, unwrapping bracketed IPv6 literals like `[::1]:8080`."""
+    if host_header.startswith("["):
+        end = host_header.find("]")
+        return host_header[1:end] if end > 0 else host_header
+    return host_header.rpartition(":")[0] or host_header
+
+
+@lru_cache(maxsize=512)
+def _allowlist_match(entries: tuple[str, ...], candidate: str) -> bool:
+    """Memoized allowlist verdict; probes arrive from a handful of hosts, and changing entries changes the key."""
+    return _candidate_allowlisted(_compile_allowlist(entries), candidate)
 
 
 def _ip_or_host_allowlisted(request: Request) -> bool:
-    """Check request client/host headers against the health allowlist."""
+    """Check the client address, then the Host header, against the health allowlist."""
     if not settings.health_allowlist:
         return False
-    client_candidates: list[str] = []
-    if request.client and request.client.host:
-        client_candidates.append(request.client.host)
+    entries = tuple(settings.health_allowlist)
+    client = request.client
+    if client and client.host and _allowlist_match(entries, client.host):
+        return True
     host_header = request.headers.get("host")
-    if host_header:
-        client_candidates.append(host_header.split(":")[0])
-    for candidate in client_candidates:
-        for entry in settings.health_allowlist:
-            if entry and _entry_matches(entry, candidate):
-                return True
-    return False
+    return bool(host_header) and _allowlist_match(entries, _host_without_port(host_header))
 
 
 def _can_view_health_detail(request: Request, current_user: User | None) -> bool:
@@ -135,14 +296,40 @@ def _can_view_health_detail(request: Request, current_user: User | None) -> bool
     return _ip_or_host_allowlisted(request)
 
 
-@app.get("/health", tags=["internal"])
-@app.get(f"{settings.api_prefix}/health", tags=["internal"])
-async def health(request: Request, current_user: User | None = Depends(get_optional_current_user)) -> dict[str, Any]:
-    """Return health status and optionally include ingestion telemetry."""
+@app.get("/health", tags=["internal"], response_class=ORJSONResponse)
+@app.get(f"{settings.api_prefix}/health", tags=["internal"], response_class=ORJSONResponse)
+async def health() -> Response:
+    """Liveness probe: the process is up and serving requests."""
+    return Response(_HEALTH_OK_BODY, media_type="application/json")
+
+
+def _schedule_status() -> str:
+    """Return "ok" once schedules are registered, "starting" during the first retries, else "degraded"."""
+    task: asyncio.Task[None] | None = getattr(app.state, "schedule_task", None)
+    if task is None:
+        return "ok"
+    if task.done():
+        return "ok" if not task.cancelled() and task.exception() is None else "degraded"
+    if getattr(app.state, "schedule_failures", 0) >= SCHEDULE_READY_AFTER_FAILURES:
+        return "degraded"
+    return "starting"
+
+
+@app.get("/health/ready", tags=["internal"], response_class=ORJSONResponse)
+@app.get(f"{settings.api_prefix}/health/ready", tags=["internal"], response_class=ORJSONResponse)
+async def health_ready(
+    request: Request, current_user: User | None = Depends(get_optional_current_user)
+) -> Response:
+    """Readiness probe; authenticated or allowlisted callers also get ingestion telemetry."""
+    schedule_status = _schedule_status()
+    if schedule_status == "starting":
+        return ORJSONResponse({"status": "starting"}, status_code=503)
     if not _can_view_health_detail(request, current_user):
-        return {"status": "ok"}
+        if schedule_status == "degraded":
+            return ORJSONResponse({"status": "degraded"})
+        return Response(_HEALTH_OK_BODY, media_type="application/json")
 
-    snapshot = await ingestion_monitor.snapshot()
-    telemetry = _summarize_ingestion(snapshot)
-    status = "ok" if not telemetry["issues"] else "degraded"
-    return {"status": status, "ingestion": telemetry}
+    telemetry = await _ingestion_telemetry()
+    status = "ok" if not telemetry["issues"] and schedule_status == "ok" else "degraded"
+    # Telemetry is plain JSON data already, so skip the jsonable_encoder walk.
+    return ORJSONResponse({"status": status, "scheduler": schedule_status, "ingestion": telemetry})
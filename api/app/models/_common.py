@@ -0,0 +1,16 @@
+"""Helpers shared by ORM model definitions."""
+
+from __future__ import annotations
+
+import enum
+from datetime import datetime, timezone
+
+
+def utcnow() -> datetime:
+    """Return a timezone-aware UTC timestamp; used as column default/onupdate."""
+    return datetime.now(timezone.utc)
+
+
+def enum_values(enum_cls: type[enum.Enum]) -> list[str]:
+    """Return an enum's values; used as `values_callable` so columns store values, not member names."""
+    return [member.value for member in enum_cls]
@@ -4,28 +4,25 @@ from __future__ import annotations
 
 import typing
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 
 from sqlalchemy import DateTime, ForeignKey, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base_class import Base
+from app.db.ids import uuid7
+from app.models._common import utcnow
 
 if typing.TYPE_CHECKING:  # pragma: no cover
     from app.models.user import User
 
 
-def utcnow() -> datetime:
-    """Return a timezone-aware UTC timestamp for token tracking."""
-    return datetime.now(timezone.utc)
-
-
 class RefreshToken(Base):
     """Refresh token record with revocation and rotation metadata."""
     __tablename__ = "refresh_tokens"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), index=True, nullable=False
     )
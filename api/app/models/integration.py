@@ -4,13 +4,15 @@ from __future__ import annotations
 
 import enum
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 
-from sqlalchemy import JSON, DateTime, Enum, ForeignKey, String, UniqueConstraint
+from sqlalchemy import JSON, CheckConstraint, DateTime, ForeignKey, Index, String, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base_class import Base
+from app.db.ids import uuid7
+from app.models._common import utcnow
 
 JSON_COMPATIBLE = JSON().with_variant(JSONB, "postgresql")
 
@@ -23,13 +25,17 @@ class IntegrationIngestStatus(str, enum.Enum):
     FAILED = "failed"
 
 
+# Status is stored as plain text (no enum coercion per row); the CHECK keeps values in the enum's set.
+_INGEST_STATUS_CHECK = "status IN ({})".format(", ".join(f"'{status.value}'" for status in IntegrationIngestStatus))
+
+
 class IntegrationWebhookToken(Base):
     """Hashed webhook token used to associate integration events to a user."""
 
     __tablename__ = "integration_webhook_tokens"
     __table_args__ = (UniqueConstraint("token_hash", name="uq_integration_webhook_token_hash"),)
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
@@ -37,7 +43,7 @@ class IntegrationWebhookToken(Base):
     token_hash: Mapped[str] = mapped_column(String(64), nullable=False)
     token_prefix: Mapped[str] = mapped_column(String(20), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False
+        DateTime(timezone=True), default=utcnow, nullable=False
     )
     last_used_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     revoked_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
@@ -49,8 +55,13 @@ class IntegrationIngestEvent(Base):
     """Inbound webhook payloads waiting to be ingested or mapped."""
 
     __tablename__ = "integration_ingest_events"
+    __table_args__ = (
+        CheckConstraint(_INGEST_STATUS_CHECK, name="ck_integration_ingest_status"),
+        # Matches the queue listing: WHERE user_id = ? AND provider = ? ORDER BY created_at DESC LIMIT n.
+        Index("ix_integration_ingest_events_user_provider_created", "user_id", "provider", "created_at"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
@@ -59,25 +70,17 @@ class IntegrationIngestEvent(Base):
     source_name: Mapped[str | None] = mapped_column(String(64))
     source_id: Mapped[str | None] = mapped_column(String(255))
     title: Mapped[str | None] = mapped_column(String(500))
-    status: Mapped[IntegrationIngestStatus] = mapped_column(
-        Enum(
-            IntegrationIngestStatus,
-            name="integration_ingest_status",
-            values_callable=lambda enum_cls: [e.value for e in enum_cls],
-        ),
-        default=IntegrationIngestStatus.PENDING,
-        nullable=False,
-    )
+    status: Mapped[str] = mapped_column(String(16), default=IntegrationIngestStatus.PENDING.value, nullable=False)
     payload: Mapped[dict | None] = mapped_column(JSON_COMPATIBLE)
     error: Mapped[str | None] = mapped_column(String(500))
     media_item_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True))
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False
+        DateTime(timezone=True), default=utcnow, nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        default=utcnow,
+        onupdate=utcnow,
         nullable=False,
     )
     processed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
@@ -14,15 +14,20 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base_class import Base
+from app.db.ids import uuid7
+from app.models._common import enum_values
 
 JSON_COMPATIBLE = JSON().with_variant(JSONB, "postgresql")
 SEARCH_VECTOR_TYPE = Text().with_variant(TSVECTOR, "postgresql")
@@ -71,10 +76,10 @@ class MediaItem(Base):
     """Canonical media record shared across sources and menus."""
     __tablename__ = "media_items"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     # Persist the enum values (lowercase) instead of names (uppercase) so they match the DB enum
     media_type: Mapped[MediaType] = mapped_column(
-        Enum(MediaType, name="media_type", values_callable=lambda enum_cls: [e.value for e in enum_cls]),
+        Enum(MediaType, name="media_type", values_callable=enum_values),
         nullable=False,
     )
     title: Mapped[str] = mapped_column(String(500), nullable=False, index=True)
@@ -85,15 +90,17 @@ class MediaItem(Base):
     canonical_url: Mapped[str | None] = mapped_column(String(1024))
     metadata_: Mapped[dict | None] = mapped_column("metadata", JSON_COMPATIBLE, default=dict)
     search_vector: Mapped[str | None] = mapped_column(SEARCH_VECTOR_TYPE)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now(), onupdate=datetime.utcnow
     )
 
-    book: Mapped["BookItem | None"] = relationship(back_populates="media_item", uselist=False)
-    movie: Mapped["MovieItem | None"] = relationship(back_populates="media_item", uselist=False)
-    game: Mapped["GameItem | None"] = relationship(back_populates="media_item", uselist=False)
-    music: Mapped["MusicItem | None"] = relationship(back_populates="media_item", uselist=False)
+    # The 1:1 extension rows are small and read with most items, so they batch-load with the parent;
+    # collections stay lazy and must be requested with an explicit selectinload.
+    book: Mapped["BookItem | None"] = relationship(back_populates="media_item", uselist=False, lazy="selectin")
+    movie: Mapped["MovieItem | None"] = relationship(back_populates="media_item", uselist=False, lazy="selectin")
+    game: Mapped["GameItem | None"] = relationship(back_populates="media_item", uselist=False, lazy="selectin")
+    music: Mapped["MusicItem | None"] = relationship(back_populates="media_item", uselist=False, lazy="selectin")
     sources: Mapped[list["MediaSource"]] = relationship(back_populates="media_item", cascade="all, delete-orphan")
     availability: Mapped[list["MediaItemAvailability"]] = relationship(
         back_populates="media_item", cascade="all, delete-orphan"
@@ -171,7 +178,7 @@ class MediaSource(Base):
     __tablename__ = "media_sources"
     __table_args__ = (UniqueConstraint("source_name", "external_id", name="uq_source_external"),)
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     media_item_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("media_items.id", ondelete="CASCADE"), nullable=False, index=True
     )
@@ -179,7 +186,7 @@ class MediaSource(Base):
     external_id: Mapped[str] = mapped_column(String(255), nullable=False)
     canonical_url: Mapped[str | None] = mapped_column(String(1024))
     raw_payload: Mapped[dict] = mapped_column(JSON_COMPATIBLE, nullable=False)
-    fetched_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+    fetched_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     media_item: Mapped[MediaItem] = relationship(back_populates="sources")
 
@@ -191,7 +198,7 @@ class MediaItemAvailability(Base):
         UniqueConstraint("media_item_id", "provider", "region", "format", name="uq_media_availability"),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     media_item_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("media_items.id", ondelete="CASCADE"), nullable=False, index=True
     )
@@ -202,16 +209,16 @@ class MediaItemAvailability(Base):
         Enum(
             AvailabilityStatus,
             name="availability_status",
-            values_callable=lambda enum_cls: [e.value for e in enum_cls],
+            values_callable=enum_values,
         ),
         nullable=False,
         default=AvailabilityStatus.UNKNOWN,
     )
     deeplink_url: Mapped[str | None] = mapped_column(String(1024))
     last_checked_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now(), onupdate=datetime.utcnow
     )
 
     media_item: Mapped[MediaItem] = relationship(back_populates="availability")
@@ -223,15 +230,17 @@ class UserItemState(Base):
     __table_args__ = (
         UniqueConstraint("user_id", "media_item_id", name="uq_user_item"),
         CheckConstraint("rating >= 0 AND rating <= 10", name="ck_rating_range"),
+        # Favorites are a small slice of each library; a partial index keeps the count probe tiny.
+        Index("ix_user_item_states_user_favorite", "user_id", postgresql_where=text("favorite")),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"))
     media_item_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("media_items.id", ondelete="CASCADE")
     )
     status: Mapped[UserItemStatus] = mapped_column(
-        Enum(UserItemStatus, name="user_item_status", values_callable=lambda enum_cls: [e.value for e in enum_cls]),
+        Enum(UserItemStatus, name="user_item_status", values_callable=enum_values),
         nullable=False,
     )
     rating: Mapped[int | None]
@@ -239,9 +248,9 @@ class UserItemState(Base):
     notes: Mapped[str | None]
     started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now(), onupdate=datetime.utcnow
     )
 
     user: Mapped["User"] = relationship(back_populates="item_states")
@@ -254,15 +263,17 @@ class UserItemLog(Base):
     __table_args__ = (
         CheckConstraint("minutes_spent >= 0", name="ck_log_minutes_spent_nonnegative"),
         CheckConstraint("progress_percent >= 0 AND progress_percent <= 100", name="ck_log_progress_range"),
+        # Timelines are read per user, newest first; matching their ORDER BY makes LIMIT a single range scan.
+        Index("ix_user_item_logs_user_logged", "user_id", text("logged_at DESC"), text("created_at DESC")),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"))
     media_item_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("media_items.id", ondelete="CASCADE")
     )
     log_type: Mapped[UserItemLogType] = mapped_column(
-        Enum(UserItemLogType, name="user_item_log_type", values_callable=lambda enum_cls: [e.value for e in enum_cls]),
+        Enum(UserItemLogType, name="user_item_log_type", values_callable=enum_values),
         nullable=False,
     )
     notes: Mapped[str | None] = mapped_column(String(2000))
@@ -270,10 +281,10 @@ class UserItemLog(Base):
     progress_percent: Mapped[int | None] = mapped_column(Integer)
     goal_target: Mapped[str | None] = mapped_column(String(255))
     goal_due_on: Mapped[date | None] = mapped_column(Date)
-    logged_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, index=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+    logged_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now(), onupdate=datetime.utcnow
     )
 
     user: Mapped["User"] = relationship(back_populates="item_logs")
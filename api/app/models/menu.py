@@ -6,12 +6,13 @@ import typing
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.orm import relationship as sa_relationship
 
 from app.db.base_class import Base
+from app.db.ids import uuid7
 
 if typing.TYPE_CHECKING:  # pragma: no cover
     from app.models.media import MediaItem
@@ -23,20 +24,21 @@ class Menu(Base):
     __tablename__ = "menus"
     __table_args__ = (UniqueConstraint("slug", name="uq_menu_slug"),)
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     owner_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"))
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(Text)
     slug: Mapped[str] = mapped_column(String(255), nullable=False, unique=True, index=True)
     is_public: Mapped[bool] = mapped_column(Boolean, default=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now(), onupdate=datetime.utcnow
     )
 
     owner: Mapped["User"] = sa_relationship(back_populates="menus")
+    # Child collections batch-load with the menu (one SELECT ... IN per collection); lineage stays lazy.
     courses: Mapped[list["Course"]] = sa_relationship(
-        back_populates="menu", cascade="all, delete-orphan", order_by="Course.position"
+        back_populates="menu", cascade="all, delete-orphan", order_by="Course.position", lazy="selectin"
     )
     forks: Mapped[list["MenuLineage"]] = sa_relationship(
         back_populates="source_menu",
@@ -52,41 +54,54 @@ class Menu(Base):
         back_populates="menu",
         cascade="all, delete-orphan",
         order_by="MenuItemPairing.created_at",
+        lazy="selectin",
     )
     share_tokens: Mapped[list["MenuShareToken"]] = sa_relationship(
         back_populates="menu",
         cascade="all, delete-orphan",
         order_by="MenuShareToken.created_at",
+        lazy="selectin",
     )
 
 
 class Course(Base):
     """Course grouping within a menu with explicit ordering and narrative intent."""
     __tablename__ = "courses"
-    __table_args__ = (UniqueConstraint("menu_id", "position", name="uq_course_position"),)
+    # Unique index (not constraint) so Postgres can INCLUDE payload columns for index-only scans.
+    __table_args__ = (
+        Index("uq_course_position", "menu_id", "position", unique=True, postgresql_include=["id", "title"]),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     menu_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("menus.id", ondelete="CASCADE"))
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(Text)
     intent: Mapped[str | None] = mapped_column(Text)
     position: Mapped[int] = mapped_column(Integer, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now(), onupdate=datetime.utcnow
     )
 
     menu: Mapped[Menu] = sa_relationship(back_populates="courses")
     items: Mapped[list["CourseItem"]] = sa_relationship(
-        back_populates="course", cascade="all, delete-orphan", order_by="CourseItem.position"
+        back_populates="course", cascade="all, delete-orphan", order_by="CourseItem.position", lazy="selectin"
     )
 
 
 class CourseItem(Base):
     """Item placement within a course with stable ordering."""
     __tablename__ = "course_items"
-    __table_args__ = (UniqueConstraint("course_id", "position", name="uq_course_items_position"),)
+    __table_args__ = (
+        Index(
+            "uq_course_items_position",
+            "course_id",
+            "position",
+            unique=True,
+            postgresql_include=["id", "media_item_id"],
+        ),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     course_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("courses.id", ondelete="CASCADE"))
     media_item_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("media_items.id", ondelete="CASCADE"), nullable=False
@@ -94,7 +109,7 @@ class CourseItem(Base):
     notes: Mapped[str | None] = mapped_column(Text)
     position: Mapped[int] = mapped_column(Integer, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now(), onupdate=datetime.utcnow
     )
 
     course: Mapped[Course] = sa_relationship(back_populates="items")
@@ -116,7 +131,7 @@ class MenuLineage(Base):
     __tablename__ = "menu_lineage"
     __table_args__ = (UniqueConstraint("source_menu_id", "forked_menu_id", name="uq_menu_lineage"),)
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     source_menu_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("menus.id", ondelete="CASCADE"), nullable=False
     )
@@ -127,7 +142,7 @@ class MenuLineage(Base):
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL")
     )
     note: Mapped[str | None] = mapped_column(Text)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     source_menu: Mapped["Menu"] = sa_relationship(
         back_populates="forks", foreign_keys=[source_menu_id]
@@ -150,7 +165,7 @@ class MenuItemPairing(Base):
         ),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     menu_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("menus.id", ondelete="CASCADE"), nullable=False
     )
@@ -162,9 +177,9 @@ class MenuItemPairing(Base):
     )
     relationship: Mapped[str | None] = mapped_column(String(120))
     note: Mapped[str | None] = mapped_column(Text)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime(timezone=True), server_default=func.now(), onupdate=datetime.utcnow
     )
 
     menu: Mapped["Menu"] = sa_relationship(back_populates="pairings")
@@ -181,7 +196,7 @@ class MenuShareToken(Base):
     __tablename__ = "menu_share_tokens"
     __table_args__ = (UniqueConstraint("token", name="uq_menu_share_token"),)
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     menu_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("menus.id", ondelete="CASCADE"), nullable=False
     )
@@ -193,7 +208,7 @@ class MenuShareToken(Base):
     revoked_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     last_accessed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     access_count: Mapped[int] = mapped_column(Integer, default=0)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     menu: Mapped["Menu"] = sa_relationship(back_populates="share_tokens")
     creator: Mapped["User | None"] = sa_relationship(foreign_keys=[created_by])
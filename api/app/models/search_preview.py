@@ -11,6 +11,7 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base_class import Base
+from app.models._common import enum_values, utcnow
 from app.models.media import JSON_COMPATIBLE, MediaType
 
 
@@ -28,7 +29,7 @@ class ExternalSearchPreview(Base):
     source_name: Mapped[str] = mapped_column(String(50), nullable=False)
     external_id: Mapped[str] = mapped_column(String(255), nullable=False)
     media_type: Mapped[MediaType] = mapped_column(
-        Enum(MediaType, name="media_type", values_callable=lambda enum_cls: [e.value for e in enum_cls]),
+        Enum(MediaType, name="media_type", values_callable=enum_values),
         nullable=False,
     )
     title: Mapped[str] = mapped_column(String(500), nullable=False)
@@ -39,7 +40,7 @@ class ExternalSearchPreview(Base):
     metadata_payload: Mapped[dict | None] = mapped_column("metadata", JSON_COMPATIBLE, default=dict)
     raw_payload: Mapped[dict[str, typing.Any]] = mapped_column(JSON_COMPATIBLE, default=dict)
     expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow)
 
     user = relationship("User", backref="external_search_previews")
 
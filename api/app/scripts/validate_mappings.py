@@ -26,11 +26,16 @@ def main() -> int:
         default=str(default_path),
         help="Path to a mapping file or directory (default: mappings/)",
     )
+    parser.add_argument(
+        "--write-cache",
+        action="store_true",
+        help="Write <name>.cache.json sidecars so later loads skip YAML parsing and validation",
+    )
     args = parser.parse_args()
     target = Path(args.path).resolve()
 
     paths = _collect_mapping_files(target)
-    errors = validate_mapping_paths(paths)
+    errors = validate_mapping_paths(paths, write_cache=args.write_cache)
     if errors:
         for error in errors:
             print(error)
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import base64
 import hashlib
-import json
 import logging
 import uuid
 from datetime import datetime, timezone
@@ -16,6 +15,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.models.credential import UserCredential
+from app.utils import json as json_utils
 
 logger = logging.getLogger("app.services.credential_vault")
 
@@ -42,7 +42,7 @@ class CredentialVault:
 
     def _encrypt(self, payload: dict[str, Any]) -> str:
         """Encrypt a payload for storage."""
-        encoded = json.dumps(payload, default=str).encode("utf-8")
+        encoded = json_utils.dumps(payload)
         return self._fernet.encrypt(encoded).decode("utf-8")
 
     def _decrypt(self, token: str) -> dict[str, Any] | None:
@@ -52,7 +52,7 @@ class CredentialVault:
         except InvalidToken:
             return None
         try:
-            return json.loads(plaintext)
+            return json_utils.loads(plaintext)
         except Exception:
             return None
 
@@ -56,7 +56,9 @@ async def record_arr_event(
 ) -> IntegrationIngestEvent:
     """Persist an Arr webhook payload as a queue entry."""
     extracted = _arr_event_to_ingest(payload)
-    status_value = IntegrationIngestStatus.PENDING if extracted["source_name"] else IntegrationIngestStatus.SKIPPED
+    status_value = (
+        IntegrationIngestStatus.PENDING.value if extracted["source_name"] else IntegrationIngestStatus.SKIPPED.value
+    )
     error = None if extracted["source_name"] else "missing_tmdb_id"
     event = IntegrationIngestEvent(
         user_id=user_id,
@@ -89,7 +91,7 @@ async def list_ingest_events(
         IntegrationIngestEvent.provider == provider,
     )
     if status_filter:
-        stmt = stmt.where(IntegrationIngestEvent.status == IntegrationIngestStatus(status_filter))
+        stmt = stmt.where(IntegrationIngestEvent.status == IntegrationIngestStatus(status_filter).value)
     stmt = stmt.order_by(desc(IntegrationIngestEvent.created_at)).limit(limit)
     result = await session.execute(stmt)
     return result.scalars().all()
@@ -109,13 +111,13 @@ async def ingest_event(
     if event.status != IntegrationIngestStatus.PENDING:
         return event
     if not event.source_name or not event.source_id:
-        event.status = IntegrationIngestStatus.SKIPPED
+        event.status = IntegrationIngestStatus.SKIPPED.value
         event.error = "missing_source_identifier"
         event.processed_at = _utcnow()
         await session.commit()
         return event
     if event.source_name not in SUPPORTED_INGEST_SOURCES:
-        event.status = IntegrationIngestStatus.SKIPPED
+        event.status = IntegrationIngestStatus.SKIPPED.value
         event.error = f"unsupported_source:{event.source_name}"
         event.processed_at = _utcnow()
         await session.commit()
@@ -129,12 +131,12 @@ async def ingest_event(
         )
     except Exception as exc:
         logger.warning("Ingest failed for event %s: %s", event.id, exc)
-        event.status = IntegrationIngestStatus.FAILED
+        event.status = IntegrationIngestStatus.FAILED.value
         event.error = str(exc)[:490]
         event.processed_at = _utcnow()
         await session.commit()
         return event
-    event.status = IntegrationIngestStatus.INGESTED
+    event.status = IntegrationIngestStatus.INGESTED.value
     event.media_item_id = media_item.id
     event.processed_at = _utcnow()
     await session.commit()
@@ -153,7 +155,7 @@ async def dismiss_event(
     event = await session.scalar(stmt)
     if not event:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Ingest event not found")
-    event.status = IntegrationIngestStatus.SKIPPED
+    event.status = IntegrationIngestStatus.SKIPPED.value
     event.processed_at = _utcnow()
     await session.commit()
     await session.refresh(event)
@@ -0,0 +1,62 @@
+"""RQ job class that stores job call data as JSON instead of pickle.
+
+Implementation notes:
+- RQ 1.2 has no pluggable serializer, so the job class overrides how the
+  (func_name, instance, args, kwargs) tuple is encoded; queues, workers, and the
+  scheduler all pass `job_class=JsonJob`.
+- Every job in `app.jobs` is a module-level function called with JSON-safe kwargs
+  (ids are passed as strings), so no bound instance is ever serialized.
+- Pickled payloads (jobs enqueued before this change) are still decoded; pickle
+  protocol 2+ always starts with 0x80, which is never valid JSON.
+- Job results and meta keep RQ's pickle encoding so return values round-trip unchanged.
+- The `scheduler` service runs `rqscheduler --job-class` with this class, so due jobs are decoded
+  as JSON there too. rq-scheduler 0.13 reads `job.enqueue_at_front` when moving a job onto its
+  queue, and RQ 1.2 never sets it on fetched jobs, so the class provides a False default.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from rq.job import UNEVALUATED, Job
+
+from app.utils import json as json_utils
+
+_PICKLE_PROTO_PREFIX = b"\x80"
+
+
+class JsonJob(Job):
+    """RQ job whose call data is encoded with orjson."""
+
+    enqueue_at_front = False
+
+    def _unpickle_data(self) -> None:
+        data = self.data
+        if data[:1] == _PICKLE_PROTO_PREFIX:
+            super()._unpickle_data()
+            return
+        self._func_name, self._instance, args, self._kwargs = json_utils.loads(data)
+        self._args = tuple(args)
+
+    @property
+    def data(self) -> bytes:
+        if self._data is UNEVALUATED:
+            if self._func_name is UNEVALUATED:
+                raise ValueError("Cannot build the job data")
+            if self._instance not in (UNEVALUATED, None):
+                raise TypeError("JsonJob cannot serialize bound-method jobs")
+            self._instance = None
+            if self._args is UNEVALUATED:
+                self._args = ()
+            if self._kwargs is UNEVALUATED:
+                self._kwargs = {}
+            self._data = json_utils.dumps((self._func_name, None, self._args, self._kwargs))
+        return self._data
+
+    @data.setter
+    def data(self, value: Any) -> None:
+        self._data = value
+        self._func_name = UNEVALUATED
+        self._instance = UNEVALUATED
+        self._args = UNEVALUATED
+        self._kwargs = UNEVALUATED
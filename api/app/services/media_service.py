@@ -7,7 +7,7 @@ Invariants:
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import re
 import unicodedata
@@ -21,11 +21,13 @@ from fastapi import HTTPException
 from sqlalchemy import and_, func, select, update
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager, selectinload
 
 from app.core.config import settings
+from app.db.loading import safe_load
 from app.ingestion import get_connector
 from app.ingestion.base import ConnectorResult
+from app.ingestion.cache import bypass_connector_cache
 from app.ingestion.observability import CircuitOpenError, ingestion_monitor
 from app.models.media import (
     BookItem,
@@ -38,6 +40,7 @@ from app.models.media import (
 )
 from app.schema.search import SearchResultItem
 from app.services import search_preview_service
+from app.utils import json as json_utils
 
 DEFAULT_EXTERNAL_SOURCES = ("google_books", "tmdb", "igdb", "lastfm")
 SEARCH_CONFIG = "english_unaccent"
@@ -81,7 +84,7 @@ def _bounded_payload(payload: dict[str, Any], max_bytes: int, *, kind: str) -> d
     if max_bytes <= 0:
         return {"truncated": True, "reason": f"{kind}_storage_disabled"}
     try:
-        encoded = json.dumps(payload, default=str).encode("utf-8")
+        encoded = json_utils.dumps(payload)
         size_bytes = len(encoded)
     except Exception:
         return {"truncated": True, "reason": f"{kind}_serialization_error"}
@@ -135,7 +138,7 @@ def build_dedupe_key_from_result(result: ConnectorResult) -> DedupeKey:
 
 @dataclass(slots=True)
 class ExternalSourceTiming:
-    """Timing metadata for external connector calls."""
+    """Timing metadata for external connector calls (`fetch_ms` sums successful per-hit fetches)."""
     search_ms: float | None = None
     fetch_ms: float = 0.0
 
@@ -201,10 +204,6 @@ async def get_media_with_sources(session: AsyncSession, media_id: uuid.UUID) ->
         select(MediaItem)
         .options(
             selectinload(MediaItem.sources),
-            selectinload(MediaItem.book),
-            selectinload(MediaItem.movie),
-            selectinload(MediaItem.game),
-            selectinload(MediaItem.music),
         )
         .where(MediaItem.id == media_id)
     )
@@ -246,6 +245,14 @@ async def search_media(
             .outerjoin(MovieItem, MovieItem.media_item_id == MediaItem.id)
             .outerjoin(GameItem, GameItem.media_item_id == MediaItem.id)
             .outerjoin(MusicItem, MusicItem.media_item_id == MediaItem.id)
+            .options(
+                *safe_load(
+                    contains_eager(MediaItem.book),
+                    contains_eager(MediaItem.movie),
+                    contains_eager(MediaItem.game),
+                    contains_eager(MediaItem.music),
+                )
+            )
         )
         if media_type_list:
             stmt = stmt.where(MediaItem.media_type.in_(media_type_list))
@@ -310,7 +317,12 @@ async def search_media(
         rank = func.ts_rank_cd(MediaItem.search_vector, ts_query).label("rank")
         # Window count avoids a second round-trip; if deep pagination needs tuning, skip this when offset > 0.
         total_count = func.count().over().label("total_count")
-        stmt = select(MediaItem, total_count, rank).where(MediaItem.search_vector.op("@@")(ts_query))
+        stmt = (
+            select(MediaItem, total_count, rank)
+            # Results only render base columns; skip the default extension loads on this hot path.
+            .options(*safe_load())
+            .where(MediaItem.search_vector.op("@@")(ts_query))
+        )
         if media_type_list:
             stmt = stmt.where(MediaItem.media_type.in_(media_type_list))
         return stmt.order_by(rank.desc(), func.lower(MediaItem.title), MediaItem.id).offset(offset).limit(limit)
@@ -359,6 +371,7 @@ async def search_external_sources(
 
     Implementation notes:
     - External calls are circuit-breaker gated per source.
+    - Sources are searched concurrently, each within EXTERNAL_SEARCH_SOURCE_TIMEOUT_SECONDS.
     - Deduplication prefers canonical URLs, then title/date keys.
     """
     normalized_sources: list[str] = []
@@ -382,53 +395,75 @@ async def search_external_sources(
     timings: dict[str, ExternalSourceTiming] = {
         source: ExternalSourceTiming() for source in normalized_sources
     }
-    for source in normalized_sources:
-        try:
-            connector = get_connector(source)
-        except ValueError:
-            continue
-        if not ingestion_monitor.allow_call(source):
-            await ingestion_monitor.record_skip(source, "search", reason="circuit_open", context={"query": query})
-            continue
+    async def _collect(source: str, connector: Any) -> list[ConnectorResult]:
+        """Run one source's `search_full` with per-hit fetches tracked; failures yield no results."""
         search_start = monotonic()
-        try:
-            identifiers = await ingestion_monitor.track(
-                source,
-                "search",
-                lambda: connector.search(query, limit=per_source),
-                context={"query": query},
-            )
-        except CircuitOpenError:
-            continue
-        except Exception:
-            continue
-        timings[source].search_ms = (monotonic() - search_start) * 1000
-        seen_ids: set[str] = set()
-        for identifier in identifiers[:per_source]:
-            if not identifier or identifier in seen_ids:
-                continue
-            seen_ids.add(identifier)
+        fetch_started: list[float] = []
+
+        async def _fetch_hit(identifier: str) -> ConnectorResult | None:
+            fetch_start = monotonic()
+            fetch_started.append(fetch_start)
             if not ingestion_monitor.allow_call(source):
                 await ingestion_monitor.record_skip(
-                    source,
-                    "fetch",
-                    reason="circuit_open",
-                    context={"identifier": identifier},
+                    source, "fetch", reason="circuit_open", context={"identifier": identifier}
                 )
-                continue
+                return None
             try:
-                fetch_start = monotonic()
                 result = await ingestion_monitor.track(
                     source,
                     "fetch",
-                    lambda ident=identifier: connector.fetch(ident),
+                    lambda: connector.fetch(identifier),
                     context={"identifier": identifier},
                 )
-            except CircuitOpenError:
-                continue
-            except Exception:
-                continue
+            except Exception:  # noqa: BLE001 - includes CircuitOpenError; already tracked
+                return None
             timings[source].fetch_ms += (monotonic() - fetch_start) * 1000
+            return result
+
+        try:
+            fetched = await ingestion_monitor.track(
+                source,
+                "search",
+                lambda: connector.search_full(query, limit=per_source, fetch=_fetch_hit),
+                context={"query": query},
+            )
+        except Exception:  # noqa: BLE001 - includes CircuitOpenError
+            return []
+        # The search phase ends when the first per-hit fetch starts (sources overriding
+        # search_full never call the hook, so their whole call counts as search time).
+        search_end = min(fetch_started, default=monotonic())
+        timings[source].search_ms = (search_end - search_start) * 1000
+        return fetched[:per_source]
+
+    async def _collect_within_budget(source: str, connector: Any) -> list[ConnectorResult]:
+        budget = settings.external_search_source_timeout_seconds
+        if budget <= 0:
+            return await _collect(source, connector)
+        try:
+            return await asyncio.wait_for(_collect(source, connector), timeout=budget)
+        except asyncio.TimeoutError:
+            await ingestion_monitor.record_skip(
+                source, "search", reason="timeout", context={"query": query, "budget_seconds": budget}
+            )
+            return []
+
+    active_sources: list[str] = []
+    collectors = []
+    for source in normalized_sources:
+        try:
+            connector = get_connector(source)
+        except ValueError:
+            continue
+        if not ingestion_monitor.allow_call(source):
+            await ingestion_monitor.record_skip(source, "search", reason="circuit_open", context={"query": query})
+            continue
+        active_sources.append(source)
+        collectors.append(_collect_within_budget(source, connector))
+    # Sources are queried concurrently; results are merged in source order so dedupe stays deterministic
+    # and the (non-concurrent) DB session is only touched sequentially below.
+    collected = await asyncio.gather(*collectors)
+    for source, fetched in zip(active_sources, collected):
+        for result in fetched:
             if allowed_media_types and result.media_type not in allowed_media_types:
                 continue
             dedupe_key = build_dedupe_key_from_result(result)
@@ -485,12 +520,13 @@ async def ingest_from_source(
         )
         raise HTTPException(status_code=503, detail=f"{source} temporarily unavailable")
     try:
-        result = await ingestion_monitor.track(
-            source,
-            "fetch",
-            lambda: connector.fetch(identifier),
-            context={"identifier": identifier, "force_refresh": force_refresh},
-        )
+        with bypass_connector_cache(force_refresh):
+            result = await ingestion_monitor.track(
+                source,
+                "fetch",
+                lambda: connector.fetch(identifier),
+                context={"identifier": identifier, "force_refresh": force_refresh},
+            )
     except CircuitOpenError as exc:
         raise HTTPException(status_code=503, detail=f"{source} temporarily unavailable") from exc
     return await upsert_media(session, result, force_refresh=force_refresh)
@@ -10,8 +10,10 @@ from fastapi import HTTPException, status
 from sqlalchemy import case, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.core.config import settings
+from app.db.loading import safe_load
 from app.models.media import MediaItem
 from app.models.menu import Course, CourseItem, Menu, MenuItemPairing, MenuLineage, MenuShareToken
 from app.models.search_preview import ExternalSearchPreview
@@ -50,7 +52,7 @@ async def list_menus_for_user(session: AsyncSession, user_id: uuid.UUID) -> list
     result = await session.execute(
         select(Menu)
         .execution_options(populate_existing=True)
-        .options(*_menu_load_options())
+        .options(*safe_load(*_menu_load_options()))
         .where(Menu.owner_id == user_id)
     )
     return result.scalars().all()
@@ -78,7 +80,7 @@ async def get_menu_by_slug(session: AsyncSession, slug: str) -> Menu | None:
     result = await session.execute(
         select(Menu)
         .execution_options(populate_existing=True)
-        .options(*_menu_load_options())
+        .options(*safe_load(*_menu_load_options()))
         .where(Menu.slug == slug, Menu.is_public.is_(True))
     )
     return result.scalar_one_or_none()
@@ -511,9 +513,21 @@ async def get_menu_by_share_token(
     if share_token.expires_at and _to_utc(share_token.expires_at) < now:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Share link expired")
 
-    share_token.last_accessed_at = now
-    share_token.access_count = (share_token.access_count or 0) + 1
+    # Increment in SQL so concurrent opens of the same link never lose a count.
+    access = await session.execute(
+        update(MenuShareToken)
+        .where(MenuShareToken.id == share_token.id)
+        .values(
+            access_count=func.coalesce(MenuShareToken.access_count, 0) + 1,
+            last_accessed_at=now,
+        )
+        .returning(MenuShareToken.access_count)
+        .execution_options(synchronize_session=False)
+    )
+    access_count = access.scalar_one()
     await session.commit()
+    set_committed_value(share_token, "access_count", access_count)
+    set_committed_value(share_token, "last_accessed_at", now)
 
     menu = await _load_menu_with_children(session, share_token.menu_id)
     return menu, share_token
@@ -533,7 +547,7 @@ async def get_menu_lineage_summary(
     source_menu = None
     source_note = None
     if source_link:
-        source_menu = await session.get(Menu, source_link.source_menu_id)
+        source_menu = await session.get(Menu, source_link.source_menu_id, options=safe_load())
         if source_menu and (include_private or source_menu.is_public):
             source_note = source_link.note
         else:
@@ -542,6 +556,7 @@ async def get_menu_lineage_summary(
     forks_query = (
         select(Menu)
         .join(MenuLineage, MenuLineage.forked_menu_id == Menu.id)
+        .options(*safe_load())
         .where(MenuLineage.source_menu_id == menu_id)
         .order_by(Menu.created_at.desc())
     )
@@ -614,7 +629,7 @@ async def _generate_share_token(session: AsyncSession) -> str:
 
 async def _slug_exists(session: AsyncSession, slug: str) -> bool:
     """Return True if a menu slug already exists."""
-    result = await session.execute(select(Menu).where(Menu.slug == slug))
+    result = await session.execute(select(Menu.id).where(Menu.slug == slug))
     return result.scalar_one_or_none() is not None
 
 
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import math
 import uuid
 from datetime import datetime, timedelta, timezone
@@ -15,6 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
 from app.ingestion.base import ConnectorResult
 from app.models.search_preview import ExternalSearchPreview, UserExternalSearchQuota
+from app.utils import json as json_utils
 
 
 def _utcnow() -> datetime:
@@ -49,7 +49,7 @@ def _bounded_payload(payload: dict[str, Any], max_bytes: int) -> dict[str, Any]:
     if max_bytes <= 0:
         return {"truncated": True, "reason": "disabled"}
     try:
-        encoded = json.dumps(payload, default=str).encode("utf-8")
+        encoded = json_utils.dumps(payload)
         size_bytes = len(encoded)
     except Exception:
         return {"truncated": True, "reason": "serialization_error"}
@@ -10,11 +10,12 @@ from urllib.parse import urlencode
 
 import httpx
 from fastapi import HTTPException, status
-from jose import JWTError, jwt
+from jwt import InvalidTokenError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.security import decode_jwt, encode_jwt
 from app.ingestion.base import ConnectorResult
 from app.ingestion.http import ExternalAPIError
 from app.models.credential import UserCredential
@@ -59,14 +60,14 @@ def build_state_token(user_id: uuid.UUID) -> str:
         "iat": int(now.timestamp()),
         "exp": int((now + timedelta(minutes=10)).timestamp()),
     }
-    return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    return encode_jwt(payload)
 
 
 def decode_state_token(token: str) -> uuid.UUID:
     """Validate a Spotify OAuth state token."""
     try:
-        payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
-    except JWTError as exc:
+        payload = decode_jwt(token)
+    except InvalidTokenError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid state token") from exc
     if payload.get("type") != "spotify_state" or not payload.get("sub"):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid state token")
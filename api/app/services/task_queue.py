@@ -22,6 +22,7 @@ from rq_scheduler import Scheduler
 
 from app.core.config import settings
 from app.services.credential_vault import credential_vault
+from app.services.job_serialization import JsonJob
 from app.utils.redaction import redact_secrets
 
 logger = logging.getLogger("app.services.task_queue")
@@ -82,7 +83,7 @@ class TaskQueue:
         if not self._connection:
             raise RuntimeError("Queue connection not initialized")
         target = queue_name or (self.queue_names[0] if self.queue_names else "default")
-        return Queue(target, connection=self._connection)
+        return Queue(target, connection=self._connection, job_class=JsonJob)
 
     async def enqueue_webhook_event(
         self,
@@ -206,7 +207,7 @@ class TaskQueue:
 
         queues: list[dict[str, Any]] = []
         for name in self.queue_names:
-            queue = Queue(name, connection=self._connection)
+            queue = Queue(name, connection=self._connection, job_class=JsonJob)
             queues.append(
                 {
                     "name": name,
@@ -240,7 +241,7 @@ class TaskQueue:
 
         scheduler_summary: dict[str, Any] = {}
         try:
-            scheduler = Scheduler(connection=self._connection, queue_name=self.queue_names[0])
+            scheduler = Scheduler(connection=self._connection, queue_name=self.queue_names[0], job_class=JsonJob)
             scheduler_summary["scheduled_jobs"] = len(scheduler.get_jobs())
             scheduler_summary["healthy"] = True
         except Exception:  # pragma: no cover - redis specific
@@ -116,9 +116,10 @@ async def _build_profile_payload(session: AsyncSession, user_id: uuid.UUID) -> d
     )
 
     favorite_count = await session.execute(
-        select(func.count(UserItemState.id)).where(
+        # Bare `favorite` predicate and count(*) match ix_user_item_states_user_favorite for an index-only scan.
+        select(func.count()).where(
             UserItemState.user_id == user_id,
-            UserItemState.favorite.is_(True),
+            UserItemState.favorite,
         )
     )
 
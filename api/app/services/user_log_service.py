@@ -10,6 +10,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.db.loading import safe_load
 from app.models.media import MediaItem, UserItemLog, UserItemLogType, UserItemState, UserItemStatus
 from app.schema.media import UserItemLogCreate, UserItemLogUpdate
 
@@ -53,13 +54,15 @@ async def get_log(session: AsyncSession, user_id: uuid.UUID, log_id: uuid.UUID)
 
 async def create_log(session: AsyncSession, user_id: uuid.UUID, payload: UserItemLogCreate) -> UserItemLog:
     """Create a log entry and update state when appropriate."""
-    media = await session.get(MediaItem, payload.media_item_id)
+    # Only base columns are serialized with the log, so skip the extension loads.
+    media = await session.get(MediaItem, payload.media_item_id, options=safe_load())
     if not media:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Media item not found")
 
     log = UserItemLog(
         user_id=user_id,
         media_item_id=payload.media_item_id,
+        media_item=media,
         log_type=payload.log_type,
         notes=payload.notes,
         minutes_spent=payload.minutes_spent,
@@ -71,7 +74,7 @@ async def create_log(session: AsyncSession, user_id: uuid.UUID, payload: UserIte
     session.add(log)
     await _sync_state_from_log(session, user_id, log)
     await session.commit()
-    await session.refresh(log)
+    # Server-default timestamps come back via INSERT ... RETURNING, so no refresh round trip is needed.
     return log
 
 
@@ -8,7 +8,7 @@ from fastapi import HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash_async, verify_password_async
 from app.models.user import User
 
 
@@ -33,7 +33,8 @@ async def create_user(session: AsyncSession, email: str, password: str, display_
     existing = await get_user_by_email(session, email)
     if existing:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered")
-    user = User(email=email.lower(), hashed_password=get_password_hash(password), display_name=display_name)
+    hashed_password = await get_password_hash_async(password)
+    user = User(email=email.lower(), hashed_password=hashed_password, display_name=display_name)
     session.add(user)
     await session.commit()
     await session.refresh(user)
@@ -43,6 +44,6 @@ async def create_user(session: AsyncSession, email: str, password: str, display_
 async def authenticate_user(session: AsyncSession, email: str, password: str) -> User:
     """Validate credentials and return the matching user."""
     user = await get_user_by_email(session, email)
-    if not user or not verify_password(password, user.hashed_password):
+    if not user or not await verify_password_async(password, user.hashed_password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
     return user
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import uuid
 from dataclasses import dataclass, field
@@ -11,6 +10,8 @@ from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.utils import json as json_utils
+
 logger = logging.getLogger("app.services.webhooks")
 
 
@@ -27,7 +28,7 @@ class WebhookEvent:
 
 async def handle_webhook(session: AsyncSession, event: WebhookEvent) -> dict[str, Any]:
     """Normalize webhook payloads and enqueue integration ingestion."""
-    payload_bytes = len(json.dumps(event.payload, default=str).encode("utf-8"))
+    payload_bytes = len(json_utils.dumps(event.payload))
     summary = {
         "provider": event.provider,
         "event_type": event.event_type,
@@ -52,5 +53,5 @@ async def handle_webhook(session: AsyncSession, event: WebhookEvent) -> dict[str
             payload=event.payload,
         )
         summary["ingest_event_id"] = str(ingest_event.id)
-        summary["ingest_status"] = ingest_event.status.value
+        summary["ingest_status"] = ingest_event.status
     return summary
@@ -50,3 +50,4 @@ async def test_session_revoke_is_scoped_to_owner(client):
 
     forbidden = await client.post(f"/api/auth/sessions/{owner_session_id}/revoke")
     assert forbidden.status_code == 404
+
@@ -0,0 +1,129 @@
+"""Tests for the connector response TTL cache."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.core.config import settings
+from app.ingestion import cache
+from app.ingestion.cache import bypass_connector_cache, cached_connector_call, cached_connector_search
+
+
+class _CountingConnector:
+    source_name = "counting"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @cached_connector_call
+    async def fetch(self, identifier: str) -> list[str]:
+        self.calls += 1
+        if identifier == "boom":
+            raise RuntimeError("upstream down")
+        return [identifier, str(self.calls)]
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "connector_cache_ttl_seconds", 60)
+    cache.clear_connector_cache()
+    yield
+    cache.clear_connector_cache()
+
+
+@pytest.mark.asyncio
+async def test_cached_connector_call_reuses_results_until_bypassed() -> None:
+    connector = _CountingConnector()
+
+    first = await connector.fetch("movie:603")
+    first.append("mutated")
+    assert await connector.fetch("movie:603") == ["movie:603", "1"]
+    assert connector.calls == 1
+
+    with bypass_connector_cache():
+        assert await connector.fetch("movie:603") == ["movie:603", "2"]
+    assert await connector.fetch("movie:603") == ["movie:603", "2"]
+
+
+@pytest.mark.asyncio
+async def test_cached_connector_call_skips_failures_and_disabled_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    connector = _CountingConnector()
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            await connector.fetch("boom")
+    assert connector.calls == 2
+
+    monkeypatch.setattr(settings, "connector_cache_ttl_seconds", 0)
+    await connector.fetch("movie:1")
+    await connector.fetch("movie:1")
+    assert connector.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_cached_connector_call_coalesces_concurrent_requests(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "connector_cache_ttl_seconds", 0)
+    release = asyncio.Event()
+
+    class _SlowConnector(_CountingConnector):
+        @cached_connector_call
+        async def fetch(self, identifier: str) -> list[str]:
+            self.calls += 1
+            await release.wait()
+            return [identifier]
+
+    connector = _SlowConnector()
+    pending = asyncio.gather(*(connector.fetch("movie:603") for _ in range(5)))
+    await asyncio.sleep(0)
+    release.set()
+    results = await pending
+
+    assert connector.calls == 1
+    assert results == [["movie:603"]] * 5
+    assert results[0] is not results[1]
+    assert cache._INFLIGHT == {}
+
+
+@pytest.mark.asyncio
+async def test_cached_connector_call_isolates_nested_values_and_instances() -> None:
+    class _NestedConnector(_CountingConnector):
+        def __init__(self, token: str) -> None:
+            super().__init__()
+            self.token = token
+
+        @cached_connector_call
+        async def fetch(self, identifier: str) -> dict[str, dict[str, str]]:
+            self.calls += 1
+            return {"metadata": {"token": self.token}}
+
+    first = _NestedConnector("a")
+    first_result = await first.fetch("movie:603")
+    first_result["metadata"]["token"] = "mutated"
+    assert await first.fetch("movie:603") == {"metadata": {"token": "a"}}
+    assert first.calls == 1
+
+    other = _NestedConnector("b")
+    assert await other.fetch("movie:603") == {"metadata": {"token": "b"}}
+    assert other.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_connector_search_uses_search_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    class _SearchingConnector(_CountingConnector):
+        @cached_connector_search
+        async def search(self, query: str) -> list[str]:
+            self.calls += 1
+            return [query]
+
+    connector = _SearchingConnector()
+    monkeypatch.setattr(settings, "connector_search_cache_ttl_seconds", 0)
+    await connector.search("dune")
+    await connector.search("dune")
+    assert connector.calls == 2
+
+    monkeypatch.setattr(settings, "connector_search_cache_ttl_seconds", 60)
+    await connector.search("dune")
+    await connector.search("dune")
+    assert connector.calls == 3
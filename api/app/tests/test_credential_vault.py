@@ -51,3 +51,23 @@ async def test_credential_vault_respects_expiry_and_clear(session):
     await credential_vault.clear_on_failure(session, user_id=user.id, provider="arr", error="expired")
     cleared = await credential_vault.get_secret(session, user_id=user.id, provider="arr", allow_expired=True)
     assert cleared is None
+
+
+@pytest.mark.asyncio
+async def test_credential_timestamps_load_as_utc(session):
+    user = User(email="utc@example.com", hashed_password="pw")
+    session.add(user)
+    await session.commit()
+    await session.refresh(user)
+
+    credential = await credential_vault.store_secret(
+        session,
+        user_id=user.id,
+        provider="spotify",
+        secret_payload={"access_token": "abc123"},
+        expires_at=datetime(2030, 1, 1, 12, 0),
+    )
+
+    for value in (credential.expires_at, credential.rotated_at, credential.created_at, credential.updated_at):
+        assert value.utcoffset() == timedelta(0)
+    assert credential.expires_at == datetime(2030, 1, 1, 12, 0, tzinfo=timezone.utc)
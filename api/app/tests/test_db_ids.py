@@ -0,0 +1,23 @@
+"""Tests for time-ordered primary key generation."""
+
+from __future__ import annotations
+
+import time
+import uuid
+
+from app.db.ids import uuid7
+
+
+def test_uuid7_sets_version_and_variant():
+    value = uuid7()
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_uuid7_embeds_timestamp_and_sorts_by_creation():
+    before_ms = time.time_ns() // 1_000_000
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+    assert first.int >> 80 >= before_ms
+    assert first < second
@@ -0,0 +1,31 @@
+"""Tests for the raiseload guardrail used on read-only query paths."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import selectinload
+
+from app.db.loading import safe_load
+from app.models.media import MediaItem, MediaType
+
+
+@pytest.mark.asyncio
+async def test_safe_load_raises_on_unrequested_relationships(session):
+    media = MediaItem(title="Guarded Load", media_type=MediaType.BOOK)
+    session.add(media)
+    await session.commit()
+    session.expunge_all()
+
+    result = await session.execute(
+        select(MediaItem)
+        .options(*safe_load(selectinload(MediaItem.sources), selectinload(MediaItem.tag_links)))
+        .where(MediaItem.id == media.id)
+    )
+    loaded = result.scalar_one()
+
+    assert loaded.sources == []
+    assert loaded.tag_links == []
+    with pytest.raises(InvalidRequestError):
+        _ = loaded.user_states
@@ -0,0 +1,48 @@
+"""Connector tests for Google Books search normalization."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from app.ingestion.google_books import GoogleBooksConnector
+from app.models.media import MediaType
+
+
+@pytest.mark.asyncio
+async def test_google_books_search_full_uses_embedded_volume_info(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[tuple[str, dict[str, Any] | None]] = []
+
+    async def _fake_fetch_json(url: str, *, params: dict[str, Any] | None = None, **kwargs: Any) -> dict:
+        calls.append((url, params))
+        return {
+            "items": [
+                {
+                    "id": "vol-1",
+                    "selfLink": "https://www.googleapis.com/books/v1/volumes/vol-1",
+                    "volumeInfo": {
+                        "title": "Batched Book",
+                        "authors": ["A. Writer"],
+                        "publishedDate": "2020-05-01",
+                        "industryIdentifiers": [{"type": "ISBN_13", "identifier": "9780000000001"}],
+                        "imageLinks": {"thumbnail": "https://img/vol-1"},
+                    },
+                },
+                {"volumeInfo": {"title": "Missing id"}},
+            ]
+        }
+
+    monkeypatch.setattr("app.ingestion.google_books.fetch_json", _fake_fetch_json)
+    connector = GoogleBooksConnector(api_key="key")
+
+    results = await connector.search_full("batched", limit=2)
+
+    assert len(calls) == 1
+    assert calls[0][1] == {"q": "batched", "maxResults": 2, "key": "key"}
+    assert [result.source_id for result in results] == ["vol-1"]
+    result = results[0]
+    assert result.media_type == MediaType.BOOK
+    assert result.title == "Batched Book"
+    assert result.cover_image_url == "https://img/vol-1"
+    assert result.extensions["book"]["isbn_13"] == "9780000000001"
@@ -9,6 +9,11 @@ import pytest
 from app.core.config import settings
 
 
+@pytest.fixture(autouse=True)
+def _fresh_health_telemetry(monkeypatch):
+    monkeypatch.setattr("app.main._telemetry_cache", None)
+
+
 async def _authenticate_health_user(client):
     suffix = uuid.uuid4().hex[:8]
     creds = {
@@ -36,7 +41,7 @@ async def test_health_reports_ok_without_auth(client, monkeypatch):
 
     monkeypatch.setattr("app.main.ingestion_monitor.snapshot", _snapshot_stub)
 
-    response = await client.get("/api/health")
+    response = await client.get("/api/health/ready")
     assert response.status_code == 200
     payload = response.json()
     assert payload["status"] == "ok"
@@ -52,7 +57,7 @@ async def test_health_reports_ok_for_authenticated_users(client, monkeypatch):
     monkeypatch.setattr("app.main.ingestion_monitor.snapshot", _snapshot_stub)
     await _authenticate_health_user(client)
 
-    response = await client.get("/api/health")
+    response = await client.get("/api/health/ready")
     assert response.status_code == 200
     payload = response.json()
     assert payload["status"] == "ok"
@@ -88,7 +93,7 @@ async def test_health_degrades_for_authenticated_users(client, monkeypatch):
     monkeypatch.setattr("app.main.ingestion_monitor.snapshot", _snapshot_stub)
     await _authenticate_health_user(client)
 
-    response = await client.get("/health")
+    response = await client.get("/health/ready")
     assert response.status_code == 200
     payload = response.json()
     assert payload["status"] == "degraded"
@@ -107,7 +112,7 @@ async def test_health_allows_allowlisted_clients_without_auth(client, monkeypatc
     monkeypatch.setattr("app.main.ingestion_monitor.snapshot", _snapshot_stub)
     monkeypatch.setattr(settings, "health_allowlist", ["testserver"])
 
-    response = await client.get("/health")
+    response = await client.get("/health/ready")
     assert response.status_code == 200
     payload = response.json()
     assert payload["status"] == "ok"
@@ -142,10 +147,155 @@ async def test_health_flags_repeated_failures(client, monkeypatch):
     monkeypatch.setattr("app.main.ingestion_monitor.snapshot", _snapshot_stub)
     await _authenticate_health_user(client)
 
-    response = await client.get("/api/health")
+    response = await client.get("/api/health/ready")
     assert response.status_code == 200
     payload = response.json()
     assert payload["status"] == "degraded"
     issues = payload["ingestion"]["issues"]
     assert any(issue["reason"] == "repeated_failures" for issue in issues)
     assert payload["ingestion"]["sources"]["lastfm"]["state"] == "degraded"
+
+
+def test_health_allowlist_matches_hosts_addresses_and_networks():
+    from app.main import _candidate_allowlisted, _compile_allowlist
+
+    allowlist = _compile_allowlist(("Probe.Internal", "10.0.0.5", "192.168.0.0/16", "fd00::/8", ""))
+    assert _candidate_allowlisted(allowlist, "probe.internal")
+    assert _candidate_allowlisted(allowlist, "10.0.0.5")
+    assert _candidate_allowlisted(allowlist, "192.168.4.20")
+    assert _candidate_allowlisted(allowlist, "fd00::1")
+    assert not _candidate_allowlisted(allowlist, "10.0.0.6")
+    assert not _candidate_allowlisted(allowlist, "::ffff:10.0.0.6")
+    assert not _candidate_allowlisted(allowlist, "other.internal")
+
+
+def test_health_allowlist_decision_follows_setting_changes():
+    from app.main import _allowlist_match
+
+    assert _allowlist_match(("10.0.0.0/8",), "10.1.2.3")
+    assert not _allowlist_match(("api.internal",), "api.local")
+    assert _allowlist_match(("api.local",), "api.local")
+
+
+@pytest.mark.asyncio
+async def test_health_reuses_telemetry_within_ttl(client, monkeypatch):
+    calls = 0
+
+    async def _snapshot_stub() -> dict[str, object]:
+        nonlocal calls
+        calls += 1
+        return {}
+
+    monkeypatch.setattr("app.main.ingestion_monitor.snapshot", _snapshot_stub)
+    monkeypatch.setattr(settings, "health_allowlist", ["testserver"])
+    monkeypatch.setattr(settings, "health_cache_ttl_seconds", 60.0)
+
+    for _ in range(3):
+        response = await client.get("/health/ready")
+        assert response.json()["ingestion"]["issues"] == []
+    assert calls == 1
+
+
+def test_health_host_header_port_is_stripped():
+    from app.main import _host_without_port
+
+    assert _host_without_port("api.local") == "api.local"
+    assert _host_without_port("api.local:8080") == "api.local"
+    assert _host_without_port("[::1]:8080") == "::1"
+    assert _host_without_port("[::1]") == "::1"
+
+
+@pytest.mark.asyncio
+async def test_liveness_is_static_even_for_authenticated_users(client, monkeypatch):
+    async def _snapshot_stub() -> dict[str, object]:
+        raise AssertionError("liveness must not touch the ingestion monitor")
+
+    monkeypatch.setattr("app.main.ingestion_monitor.snapshot", _snapshot_stub)
+    await _authenticate_health_user(client)
+
+    for path in ("/health", "/api/health"):
+        response = await client.get(path)
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+
+
+@pytest.mark.asyncio
+async def test_readiness_waits_for_schedule_bootstrap(client, monkeypatch):
+    import asyncio
+
+    from app.main import app
+
+    pending: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+    monkeypatch.setattr(app.state, "schedule_task", pending, raising=False)
+
+    response = await client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json() == {"status": "starting"}
+
+    pending.set_result(None)
+    response = await client.get("/health/ready")
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_readiness_reports_degraded_while_schedule_bootstrap_keeps_failing(client, monkeypatch):
+    import asyncio
+
+    from app import main
+    from app.main import app
+
+    pending: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+    monkeypatch.setattr(app.state, "schedule_task", pending, raising=False)
+    monkeypatch.setattr(app.state, "schedule_failures", main.SCHEDULE_READY_AFTER_FAILURES, raising=False)
+
+    response = await client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json() == {"status": "degraded"}
+    pending.cancel()
+
+
+@pytest.mark.asyncio
+async def test_schedule_bootstrap_retries_transient_failures(monkeypatch):
+    from app import main
+
+    calls = 0
+
+    def flaky_ensure_schedules() -> None:
+        nonlocal calls
+        calls += 1
+        if calls < 3:
+            raise ConnectionError("redis down")
+
+    monkeypatch.setattr(main, "ensure_schedules", flaky_ensure_schedules)
+    monkeypatch.setattr(main, "SCHEDULE_RETRY_BASE_SECONDS", 0.0)
+
+    await main._bootstrap_schedules()
+
+    assert calls == 3
+    assert main.app.state.schedule_failures == 0
+
+
+@pytest.mark.asyncio
+async def test_schedule_bootstrap_retries_when_redis_is_unreachable(monkeypatch):
+    import asyncio
+
+    from app import main
+    from app.services.task_queue import task_queue
+
+    monkeypatch.setattr(settings, "environment", "production")
+    monkeypatch.setattr(settings, "redis_url", "redis://127.0.0.1:1/0")
+    monkeypatch.setattr(task_queue, "_connection", None)
+    monkeypatch.setattr(main, "SCHEDULE_RETRY_BASE_SECONDS", 0.0)
+    monkeypatch.setattr(main.app.state, "schedule_failures", 0, raising=False)
+
+    bootstrap = asyncio.create_task(main._bootstrap_schedules())
+    try:
+        for _ in range(200):
+            if main.app.state.schedule_failures >= 2:
+                break
+            await asyncio.sleep(0.01)
+        assert main.app.state.schedule_failures >= 2
+        assert not bootstrap.done()
+    finally:
+        bootstrap.cancel()
+        await asyncio.gather(bootstrap, return_exceptions=True)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections import deque
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import httpx
@@ -21,32 +21,28 @@ def _build_response(url: str, *, status: int = 200, json_data: Any | None = None
     return httpx.Response(status_code=status, json=json_data or {}, request=request)
 
 
-def _make_async_client(responses: deque[httpx.Response], call_log: list[str]) -> type[httpx.AsyncClient]:
+def _make_async_client(responses: deque[httpx.Response], call_log: list[str]) -> Any:
     class DummyAsyncClient:
         def __init__(self, *args: Any, **kwargs: Any) -> None:
             self._responses = responses
 
-        async def __aenter__(self) -> DummyAsyncClient:
-            return self
-
-        async def __aexit__(self, *args: Any) -> bool:
-            return False
-
         async def post(self, url: str, **kwargs: Any) -> httpx.Response:
             call_log.append(url)
             if not self._responses:
                 raise RuntimeError("No stub responses configured")
             return self._responses.popleft()
 
-    return DummyAsyncClient
+    return DummyAsyncClient()
 
 
 def _configure_connector(
     monkeypatch: pytest.MonkeyPatch, responses: deque[httpx.Response]
 ) -> tuple[IGDBConnector, list[str]]:
     call_log: list[str] = []
-    DummyClient = _make_async_client(responses, call_log)
-    monkeypatch.setattr("app.ingestion.igdb.httpx.AsyncClient", DummyClient)
+    dummy_client = _make_async_client(responses, call_log)
+    monkeypatch.setattr("app.ingestion.igdb.get_http_client", lambda: dummy_client)
+    monkeypatch.setattr("app.ingestion.igdb._TOKEN_CACHE", {})
+    monkeypatch.setattr("app.ingestion.shared_state._get_connection", lambda: None)
     monkeypatch.setattr(settings, "igdb_client_id", "example-id")
     monkeypatch.setattr(settings, "igdb_client_secret", "example-secret")
     connector = IGDBConnector()
@@ -118,4 +114,39 @@ async def test_igdb_fetch_retries_after_401(monkeypatch: pytest.MonkeyPatch) ->
     assert result.source_id == "42"
     assert result.source_name == "igdb"
     assert connector._access_token == "refreshed"
+    assert result.extensions["game"]["developers"] == ["House Studios"]
+    assert result.extensions["game"]["publishers"] == ["Big Publisher"]
+    assert result.metadata == {"genres": ["Action"], "platforms": ["PC"]}
     assert call_log == [TOKEN_URL, GAME_URL, TOKEN_URL, GAME_URL]
+
+
+@pytest.mark.asyncio
+async def test_igdb_token_shared_across_instances(monkeypatch: pytest.MonkeyPatch) -> None:
+    responses = deque(
+        [
+            _build_response(TOKEN_URL, json_data={"access_token": "shared", "expires_in": 300}),
+        ]
+    )
+    connector, call_log = _configure_connector(monkeypatch, responses)
+    assert await connector._ensure_token() == "shared"
+
+    sibling = IGDBConnector()
+    assert await sibling._ensure_token() == "shared"
+    assert call_log == [TOKEN_URL]
+
+
+@pytest.mark.asyncio
+async def test_igdb_token_adopted_from_shared_state(monkeypatch: pytest.MonkeyPatch) -> None:
+    connector, call_log = _configure_connector(monkeypatch, deque())
+    expires_at = (datetime.now(timezone.utc) + timedelta(minutes=5)).isoformat()
+    stored: dict[str, Any] = {}
+
+    async def _fake_get_json(key: str) -> Any:
+        stored["key"] = key
+        return {"access_token": "from-redis", "expires_at": expires_at}
+
+    monkeypatch.setattr("app.ingestion.shared_state.get_json", _fake_get_json)
+
+    assert await connector._ensure_token() == "from-redis"
+    assert stored["key"] == "igdb:token:example-id"
+    assert call_log == []
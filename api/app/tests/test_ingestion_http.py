@@ -0,0 +1,46 @@
+"""Tests for the shared external HTTP helper retry behavior."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from app.ingestion import http as ingestion_http
+from app.ingestion.http import ExternalAPIError, fetch_json
+
+
+def _install_transport(monkeypatch: pytest.MonkeyPatch, statuses: list[int]) -> list[str]:
+    calls: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        status = statuses[min(len(calls), len(statuses)) - 1]
+        return httpx.Response(status, json={"ok": status < 400})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    monkeypatch.setattr(ingestion_http, "get_http_client", lambda: client)
+
+    async def _no_sleep(_: float) -> None:
+        return None
+
+    monkeypatch.setattr(ingestion_http.asyncio, "sleep", _no_sleep)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_fetch_json_retries_server_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _install_transport(monkeypatch, [503, 502, 200])
+
+    payload = await fetch_json("https://example.test/resource")
+
+    assert payload == {"ok": True}
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_fetch_json_raises_after_final_attempt(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _install_transport(monkeypatch, [500])
+
+    with pytest.raises(ExternalAPIError):
+        await fetch_json("https://example.test/resource")
+    assert len(calls) == ingestion_http.FETCH_ATTEMPTS
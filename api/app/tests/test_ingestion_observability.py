@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import logging
+import threading
 
 import pytest
 
+from app.core.config import settings
+from app.ingestion import shared_state
 from app.ingestion.http import ExternalAPIError
-from app.ingestion.observability import CircuitOpenError, IngestionMonitor
+from app.ingestion.observability import CircuitBreakerState, CircuitOpenError, IngestionMonitor
 
 
 @pytest.mark.asyncio
@@ -29,6 +34,7 @@ async def test_ingestion_monitor_opens_circuit_after_repeated_failures() -> None
     snapshot = await monitor.snapshot()
     assert snapshot["tmdb"]["circuit"]["opened_count"] >= 1
     assert snapshot["tmdb"]["operations"]["fetch"]["failed"] == 2
+    assert snapshot["tmdb"]["operations"]["fetch"]["last_error_type"] == "ExternalAPIError"
 
     await monitor.record_skip("tmdb", "fetch", reason="circuit_open", context={"identifier": "123"})
     updated = await monitor.snapshot()
@@ -55,3 +61,115 @@ async def test_ingestion_monitor_recovers_after_cooldown_and_success() -> None:
     snapshot = await monitor.snapshot()
     assert snapshot["lastfm"]["operations"]["fetch"]["succeeded"] == 1
     assert snapshot["lastfm"]["circuit"]["failure_streak"] == 0
+
+
+@pytest.mark.asyncio
+async def test_ingestion_monitor_logs_structured_failure_payload(caplog) -> None:
+    monitor = IngestionMonitor(circuit_threshold=5)
+
+    async def failing_call() -> None:
+        raise ExternalAPIError("boom" + "!" * 1000)
+
+    with caplog.at_level(logging.WARNING, logger="app.ingestion"):
+        with pytest.raises(ExternalAPIError):
+            await monitor.track("tmdb", "search", failing_call, context={"query": "dune"})
+
+    assert len((await monitor.snapshot())["tmdb"]["operations"]["search"]["last_error"]) <= 256
+    (record,) = caplog.records
+    assert json.loads(record.getMessage())["event"] == "ingestion_failure"
+    assert record.ingestion["error"].startswith("boom!")
+    assert record.ingestion["circuit"]["failure_streak"] == 1
+
+
+def test_circuit_snapshot_reflects_state_changes() -> None:
+    circuit = CircuitBreakerState(threshold=2, base_backoff_seconds=30.0)
+    assert circuit.snapshot()["remaining_cooldown"] == 0.0
+
+    circuit.record_failure()
+    assert circuit.snapshot()["failure_streak"] == 1
+    circuit.record_failure()
+    opened = circuit.snapshot()
+    assert opened["opened_count"] == 1
+    assert 0.0 < opened["remaining_cooldown"] <= 30.0
+
+    circuit.record_success()
+    assert circuit.snapshot() == {
+        "failure_streak": 0,
+        "open_until": 0.0,
+        "current_backoff": 30.0,
+        "opened_count": 1,
+        "remaining_cooldown": 0.0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_ingestion_monitor_shares_open_circuits_across_instances(monkeypatch: pytest.MonkeyPatch) -> None:
+    store: dict[str, object] = {}
+
+    async def fake_get_json(key: str):
+        return store.get(key)
+
+    async def fake_set_json(key: str, value, ttl_seconds: int) -> None:
+        store[key] = value
+
+    monkeypatch.setattr(shared_state, "get_json", fake_get_json)
+    monkeypatch.setattr(shared_state, "set_json", fake_set_json)
+
+    async def failing_call() -> None:
+        raise ExternalAPIError("boom")
+
+    first = IngestionMonitor(circuit_threshold=1, base_backoff_seconds=60.0, persist_circuits=True)
+    with pytest.raises(ExternalAPIError):
+        await first.track("igdb", "fetch", failing_call)
+    await asyncio.sleep(0)  # publishing is fire-and-forget
+    assert store["ingestion:circuit:igdb"]["opened_count"] == 1
+
+    restarted = IngestionMonitor(circuit_threshold=1, base_backoff_seconds=60.0, persist_circuits=True)
+    await restarted.seed_circuits(["igdb"])
+    with pytest.raises(CircuitOpenError):
+        await restarted.track("igdb", "fetch", failing_call)
+    assert restarted.allow_call("igdb") is False
+
+
+@pytest.mark.asyncio
+async def test_ingestion_monitor_track_does_not_wait_on_shared_store(monkeypatch: pytest.MonkeyPatch) -> None:
+    release = asyncio.Event()
+
+    async def slow_get_json(key: str):
+        await release.wait()
+        return None
+
+    async def slow_set_json(key: str, value, ttl_seconds: int) -> None:
+        await release.wait()
+
+    monkeypatch.setattr(shared_state, "get_json", slow_get_json)
+    monkeypatch.setattr(shared_state, "set_json", slow_set_json)
+    monitor = IngestionMonitor(circuit_threshold=1, base_backoff_seconds=60.0, persist_circuits=True)
+
+    async def ok_call() -> str:
+        return "ok"
+
+    async def failing_call() -> None:
+        raise ExternalAPIError("boom")
+
+    assert await asyncio.wait_for(monitor.track("tmdb", "search", ok_call), timeout=1) == "ok"
+    with pytest.raises(ExternalAPIError):
+        await asyncio.wait_for(monitor.track("tmdb", "search", failing_call), timeout=1)
+    release.set()
+
+
+@pytest.mark.asyncio
+async def test_shared_state_connects_off_the_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    connect_threads: list[threading.Thread] = []
+
+    def fake_connect():
+        connect_threads.append(threading.current_thread())
+        return None
+
+    monkeypatch.setattr(settings, "environment", "production")
+    monkeypatch.setattr(shared_state, "_connection", None)
+    monkeypatch.setattr(shared_state, "_retry_at", 0.0)
+    monkeypatch.setattr(shared_state, "_connect", fake_connect)
+
+    assert await shared_state.get_json("ingestion:circuit:tmdb") is None
+    assert connect_threads and connect_threads[0] is not threading.main_thread()
@@ -0,0 +1,69 @@
+"""Tests for the JSON-encoded RQ job payloads."""
+
+from __future__ import annotations
+
+from rq.job import Job
+
+from app.jobs.sync import run_sync_job
+from app.services.job_serialization import JsonJob
+
+
+def _decode(data: bytes) -> JsonJob:
+    job = JsonJob(id="decoded", connection=object())
+    job.data = data
+    return job
+
+
+def test_json_job_round_trips_call_data():
+    kwargs = {"provider": "spotify", "external_id": "abc", "force_refresh": True, "requested_by": None}
+    job = JsonJob.create(run_sync_job, kwargs=kwargs, connection=object())
+
+    assert job.data.startswith(b'["app.jobs.sync.run_sync_job"')
+    decoded = _decode(job.data)
+    assert decoded.func_name == "app.jobs.sync.run_sync_job"
+    assert decoded.args == ()
+    assert decoded.kwargs == kwargs
+    assert decoded.func is run_sync_job
+
+
+def test_json_job_still_reads_pickled_payloads():
+    legacy = Job.create(run_sync_job, kwargs={"provider": "spotify", "external_id": "abc"}, connection=object())
+
+    decoded = _decode(legacy.data)
+    assert decoded.func_name == "app.jobs.sync.run_sync_job"
+    assert decoded.kwargs == {"provider": "spotify", "external_id": "abc"}
+
+
+def test_scheduler_daemon_job_class_moves_json_jobs_onto_queues(monkeypatch):
+    from rq_scheduler import Scheduler
+
+    from app.jobs.maintenance import prune_external_search_previews_job
+
+    class _Connection:
+        def __init__(self) -> None:
+            self.removed: list[str] = []
+
+        def zrem(self, key: str, member: str) -> None:
+            self.removed.append(member)
+
+    class _Queue:
+        def __init__(self) -> None:
+            self.enqueued: list[JsonJob] = []
+
+        def enqueue_job(self, job: JsonJob, at_front: bool = False) -> None:
+            self.enqueued.append(job)
+
+    connection = _Connection()
+    queue = _Queue()
+    # The class path the `scheduler` service passes to `rqscheduler --job-class`.
+    scheduler = Scheduler(connection=connection, job_class="app.services.job_serialization.JsonJob")
+    monkeypatch.setattr(scheduler, "get_queue_for_job", lambda job: queue)
+    assert scheduler.job_class is JsonJob
+
+    data = JsonJob.create(prune_external_search_previews_job, connection=object()).data
+    scheduled = scheduler.job_class(id="maintenance:prune_external_previews", connection=connection)
+    scheduled.data = data
+    scheduler.enqueue_job(scheduled)
+
+    assert [job.func_name for job in queue.enqueued] == ["app.jobs.maintenance.prune_external_search_previews_job"]
+    assert connection.removed == ["maintenance:prune_external_previews"]
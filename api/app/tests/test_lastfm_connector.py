@@ -0,0 +1,22 @@
+"""Connector tests for Last.fm identifier parsing."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.ingestion.lastfm import LastFMConnector
+
+
+@pytest.mark.parametrize(
+    ("identifier", "expected"),
+    [
+        ("Daft Punk::One More Time", ("Daft Punk", "One More Time", None)),
+        ("https://www.last.fm/music/Daft%20Punk/_/One+More+Time", ("Daft Punk", "One+More+Time", None)),
+        ("https://www.last.fm/Music/Daft+Punk/_/Aerodynamic/?ref=x", ("Daft+Punk", "Aerodynamic", None)),
+        ("https://www.last.fm/music/Daft+Punk", (None, None, None)),
+        ("https://www.last.fm/user/someone/library", (None, None, None)),
+        ("0a1b2c3d-mbid", (None, None, "0a1b2c3d-mbid")),
+    ],
+)
+def test_lastfm_parse_identifier(identifier: str, expected: tuple[str | None, str | None, str | None]) -> None:
+    assert LastFMConnector(api_key="key").parse_identifier(identifier) == expected
@@ -101,3 +101,24 @@ async def test_log_filters_and_update(client, session):
     logs = filtered.json()
     assert len(logs) == 1
     assert logs[0]["id"] == log_id
+
+
+@pytest.mark.asyncio
+async def test_create_log_response_includes_media_from_fresh_session(client, session):
+    creds = _auth_payload()
+    await client.post("/api/auth/register", json=creds)
+    await client.post("/api/auth/login", json={"email": creds["email"], "password": creds["password"]})
+
+    media = MediaItem(title="Fresh Session Book", media_type=MediaType.BOOK)
+    session.add(media)
+    await session.commit()
+    session.expunge_all()
+
+    res = await client.post(
+        "/api/me/logs",
+        json={"media_item_id": str(media.id), "log_type": "progress", "progress_percent": 40},
+    )
+    assert res.status_code == 201
+    body = res.json()
+    assert body["media_item"]["id"] == str(media.id)
+    assert body["created_at"] is not None
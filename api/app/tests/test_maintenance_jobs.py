@@ -7,6 +7,7 @@ from datetime import datetime, timedelta
 import pytest
 
 from app.core.config import settings
+from app.jobs import schedule_registry
 from app.models.media import MediaItem, MediaSource, MediaType
 from app.services import media_service
 
@@ -71,3 +72,70 @@ async def test_prune_media_source_payloads_can_be_disabled(session, monkeypatch)
     refreshed = await session.get(MediaSource, source.id)
     assert refreshed
     assert refreshed.raw_payload == {"should": "stay"}
+
+
+def test_scheduled_job_ids_uses_one_pipeline_round_trip():
+    class _Pipeline:
+        def __init__(self, scores: dict[str, float]) -> None:
+            self.scores = scores
+            self.queued: list[str] = []
+            self.executions = 0
+
+        def zscore(self, key: str, member: str) -> None:
+            self.queued.append(member)
+
+        def execute(self) -> list[float | None]:
+            self.executions += 1
+            return [self.scores.get(member) for member in self.queued]
+
+    pipeline = _Pipeline({"maintenance:prune_external_previews": 1.0})
+
+    class _Scheduler:
+        scheduled_jobs_key = "rq:scheduler:scheduled_jobs"
+
+        class connection:  # noqa: N801 - mimics the redis client attribute
+            @staticmethod
+            def pipeline(transaction: bool = True) -> _Pipeline:
+                return pipeline
+
+    existing = schedule_registry._scheduled_job_ids(
+        _Scheduler(), ["maintenance:prune_external_previews", "maintenance:refresh_availability"]
+    )
+    assert existing == {"maintenance:prune_external_previews"}
+    assert pipeline.executions == 1
+
+
+def test_ensure_schedules_raises_when_redis_read_fails(monkeypatch):
+    from redis.exceptions import ConnectionError as RedisConnectionError
+
+    class _Pipeline:
+        def zscore(self, key: str, member: str) -> None:
+            return None
+
+        def execute(self) -> list[float | None]:
+            raise RedisConnectionError("Connection refused")
+
+    class _Connection:
+        def pipeline(self, transaction: bool = True) -> _Pipeline:
+            return _Pipeline()
+
+    monkeypatch.setattr(settings, "environment", "production")
+    monkeypatch.setattr(schedule_registry.task_queue, "_connection", _Connection())
+
+    with pytest.raises(RedisConnectionError):
+        schedule_registry.ensure_schedules()
+
+
+@pytest.mark.parametrize(
+    ("job", "kwargs"),
+    [
+        ("app.jobs.automations.run_automation_rule_job", {"rule_id": ""}),
+        ("app.jobs.search.fanout_external_search_job", {"query": "dune", "user_id": ""}),
+        ("app.jobs.credentials.rotate_credential_job", {"provider": "spotify", "user_id": ""}),
+    ],
+)
+def test_jobs_reject_missing_required_ids(job, kwargs):
+    from rq.utils import import_attribute
+
+    with pytest.raises(ValueError):
+        import_attribute(job)(**kwargs)
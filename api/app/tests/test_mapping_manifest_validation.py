@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
-from app.ingestion.mapping_schema import validate_mapping_paths
+from app.ingestion import mapping_schema
+from app.ingestion.mapping_schema import (
+    MetadataMapping,
+    dump_mapping_manifest_cache,
+    load_mapping_manifest,
+    validate_mapping_paths,
+)
 
 
 def test_mapping_manifests_are_valid():
@@ -13,3 +20,87 @@ def test_mapping_manifests_are_valid():
     mapping_files = sorted(mapping_dir.glob("*.yaml"))
     errors = validate_mapping_paths(mapping_files)
     assert errors == []
+
+
+def test_mapping_manifest_cache_reloads_on_mtime_change(tmp_path: Path):
+    manifest_path = tmp_path / "example.yaml"
+    manifest_path.write_text("source: example\ncanonical:\n  media_items:\n    title: title\n", encoding="utf-8")
+
+    first = load_mapping_manifest(manifest_path)
+    assert load_mapping_manifest(manifest_path) is first
+
+    manifest_path.write_text("source: changed\ncanonical:\n  media_items:\n    title: name\n", encoding="utf-8")
+    stat = manifest_path.stat()
+    os.utime(manifest_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    reloaded = load_mapping_manifest(manifest_path)
+    assert reloaded is not first
+    assert reloaded.source == "changed"
+
+
+def test_mapping_manifest_sidecar_round_trip(tmp_path: Path, monkeypatch):
+    manifest_path = tmp_path / "sidecar.yaml"
+    manifest_path.write_text(
+        "source: sidecar\n"
+        "canonical:\n  media_items:\n    title: title\n"
+        "metadata:\n  - upstream: genre\n    stored_as: media_items.metadata.genre\n",
+        encoding="utf-8",
+    )
+    validated = load_mapping_manifest(manifest_path)
+    sidecar = dump_mapping_manifest_cache(manifest_path, validated)
+    mapping_schema._MANIFEST_CACHE.clear()
+
+    def _fail_parse(path: Path):
+        raise AssertionError("sidecar should skip YAML parsing")
+
+    monkeypatch.setattr(mapping_schema, "_parse_mapping_manifest", _fail_parse)
+
+    from_sidecar = load_mapping_manifest(manifest_path)
+    assert sidecar.name == "sidecar.cache.json"
+    assert from_sidecar == validated
+    assert isinstance(from_sidecar.metadata[0], MetadataMapping)
+
+
+def test_mapping_manifest_reports_all_bad_canonical_fields(tmp_path: Path):
+    manifest_path = tmp_path / "bad.yaml"
+    manifest_path.write_text(
+        "source: bad\ncanonical:\n  media_items:\n    title: ' '\n    year: ''\n    description: overview\n",
+        encoding="utf-8",
+    )
+    (error,) = validate_mapping_paths([manifest_path])
+    assert "media_items.title" in error
+    assert "media_items.year" in error
+    assert "media_items.description" not in error
+
+
+def test_mapping_manifest_sidecar_from_other_schema_is_ignored(tmp_path: Path, monkeypatch):
+    manifest_path = tmp_path / "stale.yaml"
+    manifest_path.write_text("source: stale\ncanonical:\n  media_items:\n    title: title\n", encoding="utf-8")
+    dump_mapping_manifest_cache(manifest_path, load_mapping_manifest(manifest_path))
+    mapping_schema._MANIFEST_CACHE.clear()
+    monkeypatch.setattr(mapping_schema, "_schema_fingerprint", lambda: "changed-schema")
+    parsed: list[Path] = []
+    original_parse = mapping_schema._parse_mapping_manifest
+
+    def _tracking_parse(path: Path):
+        parsed.append(path)
+        return original_parse(path)
+
+    monkeypatch.setattr(mapping_schema, "_parse_mapping_manifest", _tracking_parse)
+
+    load_mapping_manifest(manifest_path)
+    assert parsed == [manifest_path.resolve()]
+
+
+def test_mapping_validation_never_trusts_sidecar(tmp_path: Path):
+    manifest_path = tmp_path / "trusted.yaml"
+    manifest_path.write_text("source: trusted\ncanonical:\n  media_items:\n    title: title\n", encoding="utf-8")
+    sidecar = dump_mapping_manifest_cache(manifest_path, load_mapping_manifest(manifest_path))
+    mtime_ns = manifest_path.stat().st_mtime_ns
+    manifest_path.write_text("source: trusted\ncanonical:\n  bogus_table:\n    title: title\n", encoding="utf-8")
+    os.utime(manifest_path, ns=(mtime_ns, mtime_ns))
+    mapping_schema._MANIFEST_CACHE.clear()
+
+    errors = validate_mapping_paths([manifest_path])
+    assert sidecar.exists()
+    assert len(errors) == 1 and "bogus_table" in errors[0]
@@ -8,7 +8,7 @@ import pytest
 from sqlalchemy import select
 
 from app.core.config import settings
-from app.ingestion.base import ConnectorResult
+from app.ingestion.base import BaseConnector, ConnectorResult
 from app.models.media import MediaSource, MediaType
 from app.services import media_service
 
@@ -38,3 +38,62 @@ async def test_upsert_media_truncates_payloads(session, monkeypatch):
     source = sources.scalar_one()
     assert source.raw_payload.get("truncated") is True
     assert source.raw_payload.get("reason") == "raw_ingestion_payload_too_large"
+
+
+@pytest.mark.asyncio
+async def test_get_media_by_id_loads_extension_rows(session):
+    connector_result = ConnectorResult(
+        media_type=MediaType.MOVIE,
+        title="Extension load",
+        description=None,
+        release_date=None,
+        cover_image_url=None,
+        canonical_url=None,
+        metadata={},
+        source_name="tmdb",
+        source_id=str(uuid.uuid4()),
+        raw_payload={},
+        extensions={"movie": {"runtime_minutes": 101, "directors": ["A. Director"]}},
+    )
+    media = await media_service.upsert_media(session, connector_result)
+    session.expunge_all()
+
+    loaded = await media_service.get_media_by_id(session, media.id)
+    assert loaded is not None
+    # Accessing an unloaded relationship on an async session would raise MissingGreenlet.
+    assert loaded.movie is not None
+    assert loaded.movie.runtime_minutes == 101
+    assert loaded.book is None
+
+
+@pytest.mark.asyncio
+async def test_base_search_full_fetches_each_unique_hit_and_drops_failures():
+    class _Connector(BaseConnector):
+        source_name = "stub"
+
+        async def search(self, query: str, limit: int = 3) -> list[str]:
+            return ["a", "a", "", "broken", "b"]
+
+        async def fetch(self, identifier: str) -> ConnectorResult:
+            if identifier == "broken":
+                raise RuntimeError("upstream 500")
+            return ConnectorResult(
+                media_type=MediaType.BOOK,
+                title=identifier,
+                description=None,
+                release_date=None,
+                cover_image_url=None,
+                canonical_url=None,
+                source_name=self.source_name,
+                source_id=identifier,
+            )
+
+    results = await _Connector().search_full("query", limit=5)
+    assert [result.source_id for result in results] == ["a", "b"]
+
+    class _AllBroken(_Connector):
+        async def search(self, query: str, limit: int = 3) -> list[str]:
+            return ["broken"]
+
+    with pytest.raises(RuntimeError):
+        await _AllBroken().search_full("query")
@@ -68,6 +68,13 @@ async def test_menu_share_tokens_and_public_draft(client, session):
     assert draft_payload["menu"]["id"] == menu_id
     assert draft_payload["share_token_id"] == token_payload["id"]
 
+    second_res = await client.get(f"/api/public/menus/draft/{token_payload['token']}")
+    assert second_res.status_code == 200
+    tokens_res = await client.get(f"/api/menus/{menu_id}/share-tokens")
+    token_entry = next(item for item in tokens_res.json() if item["id"] == token_payload["id"])
+    assert token_entry["access_count"] == 2
+    assert token_entry["last_accessed_at"] is not None
+
     revoke_res = await client.delete(f"/api/menus/{menu_id}/share-tokens/{token_payload['id']}")
     assert revoke_res.status_code == 204
 
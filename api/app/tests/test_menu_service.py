@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import pytest
 from fastapi import HTTPException, status
+from sqlalchemy import select
 
 from app.models.media import MediaItem, MediaType
+from app.models.menu import Menu
 from app.models.user import User
 from app.schema.menu import CourseCreate, CourseItemCreate, CourseItemUpdate, CourseUpdate, MenuCreate, MenuUpdate
 from app.services import menu_service
@@ -153,3 +155,39 @@ async def test_course_item_update_rejects_stale_timestamp(session):
         )
 
     assert exc.value.status_code == status.HTTP_409_CONFLICT
+
+
+@pytest.mark.asyncio
+async def test_menu_children_load_without_explicit_options(session):
+    user = User(email="menu-selectin@test", hashed_password="x")
+    session.add(user)
+    await session.flush()
+
+    menu = await menu_service.create_menu(
+        session,
+        user.id,
+        MenuCreate(title="Batch Loaded", description=None, is_public=False),
+    )
+    course = await menu_service.add_course(
+        session,
+        menu,
+        CourseCreate(title="Course One", description=None, intent=None, position=1),
+    )
+    media = MediaItem(media_type=MediaType.BOOK, title="Batch Book")
+    session.add(media)
+    await session.flush()
+    await menu_service.add_course_item(
+        session,
+        course,
+        CourseItemCreate(media_item_id=media.id, position=1, notes=None),
+    )
+    session.expunge_all()
+
+    result = await session.execute(select(Menu).where(Menu.id == menu.id))
+    loaded = result.scalar_one()
+
+    # Unloaded collections would raise MissingGreenlet on the async session.
+    assert [c.title for c in loaded.courses] == ["Course One"]
+    assert [item.media_item_id for item in loaded.courses[0].items] == [media.id]
+    assert loaded.pairings == []
+    assert loaded.share_tokens == []
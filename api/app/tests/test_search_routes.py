@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import uuid
 from datetime import datetime, timezone
 from typing import Iterable
@@ -579,6 +580,44 @@ async def test_search_sources_filter_limits_external_only(client, monkeypatch, s
     assert "google_books" not in payload["metadata"]["source_counts"]
 
 
+class SlowConnector(StubConnector):
+    async def search(self, query: str, limit: int = 3) -> list[str]:
+        await asyncio.sleep(1)
+        return await super().search(query, limit)
+
+
+@pytest.mark.asyncio
+async def test_search_skips_sources_over_the_time_budget(client, monkeypatch, session):
+    await _authenticate_for_external(client)
+    monkeypatch.setattr(settings, "external_search_source_timeout_seconds", 0.05)
+    book = ConnectorResult(
+        media_type=MediaType.BOOK,
+        title="Book Find 1",
+        description=None,
+        release_date=None,
+        cover_image_url=None,
+        canonical_url=None,
+        metadata={},
+        source_name="google_books",
+        source_id="book:abc",
+        raw_payload={},
+    )
+    connectors = {
+        "google_books": StubConnector("google_books", [book]),
+        "tmdb": SlowConnector("tmdb", []),
+    }
+    monkeypatch.setattr("app.services.media_service.get_connector", lambda source: connectors[source])
+
+    response = await client.get(
+        "/api/search",
+        params=[("q", "Fan"), ("sources", "google_books"), ("sources", "tmdb")],
+    )
+    assert response.status_code == 200
+    source_counts = response.json()["metadata"]["source_counts"]
+    assert source_counts["google_books"] == 1
+    assert source_counts.get("tmdb", 0) == 0
+
+
 @pytest.mark.asyncio
 async def test_search_types_filter_drops_incompatible_sources(client, monkeypatch, session):
     await _authenticate_for_external(client)
@@ -980,3 +1019,47 @@ async def test_search_external_quota_enforced(client, monkeypatch):
     assert rate_limited.status_code == 429
     detail = rate_limited.json().get("detail", "")
     assert "quota" in detail.lower()
+
+
+@pytest.mark.asyncio
+async def test_search_external_tracks_each_hit_fetch(client, monkeypatch):
+    from app.ingestion.observability import IngestionMonitor
+
+    await _authenticate_for_external(client)
+    monitor = IngestionMonitor()
+    monkeypatch.setattr("app.services.media_service.ingestion_monitor", monitor)
+
+    class _PartiallyFailingConnector(StubConnector):
+        async def fetch(self, identifier: str) -> ConnectorResult:
+            if identifier == "movie:2":
+                raise RuntimeError("upstream 500")
+            return await super().fetch(identifier)
+
+    results = [
+        ConnectorResult(
+            media_type=MediaType.MOVIE,
+            title=f"Tracked Hit {index}",
+            description=None,
+            release_date=None,
+            cover_image_url=None,
+            canonical_url=f"https://www.themoviedb.org/movie/{index}",
+            source_name="tmdb",
+            source_id=f"movie:{index}",
+        )
+        for index in (1, 2)
+    ]
+    connector = _PartiallyFailingConnector("tmdb", results)
+    monkeypatch.setattr("app.services.media_service.get_connector", lambda source: connector)
+
+    response = await client.get(
+        "/api/search",
+        params=[("q", "Tracked"), ("include_external", "true"), ("external_per_source", "2"), ("sources", "tmdb")],
+    )
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["metadata"]["source_counts"]["tmdb"] == 1
+    assert payload["metadata"]["source_metrics"]["tmdb"]["fetch_ms"] > 0
+    operations = (await monitor.snapshot())["tmdb"]["operations"]
+    assert operations["search"]["succeeded"] == 1
+    assert operations["fetch"]["succeeded"] == 1
+    assert operations["fetch"]["failed"] == 1
@@ -0,0 +1,87 @@
+"""Tests for JWT signing and password hashing helpers."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import timedelta
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519
+
+from app.core import security
+from app.core.config import settings
+
+
+def test_hmac_fast_path_tokens_decode_with_jwt_library():
+    token = security.create_token("user-123", timedelta(minutes=5), "access")
+
+    payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
+    assert payload["sub"] == "user-123"
+    assert payload["type"] == "access"
+    assert payload["exp"] - payload["iat"] == 300
+    assert security.decode_token(token) == payload
+    assert security.decode_token(token[:-2] + "xx") is None
+
+
+def test_password_hash_cost_probe_warns_outside_budget(caplog):
+    # The autouse plaintext context hashes far below the bcrypt budget.
+    with caplog.at_level(logging.WARNING, logger="app.core.security"):
+        elapsed = security.check_password_hash_cost()
+
+    assert elapsed < security.PASSWORD_HASH_BUDGET_SECONDS[0]
+    assert "BCRYPT_ROUNDS" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_password_hash_cost_probe_runs_off_the_event_loop(monkeypatch):
+    from app import main
+
+    probe_threads: list[threading.Thread] = []
+
+    def _record_thread() -> float:
+        probe_threads.append(threading.current_thread())
+        return 0.0
+
+    monkeypatch.setattr(main, "check_password_hash_cost", _record_thread)
+    await main._probe_password_hash_cost()
+    assert probe_threads and probe_threads[0] is not threading.main_thread()
+
+
+def test_eddsa_tokens_sign_with_private_key_and_verify_with_public(monkeypatch):
+    private_key = ed25519.Ed25519PrivateKey.generate()
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+    public_pem = (
+        private_key.public_key()
+        .public_bytes(serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo)
+        .decode()
+        .replace("\n", "\\n")
+    )
+    signing_key, verify_key = security._load_jwt_keys("EdDSA", b"unused", private_pem, public_pem)
+    monkeypatch.setattr(security, "_JWT_ALGORITHM", "EdDSA")
+    monkeypatch.setattr(security, "_JWT_SIGNING_KEY", signing_key)
+    monkeypatch.setattr(security, "_JWT_VERIFY_KEY", verify_key)
+    monkeypatch.setattr(security, "_HMAC_TEMPLATE", None)
+
+    token = security.create_token("user-ed", timedelta(minutes=1), "access")
+
+    assert jwt.get_unverified_header(token)["alg"] == "EdDSA"
+    assert security.decode_token(token)["sub"] == "user-ed"
+
+    monkeypatch.setattr(security, "_JWT_SIGNING_KEY", None)
+    with pytest.raises(RuntimeError):
+        security.create_token("user-ed", timedelta(minutes=1), "access")
+
+
+def test_hmac_claims_template_escapes_subject():
+    subject = 'quote"back\\slash-ü'
+
+    token = security.create_token(subject, timedelta(minutes=1), "refresh")
+
+    payload = security.decode_token(token)
+    assert payload["sub"] == subject
+    assert payload["type"] == "refresh"
@@ -52,6 +52,12 @@ async def test_taste_profile_builds_from_logs_tags_and_menus(client, session):
     )
     assert log_res.status_code == 201
 
+    favorite_res = await client.put(
+        f"/api/me/states/{movie.id}",
+        json={"status": "want_to_consume", "favorite": True},
+    )
+    assert favorite_res.status_code == 200
+
     profile_res = await client.get("/api/me/taste-profile")
     assert profile_res.status_code == 200
     profile = profile_res.json()["profile"]
@@ -59,6 +65,7 @@ async def test_taste_profile_builds_from_logs_tags_and_menus(client, session):
     assert profile["summary"]["menus"] == 1
     assert profile["summary"]["courses"] == 1
     assert profile["summary"]["items"] == 2
+    assert profile["summary"]["favorites"] == 1
     assert profile["media_type_counts"]["book"] == 1
     assert profile["media_type_counts"]["movie"] == 1
     assert profile["log_counts"]["finished"] == 1
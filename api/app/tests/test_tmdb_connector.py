@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+
+import httpx
 import pytest
 
 from app.core.config import settings
+from app.ingestion import tmdb
+from app.ingestion.cache import bypass_connector_cache
 from app.ingestion.http import ExternalAPIError
 from app.ingestion.tmdb import TMDBConnector
 
@@ -38,3 +43,176 @@ def test_tmdb_auth_errors_without_credentials(monkeypatch: pytest.MonkeyPatch) -
     connector = TMDBConnector()
     with pytest.raises(ExternalAPIError):
         connector._auth()
+
+
+@pytest.mark.asyncio
+async def test_tmdb_fetch_queries_movie_and_tv_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "connector_cache_ttl_seconds", 0)
+    started: list[str] = []
+    both_started = asyncio.Event()
+
+    async def fake_fetch(self, kind: str, tmdb_id: str):
+        started.append(kind)
+        if len(started) == 2:
+            both_started.set()
+        await both_started.wait()
+        if kind == "movie":
+            return None
+        return f"{kind}:{tmdb_id}"
+
+    monkeypatch.setattr(TMDBConnector, "_fetch", fake_fetch)
+
+    assert await TMDBConnector().fetch("1399") == "tv:1399"
+    assert sorted(started) == ["movie", "tv"]
+
+
+@pytest.mark.asyncio
+async def test_tmdb_fetch_prefers_movie_and_raises_when_both_missing(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "connector_cache_ttl_seconds", 0)
+    missing: set[str] = set()
+
+    async def fake_fetch(self, kind: str, tmdb_id: str):
+        if kind in missing:
+            return None
+        return f"{kind}:{tmdb_id}"
+
+    monkeypatch.setattr(TMDBConnector, "_fetch", fake_fetch)
+    connector = TMDBConnector()
+
+    assert await connector.fetch("603") == "movie:603"
+    missing.update({"movie", "tv"})
+    with pytest.raises(ExternalAPIError):
+        await connector.fetch("603")
+
+
+@pytest.mark.asyncio
+async def test_tmdb_detail_and_not_found_payloads_use_shared_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "connector_cache_ttl_seconds", 0)
+    monkeypatch.setattr(settings, "tmdb_api_auth_header", "token")
+    store: dict[str, tuple[object, int]] = {}
+    requested: list[str] = []
+
+    async def fake_get_json(key: str):
+        entry = store.get(key)
+        return entry[0] if entry else None
+
+    async def fake_set_json(key: str, value, ttl_seconds: int) -> None:
+        store[key] = (value, ttl_seconds)
+
+    async def fake_fetch_json(url: str, **kwargs):
+        requested.append(url)
+        if url.endswith("/tv/603"):
+            request = httpx.Request("GET", url)
+            raise httpx.HTTPStatusError("missing", request=request, response=httpx.Response(404, request=request))
+        return {"id": 603, "title": "The Matrix", "credits": {"crew": []}}
+
+    monkeypatch.setattr(tmdb.shared_state, "get_json", fake_get_json)
+    monkeypatch.setattr(tmdb.shared_state, "set_json", fake_set_json)
+    monkeypatch.setattr(tmdb, "fetch_json", fake_fetch_json)
+    connector = TMDBConnector()
+
+    for _ in range(2):
+        assert (await connector.fetch("movie:603")).title == "The Matrix"
+        with pytest.raises(ExternalAPIError):
+            await connector.fetch("tv:603")
+
+    assert len(requested) == 2
+    assert store["tmdb:detail:movie:603"][1] == tmdb.DETAIL_TTL_SECONDS
+    assert store["tmdb:detail:tv:603"][1] == tmdb.NOT_FOUND_TTL_SECONDS
+
+
+@pytest.mark.asyncio
+async def test_tmdb_search_merges_results_movie_first(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "connector_cache_ttl_seconds", 0)
+    monkeypatch.setattr(settings, "tmdb_api_auth_header", "token")
+
+    async def no_shared_state(*args, **kwargs):
+        return None
+
+    async def fake_fetch_json(url: str, **kwargs):
+        if url.endswith("/movie"):
+            await asyncio.sleep(0.01)
+            return {"results": [{"id": 1, "title": "Dune"}, {"id": 2, "title": " "}]}
+        return {"results": [{"id": 9, "name": "Dune: Prophecy"}, {"id": 10, "name": "Other"}]}
+
+    monkeypatch.setattr(tmdb.shared_state, "get_json", no_shared_state)
+    monkeypatch.setattr(tmdb.shared_state, "set_json", no_shared_state)
+    monkeypatch.setattr(tmdb, "fetch_json", fake_fetch_json)
+
+    assert await TMDBConnector().search("dune", limit=2) == ["movie:1", "tv:9"]
+    assert await TMDBConnector().search("dune", limit=4) == ["movie:1", "tv:9", "tv:10"]
+
+
+@pytest.mark.asyncio
+async def test_tmdb_search_skips_tv_when_movie_fills_small_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "connector_cache_ttl_seconds", 0)
+    requested: list[str] = []
+
+    async def no_shared_state(*args, **kwargs):
+        return None
+
+    async def fake_fetch_json(url: str, **kwargs):
+        requested.append(url.rsplit("/", 1)[-1])
+        return {"results": [{"id": n, "title": f"Dune {n}"} for n in range(5)]}
+
+    monkeypatch.setattr(tmdb.shared_state, "get_json", no_shared_state)
+    monkeypatch.setattr(tmdb.shared_state, "set_json", no_shared_state)
+    monkeypatch.setattr(tmdb, "fetch_json", fake_fetch_json)
+
+    assert await TMDBConnector(auth_token="token").search("dune", limit=3) == ["movie:0", "movie:1", "movie:2"]
+    assert requested == ["movie"]
+
+
+@pytest.mark.asyncio
+async def test_tmdb_search_is_cached_only_in_shared_store(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "connector_cache_ttl_seconds", 3600)
+    store: dict[str, tuple[object, int]] = {}
+    requested: list[str] = []
+
+    async def fake_get_json(key: str):
+        entry = store.get(key)
+        return entry[0] if entry else None
+
+    async def fake_set_json(key: str, value, ttl_seconds: int) -> None:
+        store[key] = (value, ttl_seconds)
+
+    async def fake_fetch_json(url: str, **kwargs):
+        requested.append(url)
+        return {"results": [{"id": 1, "title": "Dune"}]}
+
+    monkeypatch.setattr(tmdb.shared_state, "get_json", fake_get_json)
+    monkeypatch.setattr(tmdb.shared_state, "set_json", fake_set_json)
+    monkeypatch.setattr(tmdb, "fetch_json", fake_fetch_json)
+    connector = TMDBConnector(auth_token="token")
+
+    assert await connector.search("dune", limit=1) == ["movie:1"]
+    assert await connector.search("dune", limit=1) == ["movie:1"]
+    assert len(requested) == 1
+    assert next(iter(store.values()))[1] == tmdb.SEARCH_TTL_SECONDS
+
+    store.clear()
+    assert await connector.search("dune", limit=1) == ["movie:1"]
+    assert len(requested) == 2
+    with bypass_connector_cache():
+        await connector.search("dune", limit=1)
+    assert len(requested) == 3
+
+
+@pytest.mark.parametrize(
+    ("identifier", "expected"),
+    [
+        ("https://www.themoviedb.org/movie/603", "movie:603"),
+        ("https://www.themoviedb.org/tv/1399/season/1?language=en", "tv:1399"),
+        ("https://www.themoviedb.org/person/287", "https://www.themoviedb.org/person/287"),
+        (" tv:1399 ", "tv:1399"),
+    ],
+)
+def test_tmdb_parse_identifier(identifier: str, expected: str) -> None:
+    assert TMDBConnector(auth_token="token").parse_identifier(identifier) == expected
+
+
+@pytest.mark.asyncio
+async def test_tmdb_fetch_rejects_unknown_type_prefix(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "connector_cache_ttl_seconds", 0)
+    with pytest.raises(ExternalAPIError):
+        await TMDBConnector(auth_token="token").fetch("person:287")
@@ -0,0 +1,25 @@
+"""orjson-backed JSON helpers shared across services.
+
+Implementation notes:
+- `dumps` returns compact UTF-8 bytes (what size checks, encryption and Redis want anyway);
+  non-string dict keys are stringified and unknown types fall back to `str()`.
+- datetimes, UUIDs and dataclasses are encoded natively by orjson (ISO 8601 / canonical forms).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def dumps(value: Any) -> bytes:
+    """Serialize a value to JSON bytes."""
+    return orjson.dumps(value, default=str, option=_DUMPS_OPTIONS)
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Parse JSON from bytes or text."""
+    return orjson.loads(data)
@@ -0,0 +1,10 @@
+"""UUID parsing helpers for job entrypoints."""
+
+from __future__ import annotations
+
+import uuid
+
+
+def parse_uuid(value: str | None) -> uuid.UUID | None:
+    """Parse an optional UUID string (None/empty -> None); required ids use `uuid.UUID` directly."""
+    return uuid.UUID(value) if value else None
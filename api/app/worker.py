@@ -8,6 +8,7 @@ from redis import Redis
 from rq import Connection, Queue, Worker
 
 from app.core.config import settings
+from app.services.job_serialization import JsonJob
 
 WORKER_LOG_FORMAT = "%(asctime)s %(name)s [%(levelname)s] %(message)s"
 
@@ -19,7 +20,7 @@ def _configure_logging() -> None:
 
 def _queue_objects(connection: Redis) -> list[Queue]:
     """Build queue objects based on configured queue names."""
-    return [Queue(name, connection=connection) for name in settings.worker_queue_names]
+    return [Queue(name, connection=connection, job_class=JsonJob) for name in settings.worker_queue_names]
 
 
 def main() -> None:
@@ -33,7 +34,7 @@ def main() -> None:
         return
     logger.info("Starting worker for queues: %s", ", ".join(settings.worker_queue_names))
     with Connection(redis_connection):
-        worker = Worker(queues, connection=redis_connection, name="tastebuds-worker")
+        worker = Worker(queues, connection=redis_connection, name="tastebuds-worker", job_class=JsonJob)
         try:
             worker.work(with_scheduler=True)
         except KeyboardInterrupt:
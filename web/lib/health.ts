@@ -45,8 +45,8 @@ export type HealthResponse = {
 };
 
 export async function fetchHealth() {
-  // Use the public health endpoint to drive the UI status widgets.
-  return apiFetch<HealthResponse>('/health', {}, { isServer: false });
+  // Use the readiness endpoint (it carries ingestion telemetry) to drive the UI status widgets.
+  return apiFetch<HealthResponse>('/health/ready', {}, { isServer: false });
 }
 
 export function normalizeConnectorHealth(payload: HealthResponse): ConnectorHealth[] {